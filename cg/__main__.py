@@ -0,0 +1,6 @@
+"""Run the cg command line interface with 'python -m cg'."""
+
+from cg.cli.base import base
+
+if __name__ == "__main__":
+    base()
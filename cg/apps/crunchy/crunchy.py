@@ -16,7 +16,8 @@ from cg.apps.crunchy.sbatch import (
     SPRING_TO_FASTQ_COMMANDS,
     SPRING_TO_FASTQ_ERROR,
 )
-from cg.apps.slurm.slurm_api import SlurmAPI
+from cg.apps.slurm.slurm_api import SlurmAPI, get_array_header
+from cg.constants.compression import MAX_ARRAY_TASKS
 from cg.constants.priority import SlurmQos
 from cg.models.compression_data import CompressionData
 from cg.models.slurm.sbatch import Sbatch
@@ -58,6 +59,10 @@ class CrunchyAPI:
             return
         pending_path.touch(exist_ok=False)
 
+    @property
+    def conda_run(self) -> str:
+        return f"{self.conda_binary} run --no-capture-output --name {self.crunchy_env}"
+
     # These are the compression/decompression methods
     def fastq_to_spring(
         self, compression_obj: CompressionData, memory: int, minutes: int, sample_id: str = ""
@@ -74,7 +79,7 @@ class CrunchyAPI:
         # Generate the commands
         sbatch_parameters: Sbatch
         commands = FASTQ_TO_SPRING_COMMANDS.format(
-            conda_run=f"{self.conda_binary} run --no-capture-output --name {self.crunchy_env}",
+            conda_run=self.conda_run,
             fastq_first=compression_obj.fastq_first,
             fastq_second=compression_obj.fastq_second,
             pending_path=compression_obj.pending_path,
@@ -130,7 +135,7 @@ class CrunchyAPI:
             pending_path=compression_obj.pending_path,
         )
         commands = SPRING_TO_FASTQ_COMMANDS.format(
-            conda_run=f"{self.conda_binary} run --no-capture-output --name {self.crunchy_env}",
+            conda_run=self.conda_run,
             tmp_dir=files.get_tmp_dir(base=self.tmp_dir_base),
             fastq_first=compression_obj.fastq_first,
             fastq_second=compression_obj.fastq_second,
@@ -165,3 +170,112 @@ class CrunchyAPI:
         )
         LOG.info(f"Spring decompression running as job {sbatch_number}")
         return sbatch_number
+
+    def fastq_to_spring_array(
+        self, compression_objects: list[CompressionData], memory: int, minutes: int
+    ) -> dict[str, str]:
+        """Compress FASTQ files of several runs into SPRING by submitting SLURM job arrays.
+
+        Return the job id of the array task compressing each run, keyed by run name.
+        """
+        variables: list[str] = ["fastq_first", "fastq_second", "spring_path", "pending_path"]
+        task_values: dict[str, str] = _get_shell_variables(variables)
+        error_function: str = FASTQ_TO_SPRING_ERROR.format(
+            spring_path=task_values["spring_path"], pending_path=task_values["pending_path"]
+        )
+        commands: str = FASTQ_TO_SPRING_COMMANDS.format(
+            conda_run=self.conda_run,
+            threads=self.slurm_cpus_per_task,
+            tmp_dir=files.get_tmp_dir(base=self.tmp_dir_base),
+            **task_values,
+        )
+        manifest_rows: list[list[str]] = [
+            [
+                compression_obj.fastq_first.as_posix(),
+                compression_obj.fastq_second.as_posix(),
+                compression_obj.spring_path.as_posix(),
+                compression_obj.pending_path.as_posix(),
+            ]
+            for compression_obj in compression_objects
+        ]
+        job_ids: dict[str, str] = self._submit_array(
+            compression_objects=compression_objects,
+            manifest_rows=manifest_rows,
+            variables=variables,
+            commands=commands,
+            error_function=error_function,
+            job_type="fastq_to_spring",
+            memory=memory,
+            minutes=minutes,
+            quality_of_service=SlurmQos.MAINTENANCE,
+        )
+        LOG.info(f"Fastq compression of {len(job_ids)} runs submitted as job arrays")
+        return job_ids
+
+    def _submit_array(
+        self,
+        compression_objects: list[CompressionData],
+        manifest_rows: list[list[str]],
+        variables: list[str],
+        commands: str,
+        error_function: str,
+        job_type: str,
+        memory: int,
+        minutes: int,
+        quality_of_service: SlurmQos,
+    ) -> dict[str, str]:
+        """Submit one job array per MAX_ARRAY_TASKS runs and return the task job id per run."""
+        job_ids: dict[str, str] = {}
+        for start in range(0, len(compression_objects), MAX_ARRAY_TASKS):
+            array_compression_objects: list[CompressionData] = compression_objects[
+                start : start + MAX_ARRAY_TASKS
+            ]
+            array_manifest_rows: list[list[str]] = manifest_rows[start : start + MAX_ARRAY_TASKS]
+            for compression_obj in array_compression_objects:
+                CrunchyAPI.create_pending_file(
+                    pending_path=compression_obj.pending_path, dry_run=self.dry_run
+                )
+            # The batch files and logs are kept next to the first run of the array
+            log_dir: Path = files.get_log_dir(array_compression_objects[0].spring_path)
+            job_name: str = "_".join(
+                [
+                    array_compression_objects[0].run_name,
+                    f"array{len(array_compression_objects)}",
+                    job_type,
+                ]
+            )
+            manifest_path: Path = files.get_array_manifest_path(log_dir=log_dir, job_name=job_name)
+            sbatch_parameters: Sbatch = Sbatch(
+                account=self.slurm_account,
+                commands=self.slurm_api.generate_array_task_commands(
+                    commands=commands, manifest_path=manifest_path, variables=variables
+                ),
+                email=self.slurm_mail_user,
+                error=error_function,
+                hours=minutes // 60,
+                minutes=f"{minutes % 60:02d}",
+                job_name=job_name,
+                log_dir=log_dir.as_posix(),
+                memory=memory,
+                number_tasks=self.slurm_number_tasks,
+                quality_of_service=quality_of_service,
+                partition=f"--partition={self.slurm_partition}",
+                chdir=f"--chdir={self.tmp_dir_base}",
+                cpus_per_task=f"--cpus-per-task={self.slurm_cpus_per_task}",
+                array=get_array_header(len(array_compression_objects)),
+            )
+            task_job_ids: list[str] = self.slurm_api.submit_sbatch_array(
+                sbatch_content=self.slurm_api.generate_sbatch_content(sbatch_parameters),
+                sbatch_path=files.get_array_sbatch_path(log_dir=log_dir, job_name=job_name),
+                manifest_rows=array_manifest_rows,
+                manifest_path=manifest_path,
+            )
+            for compression_obj, task_job_id in zip(array_compression_objects, task_job_ids):
+                LOG.info(f"{job_type} of {compression_obj.run_name} running as job {task_job_id}")
+                job_ids[compression_obj.run_name] = task_job_id
+        return job_ids
+
+
+def _get_shell_variables(variables: list[str]) -> dict[str, str]:
+    """Return shell variable references to use as template values in array task commands."""
+    return {variable: f"${{{variable}}}" for variable in variables}
@@ -32,6 +32,16 @@ def get_spring_to_fastq_sbatch_path(log_dir: Path, run_name: str = None) -> Path
     return Path(log_dir, "_".join([run_name, "decompress_spring.sh"]))
 
 
+def get_array_sbatch_path(log_dir: Path, job_name: str) -> Path:
+    """Return the path to where a job array sbatch should be printed"""
+    return Path(log_dir, f"{job_name}.sh")
+
+
+def get_array_manifest_path(log_dir: Path, job_name: str) -> Path:
+    """Return the path to where the manifest of a job array should be printed"""
+    return Path(log_dir, f"{job_name}_manifest.tsv")
+
+
 def get_tmp_dir(base: str) -> str:
     """Return a node-local temp dir path, unique per SLURM job.
 
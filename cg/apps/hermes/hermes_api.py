@@ -1,8 +1,13 @@
+import io
 import logging
+from contextlib import redirect_stdout
 from datetime import datetime
+from importlib import metadata, util
 from pathlib import Path
+from subprocess import CalledProcessError
 
 from cg.apps.housekeeper import models as hk_models
+from cg.constants.process import EXIT_FAIL, EXIT_SUCCESS
 from cg.io.json import read_json_stream, write_json_stream
 from cg.utils.commands import Process
 
@@ -10,6 +15,9 @@ from .models import CGDeliverables
 
 LOG = logging.getLogger(__name__)
 
+HERMES_PACKAGE: str = "cg_hermes"
+HERMES_SCRIPT: str = "hermes"
+
 
 class HermesApi:
     """Class to communicate with hermes"""
@@ -20,21 +28,46 @@ class HermesApi:
         )
         self.container_path: str = config["hermes"]["container_path"]
         self.container_mount_volume = config["hermes"]["container_mount_volume"]
+        self.in_process: bool = config["hermes"].get("in_process", False)
+        self._hermes_command = None
 
-    def convert_deliverables(
-        self,
+    @staticmethod
+    def is_in_process_available() -> bool:
+        """Return True if the Hermes package is installed in the running environment."""
+        return util.find_spec(HERMES_PACKAGE) is not None
+
+    @property
+    def use_in_process(self) -> bool:
+        """Return True if conversions should run in-process instead of in the Hermes container.
+        The Hermes command is loaded from its entry point the first time."""
+        if not self.in_process:
+            return False
+        if self._hermes_command:
+            return True
+        if not self.is_in_process_available():
+            LOG.warning(f"{HERMES_PACKAGE} is not installed, converting with the Hermes container")
+            self.in_process = False
+            return False
+        entry_points = list(metadata.entry_points(group="console_scripts", name=HERMES_SCRIPT))
+        if len(entry_points) != 1:
+            LOG.warning(
+                f"Found {len(entry_points)} {HERMES_SCRIPT} entry points, converting with the "
+                "Hermes container"
+            )
+            self.in_process = False
+            return False
+        self._hermes_command = entry_points[0].load()
+        return True
+
+    @staticmethod
+    def get_convert_deliverables_arguments(
         deliverables_file: Path,
         workflow: str,
         analysis_type: str | None = None,
         force: bool = False,
-    ) -> CGDeliverables:
-        """Convert deliverables file in raw workflow format to CG format with Hermes."""
-        LOG.info("Converting workflow deliverables to CG deliverables")
-        convert_command = [
-            "run",
-            "--bind",
-            self.container_mount_volume,
-            self.container_path,
+    ) -> list[str]:
+        """Return the Hermes arguments for converting a deliverables file."""
+        arguments: list[str] = [
             "convert",
             "deliverables",
             "--workflow",
@@ -42,11 +75,64 @@ class HermesApi:
             str(deliverables_file),
         ]
         if analysis_type:
-            convert_command.extend(["--analysis-type", analysis_type])
+            arguments.extend(["--analysis-type", analysis_type])
         if force:
-            convert_command.append("--force")
+            arguments.append("--force")
+        return arguments
+
+    def run_in_container(self, arguments: list[str]) -> str:
+        """Run Hermes in its container and return the standard output."""
+        convert_command = [
+            "run",
+            "--bind",
+            self.container_mount_volume,
+            self.container_path,
+        ]
+        convert_command.extend(arguments)
         self.process.run_command(convert_command)
-        json_stream: str = self.process.stdout
+        return self.process.stdout
+
+    def run_in_process(self, arguments: list[str]) -> str:
+        """Run the Hermes command line interface in the running process and return the standard
+        output. The command loaded by use_in_process is reused for all conversions.
+        Raises:
+            CalledProcessError if Hermes fails.
+        """
+        stdout = io.StringIO()
+        try:
+            with redirect_stdout(stdout):
+                exit_code = self._hermes_command.main(
+                    args=arguments, prog_name=HERMES_SCRIPT, standalone_mode=False
+                )
+        except (Exception, SystemExit) as error:
+            LOG.error(f"Hermes failed: {error}")
+            raise CalledProcessError(
+                returncode=EXIT_FAIL, cmd=[HERMES_SCRIPT, *arguments], stderr=str(error)
+            ) from error
+        if isinstance(exit_code, int) and exit_code != EXIT_SUCCESS:
+            raise CalledProcessError(returncode=exit_code, cmd=[HERMES_SCRIPT, *arguments])
+        return stdout.getvalue()
+
+    def convert_deliverables(
+        self,
+        deliverables_file: Path,
+        workflow: str,
+        analysis_type: str | None = None,
+        force: bool = False,
+    ) -> CGDeliverables:
+        """Convert deliverables file in raw workflow format to CG format with Hermes."""
+        LOG.info("Converting workflow deliverables to CG deliverables")
+        arguments: list[str] = self.get_convert_deliverables_arguments(
+            deliverables_file=deliverables_file,
+            workflow=workflow,
+            analysis_type=analysis_type,
+            force=force,
+        )
+        json_stream: str = (
+            self.run_in_process(arguments)
+            if self.use_in_process
+            else self.run_in_container(arguments)
+        )
         if force:
             data: dict[str, any] = read_json_stream(json_stream)
             for file_tag in data["files"]:
@@ -4,13 +4,14 @@ import logging
 import os
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 from housekeeper.include import checksum as hk_checksum
 from housekeeper.include import include_version
 from housekeeper.store.database import create_all_tables, drop_all_tables, initialize_database
 from housekeeper.store.models import Archive, Bundle, File, Tag, Version
 from housekeeper.store.store import Store
-from sqlalchemy.orm import Query
+from sqlalchemy.orm import Query, selectinload
 
 from cg.constants import SequencingFileTag
 from cg.exc import (
@@ -18,9 +19,12 @@ from cg.exc import (
     HousekeeperBundleVersionMissingError,
     HousekeeperFileMissingError,
 )
+from cg.utils.utils import get_chunks
 
 LOG = logging.getLogger(__name__)
 
+VERSION_ID_CHUNK_SIZE: int = 500
+
 
 class HousekeeperAPI:
     """API to decouple cg code from Housekeeper."""
@@ -171,6 +175,21 @@ class HousekeeperAPI:
         """
         return self._store.get_files(bundle_name=bundle, tag_names=tags, version_id=version)
 
+    def get_files_by_version_ids(
+        self, version_ids: list[int], chunk_size: int = VERSION_ID_CHUNK_SIZE
+    ) -> Iterator[list[File]]:
+        """Yield the files of the given versions, one chunk of versions at a time. The tags of the
+        files are loaded in the same round trip."""
+        unique_version_ids: list[int] = list(dict.fromkeys(version_ids))
+        for version_id_chunk in get_chunks(unique_version_ids, chunk_size):
+            yield (
+                self._store._get_query(table=File)
+                .options(selectinload(File.tags))
+                .filter(File.version_id.in_(version_id_chunk))
+                .order_by(File.version_id, File.id)
+                .all()
+            )
+
     def get_latest_file(
         self, bundle: str, tags: list | None = None, version: int | None = None
     ) -> File | None:
@@ -349,11 +368,14 @@ class HousekeeperAPI:
         drop_all_tables()
 
     def add_and_include_file_to_latest_version(
-        self, bundle_name: str, file: Path, tags: list
+        self, bundle_name: str, file: Path, tags: list, checksum: str | None = None
     ) -> None:
-        """Adds and includes a file in the latest version of a bundle."""
+        """Adds and includes a file in the latest version of a bundle, storing the checksum if
+        it has already been calculated."""
         version: Version = self.get_or_create_version(bundle_name)
         hk_file: File = self.add_file(version_obj=version, tags=tags, path=str(file.absolute()))
+        if checksum:
+            hk_file.checksum = checksum
         self.include_file(version_obj=version, file_obj=hk_file)
         self.commit()
 
@@ -0,0 +1,145 @@
+"""Cache of gene panel and managed variant exports from Scout."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from cg.constants.constants import FileExtensions, FileFormat
+from cg.constants.scout import (
+    SCOUT_EXPORT_CACHE_TTL_SECONDS,
+    SCOUT_GENE_PANEL_HEADER,
+    ScoutExportKind,
+)
+from cg.io.controller import ReadFile, WriteFile
+
+LOG = logging.getLogger(__name__)
+
+
+class ScoutExportCacheEntry(BaseModel):
+    """Exported lines from Scout and the parameters they were exported with."""
+
+    kind: ScoutExportKind
+    genome_build: str | None
+    panels: list[str]
+    panel_versions: dict[str, str]
+    created_at: float
+    lines: list[str]
+
+
+def get_panel_versions(lines: list[str]) -> dict[str, str]:
+    """Return the version of each panel listed in the header of a gene panel export."""
+    panel_versions: dict[str, str] = {}
+    for line in lines:
+        if not line.startswith("#"):
+            break
+        if not line.startswith(SCOUT_GENE_PANEL_HEADER):
+            continue
+        panel_id, *attributes = line.removeprefix(SCOUT_GENE_PANEL_HEADER).split(",")
+        for attribute in attributes:
+            key, _, value = attribute.partition("=")
+            if key == "version":
+                panel_versions[panel_id] = value
+    return panel_versions
+
+
+class ScoutExportCache:
+    """Cache Scout exports keyed by a hash of the Scout instance, genome build and panels.
+
+    Exports are kept in memory for the lifetime of the cache. When a directory is given, they are
+    also stored there as JSON so that other processes can reuse them until the TTL has passed.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        ttl_seconds: int = SCOUT_EXPORT_CACHE_TTL_SECONDS,
+        instance: str = "",
+    ):
+        self.directory: Path | None = directory
+        self.ttl_seconds: int = ttl_seconds
+        self.instance: str = instance
+        self._entries: dict[str, ScoutExportCacheEntry] = {}
+
+    def get_key(self, kind: ScoutExportKind, genome_build: str | None, panels: list[str]) -> str:
+        """Return the cache key for an export, which does not depend on the order of the panels."""
+        key_content: str = json.dumps(
+            [self.instance, kind, genome_build, sorted(set(panels))], separators=(",", ":")
+        )
+        return hashlib.sha256(key_content.encode()).hexdigest()
+
+    def _is_expired(self, entry: ScoutExportCacheEntry) -> bool:
+        return time.time() - entry.created_at > self.ttl_seconds
+
+    def _get_entry_path(self, key: str) -> Path:
+        return Path(self.directory, f"{key}{FileExtensions.JSON}")
+
+    def _read_entry(self, key: str) -> ScoutExportCacheEntry | None:
+        entry_path: Path = self._get_entry_path(key)
+        if not entry_path.exists():
+            return None
+        try:
+            return ScoutExportCacheEntry.model_validate(
+                ReadFile.get_content_from_file(file_format=FileFormat.JSON, file_path=entry_path)
+            )
+        except (OSError, ValueError, ValidationError) as error:
+            LOG.debug(f"Could not read Scout export cache entry {entry_path}: {error}")
+            return None
+
+    def _write_entry(self, key: str, entry: ScoutExportCacheEntry) -> None:
+        """Write the entry to a temporary file and move it in place, so that concurrent readers
+        never see a partially written entry."""
+        entry_path: Path = self._get_entry_path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp")
+            os.close(file_descriptor)
+            WriteFile.write_file_from_content(
+                content=entry.model_dump(mode="json"),
+                file_format=FileFormat.JSON,
+                file_path=Path(temporary_path),
+            )
+            os.replace(temporary_path, entry_path)
+        except OSError as error:
+            LOG.debug(f"Could not write Scout export cache entry {entry_path}: {error}")
+
+    def get(
+        self, kind: ScoutExportKind, genome_build: str | None, panels: list[str]
+    ) -> list[str] | None:
+        """Return the cached export lines, or None if there is no valid entry."""
+        key: str = self.get_key(kind=kind, genome_build=genome_build, panels=panels)
+        entry: ScoutExportCacheEntry | None = self._entries.get(key)
+        if not entry and self.directory:
+            entry = self._read_entry(key)
+        if not entry or self._is_expired(entry):
+            self._entries.pop(key, None)
+            return None
+        self._entries[key] = entry
+        LOG.debug(f"Using cached Scout {kind} export {key}")
+        return list(entry.lines)
+
+    def store(
+        self, kind: ScoutExportKind, genome_build: str | None, panels: list[str], lines: list[str]
+    ) -> None:
+        """Cache the lines of an export."""
+        key: str = self.get_key(kind=kind, genome_build=genome_build, panels=panels)
+        entry = ScoutExportCacheEntry(
+            kind=kind,
+            genome_build=genome_build,
+            panels=sorted(set(panels)),
+            panel_versions=get_panel_versions(lines),
+            created_at=time.time(),
+            lines=lines,
+        )
+        self._entries[key] = entry
+        if self.directory:
+            self._write_entry(key=key, entry=entry)
+
+    def clear(self) -> None:
+        """Remove all exports from the in-process cache."""
+        self._entries.clear()
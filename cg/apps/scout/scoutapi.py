@@ -4,15 +4,16 @@ import logging
 from pathlib import Path
 from subprocess import CalledProcessError
 
+from cg.apps.scout.export_cache import ScoutExportCache
 from cg.apps.scout.scout_export import ScoutExportCase, Variant
 from cg.constants.constants import FileFormat
 from cg.constants.gene_panel import GENOME_BUILD_37
-from cg.constants.scout import ScoutCustomCaseReportTags
+from cg.constants.scout import ScoutCustomCaseReportTags, ScoutExportKind
 from cg.exc import ScoutExportError, ScoutUploadError
 from cg.io.controller import ReadFile, ReadStream
 from cg.models.scout.scout_load_config import ScoutLoadConfig
 from cg.services.slurm_upload_service.slurm_upload_service import SlurmUploadService
-from cg.utils.commands import Process
+from cg.utils.commands import Process, ProcessCall, run_processes
 
 LOG = logging.getLogger(__name__)
 
@@ -20,10 +21,18 @@ LOG = logging.getLogger(__name__)
 class ScoutAPI:
     """Interface to Scout."""
 
-    def __init__(self, scout_config, slurm_upload_service: SlurmUploadService):
+    def __init__(
+        self,
+        scout_config,
+        slurm_upload_service: SlurmUploadService,
+        export_cache: ScoutExportCache | None = None,
+    ):
         binary_path = scout_config.binary_path
         config_path = scout_config.config_path
         self.process = Process(binary=binary_path, config=config_path)
+        self.export_cache: ScoutExportCache = export_cache or ScoutExportCache(
+            instance=f"{binary_path}:{config_path}"
+        )
         self.slurm_upload_service = slurm_upload_service
         self.scout_base_command = f"{binary_path} --config {config_path}"
 
@@ -49,13 +58,27 @@ class ScoutAPI:
         self.process.run_command(load_command)
         LOG.debug("Case loaded successfully to Scout")
 
+    def _export(self, parameters: list[str], dry_run: bool = False) -> tuple[str, str]:
+        """Run a scout export command and return its stdout and stderr. The output is not stored
+        on the shared process, so exports can run from several threads at the same time."""
+        (result,) = run_processes(
+            [ProcessCall(process=self.process, parameters=parameters)], dry_run=dry_run
+        )
+        return result.stdout, result.stderr
+
     def export_panels(
         self, panels: list[str], build: str = GENOME_BUILD_37, dry_run: bool = False
     ) -> list[str]:
         """Pass through to export of a list of gene panels.
 
-        Return list of lines in bed format
+        Return list of lines in bed format. Exports are cached per genome build and set of panels.
         """
+        if not dry_run and (
+            cached_lines := self.export_cache.get(
+                kind=ScoutExportKind.GENE_PANEL, genome_build=build, panels=panels
+            )
+        ):
+            return cached_lines
         export_panels_command = ["export", "panel", "--bed"]
         export_panels_command.extend(iter(panels))
 
@@ -63,29 +86,42 @@ class ScoutAPI:
             export_panels_command.extend(["--build", build])
 
         try:
-            self.process.run_command(export_panels_command, dry_run=dry_run)
-            if not self.process.stdout:
-                LOG.error(self.process.stderr)
+            stdout, stderr = self._export(export_panels_command, dry_run=dry_run)
+            if not stdout:
+                LOG.error(stderr)
                 raise ScoutExportError("Empty export output from scout")
         except CalledProcessError:
             LOG.info("Could not find panels")
             return []
 
-        return list(self.process.stdout_lines())
+        lines: list[str] = stdout.split("\n")
+        if not dry_run:
+            self.export_cache.store(
+                kind=ScoutExportKind.GENE_PANEL, genome_build=build, panels=panels, lines=lines
+            )
+        return lines
 
     def export_managed_variants(self, genome_build: str = GENOME_BUILD_37) -> list[str]:
-        """Export a list of managed variants."""
+        """Export a list of managed variants. Exports are cached per genome build."""
+        if cached_lines := self.export_cache.get(
+            kind=ScoutExportKind.MANAGED_VARIANTS, genome_build=genome_build, panels=[]
+        ):
+            return cached_lines
         export_command = ["export", "managed"]
         if genome_build:
             export_command.extend(["--build", genome_build])
         try:
-            self.process.run_command(export_command)
-            if not self.process.stdout:
+            stdout, _ = self._export(export_command)
+            if not stdout:
                 return []
         except CalledProcessError:
             LOG.info("Could not export managed variants")
             return []
-        return list(self.process.stdout_lines())
+        lines: list[str] = stdout.split("\n")
+        self.export_cache.store(
+            kind=ScoutExportKind.MANAGED_VARIANTS, genome_build=genome_build, panels=[], lines=lines
+        )
+        return lines
 
     def get_genes(self, panel_id: str, build: str = None) -> list[dict]:
         """Return panel genes."""
@@ -94,15 +130,15 @@ class ScoutAPI:
             export_panel_command.extend(["--build", build])
 
         try:
-            self.process.run_command(export_panel_command)
-            if not self.process.stdout:
+            stdout, _ = self._export(export_panel_command)
+            if not stdout:
                 return []
         except CalledProcessError:
             LOG.info(f"Could not find panel {panel_id}")
             return []
 
         panel_genes = []
-        for gene_line in self.process.stdout_lines():
+        for gene_line in stdout.split("\n"):
             if gene_line.startswith("#"):
                 continue
             gene_info = gene_line.strip().split("\t")
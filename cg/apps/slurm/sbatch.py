@@ -3,8 +3,8 @@ SBATCH_HEADER_TEMPLATE = """#! /bin/bash {use_login_shell}
 #SBATCH --account={account}
 #SBATCH --ntasks={number_tasks}
 #SBATCH --mem={memory}G
-#SBATCH --error={log_dir}/{job_name}.stderr
-#SBATCH --output={log_dir}/{job_name}.stdout
+#SBATCH --error={log_dir}/{log_name}.stderr
+#SBATCH --output={log_dir}/{log_name}.stdout
 #SBATCH --mail-type=FAIL
 #SBATCH --mail-user={email}
 #SBATCH --time={hours}:{minutes}:00
@@ -49,6 +49,12 @@ log() {{
 log "Running on: $(hostname)"
 """
 
+# Reads the manifest line of the current array task into shell variables
+ARRAY_TASK_MANIFEST_TEMPLATE = """
+IFS=$'\\t' read -r {variables} <<< "$(sed -n "$((SLURM_ARRAY_TASK_ID + 1))p" {manifest_path})"
+log "Running array task ${{SLURM_ARRAY_TASK_ID}} of job ${{SLURM_ARRAY_JOB_ID}}"
+"""
+
 # Double {{ to escape this character
 SBATCH_BODY_TEMPLATE = """
 error() {{
@@ -5,10 +5,12 @@ from pathlib import Path
 from typing import Any
 
 from cg.apps.slurm.sbatch import (
+    ARRAY_TASK_MANIFEST_TEMPLATE,
     DRAGEN_SBATCH_HEADER_TEMPLATE,
     SBATCH_BODY_TEMPLATE,
     SBATCH_HEADER_TEMPLATE,
 )
+from cg.io.csv import write_csv_stream
 from cg.models.slurm.sbatch import Sbatch, SbatchDragen
 from cg.utils import Process
 
@@ -54,10 +56,18 @@ class SlurmAPI:
                 sbatch_parameters.partition,
                 sbatch_parameters.chdir,
                 sbatch_parameters.cpus_per_task,
+                sbatch_parameters.array,
             ]
         )
-
-        return SBATCH_HEADER_TEMPLATE.format(**header_params, optional_headers=optional_headers)
+        # Array tasks share the job name, so each task gets its own log files
+        log_name: str = (
+            f"{sbatch_parameters.job_name}_%A_%a"
+            if sbatch_parameters.array
+            else sbatch_parameters.job_name
+        )
+        return SBATCH_HEADER_TEMPLATE.format(
+            **header_params, log_name=log_name, optional_headers=optional_headers
+        )
 
     @staticmethod
     def generate_dragen_sbatch_header(sbatch_parameters: Sbatch) -> str:
@@ -105,6 +115,63 @@ class SlurmAPI:
         )
         return self.submit_sbatch_job(sbatch_path=sbatch_path)
 
+    @staticmethod
+    def generate_array_task_commands(
+        commands: str, manifest_path: Path, variables: list[str]
+    ) -> str:
+        """Prepend reading the manifest line of the current array task into shell variables.
+
+        Line N of the manifest holds the values for array task N - 1, separated by tabs and in the
+        same order as the variables.
+        """
+        manifest_commands: str = ARRAY_TASK_MANIFEST_TEMPLATE.format(
+            variables=" ".join(variables), manifest_path=manifest_path
+        )
+        return "\n".join([manifest_commands, commands])
+
+    @staticmethod
+    def write_manifest_file(
+        manifest_rows: list[list[str]], manifest_path: Path, dry_run: bool
+    ) -> None:
+        manifest_content: str = write_csv_stream(content=manifest_rows, delimiter="\t")
+        if dry_run:
+            LOG.debug(f"Write manifest content to path {manifest_path}: \n{manifest_content}")
+            return
+        LOG.debug(f"Write manifest with {len(manifest_rows)} tasks to {manifest_path}")
+        with open(manifest_path, mode="w+t") as manifest_file:
+            manifest_file.write(manifest_content)
+
+    def submit_sbatch_array(
+        self,
+        sbatch_content: str,
+        sbatch_path: Path,
+        manifest_rows: list[list[str]],
+        manifest_path: Path,
+    ) -> list[str]:
+        """Submit a job array to slurm with one task per manifest row.
+
+        Return the slurm job id of each array task, in manifest order.
+        """
+        SlurmAPI.write_manifest_file(
+            manifest_rows=manifest_rows, manifest_path=manifest_path, dry_run=self.dry_run
+        )
+        array_job_number: int = self.submit_sbatch(
+            sbatch_content=sbatch_content, sbatch_path=sbatch_path
+        )
+        return get_array_task_job_ids(
+            array_job_number=array_job_number, number_of_tasks=len(manifest_rows)
+        )
+
+
+def get_array_task_job_ids(array_job_number: int, number_of_tasks: int) -> list[str]:
+    """Return the slurm job ids of the tasks in a job array."""
+    return [f"{array_job_number}_{task_index}" for task_index in range(number_of_tasks)]
+
+
+def get_array_header(number_of_tasks: int) -> str:
+    """Return the sbatch array option for a job array with the given number of tasks."""
+    return f"--array=0-{number_of_tasks - 1}"
+
 
 def _generate_optional_headers(optional_headers: list[str | None]) -> str:
     header_str: str = ""
@@ -38,11 +38,13 @@ class TrailblazerAPI:
         AnalysisStatus.QC,
     ]
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, memoize_latest_analyses: bool = False):
         self.service_account = config["trailblazer"]["service_account"]
         self.service_account_auth_file = config["trailblazer"]["service_account_auth_file"]
         self.host = config["trailblazer"]["host"]
         self._credentials: IDTokenCredentials | None = None
+        self.memoize_latest_analyses: bool = memoize_latest_analyses
+        self._latest_analyses: dict[str, TrailblazerAnalysis | None] = {}
 
     def _are_credentials_expired(self) -> bool:
         """Return True when there are no cached credentials or the token has expired."""
@@ -123,12 +125,26 @@ class TrailblazerAPI:
         raise TrailblazerAnalysisNotFound(f"No completed analysis found for case {case_id}")
 
     def get_latest_analysis(self, case_id: str) -> TrailblazerAnalysis | None:
+        if case_id in self._latest_analyses:
+            return self._latest_analyses[case_id]
         request_body = {
             "case_id": case_id,
         }
         response = self.query_trailblazer(command="get-latest-analysis", request_body=request_body)
-        if response:
-            return TrailblazerAnalysis.model_validate(response)
+        latest_analysis: TrailblazerAnalysis | None = (
+            TrailblazerAnalysis.model_validate(response) if response else None
+        )
+        self._memoize_latest_analysis(case_id=case_id, latest_analysis=latest_analysis)
+        return latest_analysis
+
+    def _memoize_latest_analysis(
+        self, case_id: str, latest_analysis: TrailblazerAnalysis | None
+    ) -> None:
+        if self.memoize_latest_analyses:
+            self._latest_analyses[case_id] = latest_analysis
+
+    def _forget_latest_analysis(self, case_id: str) -> None:
+        self._latest_analyses.pop(case_id, None)
 
     def get_latest_analysis_status(self, case_id: str) -> str | None:
         latest_analysis = self.get_latest_analysis(case_id=case_id)
@@ -174,6 +190,7 @@ class TrailblazerAPI:
             "is_hidden": is_hidden,
         }
         LOG.debug(f"Submitting job to Trailblazer: {request_body}")
+        self._forget_latest_analysis(case_id)
         response = self.query_trailblazer(command="add-pending-analysis", request_body=request_body)
         return TrailblazerAnalysis.model_validate(response)
 
@@ -193,6 +210,7 @@ class TrailblazerAPI:
 
         LOG.debug(f"Request body: {request_body}")
         LOG.info(f"Setting analysis status to {status} for case {case_id}")
+        self._forget_latest_analysis(case_id)
         self.query_trailblazer(
             command="set-analysis-status", request_body=request_body, method=APIMethods.PUT
         )
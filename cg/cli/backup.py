@@ -5,13 +5,12 @@ from pathlib import Path
 
 import rich_click as click
 
-from cg.apps.slurm.slurm_api import SlurmAPI
 from cg.cli.utils import CLICK_CONTEXT_SETTINGS
+from cg.constants.backup import MAX_CONCURRENT_RUN_ENCRYPTIONS
 from cg.constants.cli_options import DRY_RUN
 from cg.constants.constants import SequencingRunDataAvailability
 from cg.exc import (
     DsmcAlreadyRunningError,
-    FlowCellError,
     IlluminaRunAlreadyBackedUpError,
     IlluminaRunEncryptionError,
     PdcError,
@@ -24,7 +23,6 @@ from cg.models.run_devices.illumina_run_directory_data import (
     get_sequencing_runs_from_path,
 )
 from cg.services.illumina.backup.backup_service import IlluminaBackupService
-from cg.services.illumina.backup.encrypt_service import IlluminaRunEncryptionService
 from cg.store.exc import EntryNotFoundError
 from cg.store.models import IlluminaSequencingRun
 from cg.store.store import Store
@@ -89,14 +87,24 @@ def backup_illumina_runs(context: CGConfig, dry_run: bool):
 
 
 @backup.command("encrypt-illumina-runs")
+@click.option(
+    "--workers",
+    type=int,
+    default=MAX_CONCURRENT_RUN_ENCRYPTIONS,
+    show_default=True,
+    help="Number of runs to start encryption for at the same time",
+)
 @DRY_RUN
 @click.pass_obj
-def encrypt_illumina_runs(context: CGConfig, dry_run: bool):
+def encrypt_illumina_runs(
+    context: CGConfig, dry_run: bool, workers: int = MAX_CONCURRENT_RUN_ENCRYPTIONS
+):
     """Encrypt illumina runs."""
     status_db: Store = context.status_db
     runs: list[IlluminaRunDirectoryData] = get_sequencing_runs_from_path(
         sequencing_run_dir=Path(context.run_instruments.illumina.sequencing_runs_dir)
     )
+    runs_to_encrypt: list[IlluminaRunDirectoryData] = []
     for run in runs:
         try:
             sequencing_run: IlluminaSequencingRun = (
@@ -108,27 +116,43 @@ def encrypt_illumina_runs(context: CGConfig, dry_run: bool):
         if sequencing_run.has_backup:
             LOG.debug(f"Run: {run.id} is already backed-up")
             continue
-        illumina_run_encryption_service = IlluminaRunEncryptionService(
-            binary_path=context.encryption.binary_path,
-            dry_run=dry_run,
-            encryption_dir=Path(context.encryption.encryption_dir),
-            run_dir_data=run,
-            pigz_binary_path=context.pigz.binary_path,
-            slurm_api=SlurmAPI(),
-            sbatch_parameter=context.illumina_backup_service.slurm_flow_cell_encryption.dict(),
-            tar_api=TarAPI(binary_path=context.tar.binary_path, dry_run=dry_run),
-        )
-        try:
-            illumina_run_encryption_service.start_encryption()
-        except (FlowCellError, IlluminaRunEncryptionError) as error:
-            logging.error(f"{error}")
+        runs_to_encrypt.append(run)
+    tar_api = TarAPI(binary_path=context.tar.binary_path, dry_run=dry_run)
+    backup_service = IlluminaBackupService(
+        encryption_api=EncryptionAPI(binary_path=context.encryption.binary_path, dry_run=dry_run),
+        pdc_archiving_directory=context.illumina_backup_service.pdc_archiving_directory,
+        status_db=status_db,
+        tar_api=tar_api,
+        pdc_service=context.pdc_service,
+        sequencing_runs_dir=context.run_instruments.illumina.sequencing_runs_dir,
+        dry_run=dry_run,
+    )
+    backup_service.start_run_encryptions(
+        runs_dir_data=runs_to_encrypt,
+        binary_path=context.encryption.binary_path,
+        encryption_dir=Path(context.encryption.encryption_dir),
+        pigz_binary_path=context.pigz.binary_path,
+        sbatch_parameter=context.illumina_backup_service.slurm_flow_cell_encryption.dict(),
+        max_workers=workers,
+    )
 
 
 @backup.command("fetch-illumina-run")
 @click.option("-f", "--flow-cell-id", help="Retrieve a specific flow cell, ex. 'HCK2KDSXX'")
+@click.option(
+    "--stream",
+    is_flag=True,
+    default=False,
+    help="Decrypt the run straight into extraction without writing the decrypted archive to disk",
+)
 @DRY_RUN
 @click.pass_obj
-def fetch_illumina_run(context: CGConfig, dry_run: bool, flow_cell_id: str | None = None):
+def fetch_illumina_run(
+    context: CGConfig,
+    dry_run: bool,
+    flow_cell_id: str | None = None,
+    stream: bool = False,
+):
     """Fetch the first Illumina run in the requested queue from backup."""
 
     pdc_service = context.pdc_service
@@ -143,6 +167,8 @@ def fetch_illumina_run(context: CGConfig, dry_run: bool, flow_cell_id: str | Non
         pdc_service=pdc_service,
         sequencing_runs_dir=context.run_instruments.illumina.sequencing_runs_dir,
         dry_run=dry_run,
+        stream_extraction=stream,
+        pigz_binary_path=context.pigz.binary_path,
     )
     backup_api: IlluminaBackupService = context.meta_apis["backup_api"]
 
@@ -32,6 +32,7 @@ from cg.constants.constants import FileFormat
 from cg.io.controller import ReadFile
 from cg.models.cg_config import CGConfig
 from cg.store.database import get_scoped_session_registry
+from cg.store.profiler import profile_sql
 
 LOG = logging.getLogger(__name__)
 
@@ -54,6 +55,12 @@ def teardown_session():
     help="lowest level to log at",
 )
 @click.option("--verbose", is_flag=True, help="Show full log information, time stamp etc")
+@click.option(
+    "--profile-sql",
+    "profile_sql_statements",
+    is_flag=True,
+    help="Log the number and time of SQL statements and warn about likely N+1 queries",
+)
 @click.version_option(cg.__version__, prog_name=cg.__title__)
 @click.pass_context
 def base(
@@ -62,6 +69,7 @@ def base(
     database: str | None,
     log_level: str,
     verbose: bool,
+    profile_sql_statements: bool,
 ):
     """cg - interface between tools at Clinical Genomics."""
     if verbose:
@@ -77,6 +85,8 @@ def base(
     )
     context.obj = CGConfig(**raw_config)
     context.call_on_close(teardown_session)
+    if profile_sql_statements:
+        context.with_resource(profile_sql(name=f"cg {context.invoked_subcommand}"))
 
 
 def find_commands(group, query: str) -> list[str]:
@@ -32,6 +32,12 @@ LOG = logging.getLogger(__name__)
     help="Only cases older than this many days are eligible for compression",
 )
 @click.option("-n", "--number-of-samples", default=5, type=int, show_default=True)
+@click.option(
+    "--job-arrays",
+    is_flag=True,
+    default=False,
+    help="Submit runs with similar resource estimates together as SLURM job arrays",
+)
 @DRY_RUN
 @click.pass_obj
 def fastq_cmd(
@@ -39,6 +45,7 @@ def fastq_cmd(
     case_id: str | None,
     days_back: int,
     dry_run: bool,
+    job_arrays: bool,
     number_of_samples: int,
 ):
     """Compress old FASTQ files into SPRING."""
@@ -55,6 +62,7 @@ def fastq_cmd(
             samples=samples,
             sample_limit=number_of_samples,
             dry_run=dry_run,
+            use_job_arrays=job_arrays,
         )
     else:
         LOG.info(f"No samples older than {days_back} days available to compress.")
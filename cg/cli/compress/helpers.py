@@ -9,11 +9,14 @@ from housekeeper.store.models import Bundle, Version
 
 from cg.apps.housekeeper.hk import HousekeeperAPI
 from cg.constants import SequencingFileTag
+from cg.constants.compression import COMPRESSION_SAMPLE_CHUNK_SIZE
 from cg.meta.compress import CompressAPI
 from cg.meta.compress.files import get_spring_paths
+from cg.models.compression_data import CompressionBatch
 from cg.store.models import Case, Sample
 from cg.store.store import Store
 from cg.utils.date import get_date_days_ago
+from cg.utils.utils import get_chunks
 
 LOG = logging.getLogger(__name__)
 
@@ -90,23 +93,39 @@ def compress_fastq_to_spring_for_samples(
     samples: list[Sample],
     sample_limit: int,
     dry_run: bool = False,
+    use_job_arrays: bool = False,
 ) -> None:
-    """Compress the fastq files to spring for a list of samples."""
+    """Compress the fastq files to spring for a list of samples.
+
+    With job arrays, the runs of all samples are collected first and submitted together in groups
+    with similar resource estimates.
+    """
     if dry_run:
         update_compress_api(compress_api=compress_api, dry_run=dry_run)
         LOG.info("Dry-run activated - no samples will be submitted for compression")
 
+    batch: CompressionBatch | None = CompressionBatch() if use_job_arrays else None
     successful_submissions = 0
-    for sample in samples:
+    for samples_chunk in get_chunks(items=samples, chunk_size=COMPRESSION_SAMPLE_CHUNK_SIZE):
         if sample_limit <= successful_submissions:
             break
+        compress_api.prefetch_lane_read_counts(
+            sample_ids=[sample.internal_id for sample in samples_chunk]
+        )
+        for sample in samples_chunk:
+            if sample_limit <= successful_submissions:
+                break
+
+            is_sample_submitted: bool = compress_api.compress_fastq(
+                sample_id=sample.internal_id, batch=batch
+            )
+            if not is_sample_submitted:
+                LOG.debug(f"Sample {sample.internal_id} not submitted for compression")
+            else:
+                successful_submissions += 1
 
-        is_sample_submitted: bool = compress_api.compress_fastq(sample_id=sample.internal_id)
-        if not is_sample_submitted:
-            LOG.debug(f"Sample {sample.internal_id} not submitted for compression")
-        else:
-            successful_submissions += 1
-
+    if batch:
+        compress_api.submit_fastq_compression_batch(batch=batch)
     LOG.debug(f"Submitted a total of {successful_submissions} samples to compression")
 
 
@@ -2,6 +2,7 @@ import logging
 import os
 import shutil
 from pathlib import Path
+from typing import Iterator
 
 from cg.apps.demultiplex.sample_sheet.utils import add_and_include_sample_sheet_path_to_housekeeper
 from cg.apps.housekeeper.hk import HousekeeperAPI
@@ -10,7 +11,7 @@ from cg.constants.constants import Workflow
 from cg.constants.demultiplexing import DemultiplexingDirsAndFiles
 from cg.constants.priority import TrailblazerPriority
 from cg.constants.tb import AnalysisStatus, AnalysisType
-from cg.io.csv import read_csv, write_csv
+from cg.io.csv import iterate_csv, write_csv
 
 LOG = logging.getLogger(__name__)
 
@@ -203,7 +204,7 @@ def is_nanopore_sequencing_complete(flow_cell_directory: Path) -> bool:
 def parse_manifest_file(manifest_file: Path) -> list[Path]:
     """Returns a list with the first entry of each row of the given TSV file."""
     LOG.debug(f"Parsing manifest file: {manifest_file}")
-    files: list[list[str]] = read_csv(file_path=manifest_file, delimiter="\t")
+    files: Iterator[list[str]] = iterate_csv(file_path=manifest_file, delimiter="\t")
     return [Path(file[0]) for file in files]
 
 
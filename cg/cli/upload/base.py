@@ -2,7 +2,9 @@
 
 import logging
 import sys
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 import rich_click as click
 
@@ -29,10 +31,16 @@ from cg.cli.upload.scout import (
     upload_to_scout,
     upload_tomte_to_scout,
 )
-from cg.cli.upload.utils import suggest_cases_to_upload
+from cg.cli.upload.utils import (
+    get_case_upload_command,
+    log_upload_summary,
+    run_case_upload,
+    suggest_cases_to_upload,
+)
 from cg.cli.upload.validate import validate
 from cg.cli.utils import CLICK_CONTEXT_SETTINGS
 from cg.constants import Workflow
+from cg.constants.constants import CaseUploadStatus
 from cg.exc import AnalysisAlreadyUploadedError
 from cg.meta.upload.balsamic.balsamic import BalsamicUploadAPI
 from cg.meta.upload.microsalt.microsalt_upload_api import MicrosaltUploadAPI
@@ -46,7 +54,8 @@ from cg.meta.upload.raw_data.raw_data_upload_api import RawDataUploadAPI
 from cg.meta.upload.tomte.tomte import TomteUploadAPI
 from cg.meta.upload.upload_api import UploadAPI
 from cg.models.cg_config import CGConfig
-from cg.store.models import Analysis, Case
+from cg.models.upload import CaseUploadResult
+from cg.store.models import Case
 from cg.store.store import Store
 from cg.utils.click.EnumChoice import EnumChoice
 
@@ -113,41 +122,71 @@ def upload(context: click.Context, case_id: str | None, restart: bool):
 
 @upload.command("auto")
 @click.option("--workflow", type=EnumChoice(Workflow), help="Limit to specific workflow")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of cases to upload at the same time, each in a separate process",
+)
+@click.option(
+    "--timeout",
+    type=click.IntRange(min=1),
+    help="Seconds before the upload of a case is stopped, each case is uploaded in a separate "
+    "process",
+)
 @click.pass_context
-def upload_all_completed_analyses(context: click.Context, workflow: Workflow = None):
+def upload_all_completed_analyses(
+    context: click.Context,
+    workflow: Workflow = None,
+    workers: int = 1,
+    timeout: int | None = None,
+):
     """Upload all completed analyses."""
 
     LOG.info("----------------- AUTO -----------------")
 
     status_db: Store = context.obj.status_db
 
-    exit_code = 0
-    for analysis in status_db.get_analyses_to_upload(workflow=workflow):
-        latest_case_analysis: Analysis = status_db.get_latest_completed_analysis_for_case(
+    case_ids: list[str] = list(
+        dict.fromkeys(
             analysis.case.internal_id
+            for analysis in status_db.get_latest_analyses_to_upload(workflow=workflow)
         )
-        if latest_case_analysis.uploaded_at is not None:
-            LOG.warning(
-                f"Skipping upload for case {analysis.case.internal_id}. "
-                f"Case has been already uploaded at {latest_case_analysis.uploaded_at}."
+    )
+    results: list[CaseUploadResult] = []
+    if workers > 1 or timeout:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    lambda case_id: run_case_upload(
+                        command=get_case_upload_command(context=context, case_id=case_id),
+                        case_id=case_id,
+                        timeout=timeout,
+                    ),
+                    case_ids,
+                )
             )
-            continue
-        if latest_case_analysis.upload_started_at is not None:
-            LOG.warning(
-                f"Skipping upload for case {analysis.case.internal_id}. "
-                f"Case upload has already started at {latest_case_analysis.upload_started_at}."
+    else:
+        for case_id in case_ids:
+            LOG.info(f"Uploading analysis for case: {case_id}")
+            start_time: float = time.perf_counter()
+            status = CaseUploadStatus.UPLOADED
+            try:
+                context.invoke(upload, case_id=case_id)
+            except Exception:
+                LOG.error(f"Case {case_id} upload failed")
+                LOG.error(traceback.format_exc())
+                status = CaseUploadStatus.FAILED
+            results.append(
+                CaseUploadResult(
+                    case_id=case_id, status=status, seconds=time.perf_counter() - start_time
+                )
             )
-            continue
-        case_id = analysis.case.internal_id
-        LOG.info(f"Uploading analysis for case: {case_id}")
-        try:
-            context.invoke(upload, case_id=case_id)
-        except Exception:
-            LOG.error(f"Case {case_id} upload failed")
-            LOG.error(traceback.format_exc())
-            exit_code = 1
 
-    sys.exit(exit_code)
+    log_upload_summary(results)
+    is_any_failed: bool = any(result.status != CaseUploadStatus.UPLOADED for result in results)
+    sys.exit(1 if is_any_failed else 0)
 
 
 upload.add_command(create_scout_load_config)
@@ -15,12 +15,22 @@ from cg.exc import CgError
 from cg.meta.observations.balsamic_observations_api import BalsamicObservationsAPI
 from cg.meta.observations.mip_dna_observations_api import MipDNAObservationsAPI
 from cg.meta.observations.nallo_observations_api import NalloObservationsAPI
+from cg.meta.observations.observations_api import ObservationsAPI
+from cg.meta.observations.observations_uploader import upload_observations
 from cg.meta.observations.raredisease_observations_api import RarediseaseObservationsAPI
 from cg.models.cg_config import CGConfig
 from cg.store.store import Store
 
 LOG = logging.getLogger(__name__)
 
+OPTION_WORKERS = click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of cases to upload at the same time",
+)
+
 
 @click.command("observations")
 @ARGUMENT_CASE_ID
@@ -46,12 +56,14 @@ def upload_observations_to_loqusdb(context: CGConfig, case_id: str | None, dry_r
 
 @click.command("available-observations")
 @OPTION_LOQUSDB_SUPPORTED_WORKFLOW
+@OPTION_WORKERS
 @DRY_RUN
 @click.pass_context
 def upload_available_observations_to_loqusdb(
-    context: click.Context, workflow: Workflow | None, dry_run: bool
+    context: click.Context, workflow: Workflow | None, workers: int, dry_run: bool
 ):
-    """Uploads the available observations to Loqusdb."""
+    """Uploads the available observations to Loqusdb. With more than one worker, several cases
+    are uploaded at the same time."""
     click.echo(click.style("----------------- AVAILABLE OBSERVATIONS -----------------"))
     status_db: Store = context.obj.status_db
     cases_to_upload: Query = status_db.observations_to_upload(workflow)
@@ -60,6 +72,12 @@ def upload_available_observations_to_loqusdb(
             f"There are no available cases to upload to Loqusdb for {workflow} ({datetime.now()})"
         )
         return
+    if workers > 1 and not dry_run:
+        case_ids: list[str] = [case.internal_id for case in cases_to_upload]
+        upload_available_observations_concurrently(
+            context=context.obj, case_ids=case_ids, max_workers=workers
+        )
+        return
     exit_code: int = EXIT_SUCCESS
     for case in cases_to_upload:
         try:
@@ -72,3 +90,28 @@ def upload_available_observations_to_loqusdb(
             exit_code = EXIT_FAIL
     if exit_code:
         raise click.Abort
+
+
+def upload_available_observations_concurrently(
+    context: CGConfig, case_ids: list[str], max_workers: int
+) -> None:
+    """Upload the observations of several cases at the same time. The observations APIs are
+    created before the upload so that the shared configuration is only set up once."""
+    observations_apis: dict[str, ObservationsAPI] = {}
+    exit_code: int = EXIT_SUCCESS
+    for case_id in case_ids:
+        try:
+            observations_apis[case_id] = get_observations_api(
+                context=context, case_id=case_id, upload=True
+            )
+        except CgError:
+            LOG.error(f"Could not upload {case_id} to Loqusdb")
+    errors: dict[str, Exception] = upload_observations(
+        observations_apis=observations_apis, max_workers=max_workers
+    )
+    for case_id, error in errors.items():
+        LOG.error(f"Error uploading observations for {case_id}: {error}")
+        if not isinstance(error, CgError):
+            exit_code = EXIT_FAIL
+    if exit_code:
+        raise click.Abort
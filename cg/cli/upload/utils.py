@@ -1,13 +1,20 @@
 """Utility functions for the upload cli commands."""
 
 import logging
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
 
 import rich_click as click
 
 from cg.apps.scout.scoutapi import ScoutAPI
 from cg.constants import Workflow
-from cg.constants.constants import MAX_ITEMS_TO_RETRIEVE
+from cg.constants.constants import MAX_ITEMS_TO_RETRIEVE, CaseUploadStatus
+from cg.constants.process import EXIT_SUCCESS
 from cg.models.cg_config import CGConfig
+from cg.models.upload import CaseUploadResult
 from cg.store.models import Analysis
 from cg.store.store import Store
 
@@ -40,3 +47,76 @@ def get_scout_api_by_genome_build(cg_config: CGConfig, genome_build: str) -> Sco
     if genome_build == "hg19":
         return cg_config.scout_api_37
     raise ValueError(f"Unsupported genome build: {genome_build}")
+
+
+def get_case_upload_command(context: click.Context, case_id: str) -> list[str]:
+    """Return the command to upload a case in a separate cg process, passing on the options of
+    the root command."""
+    root_params: dict = context.find_root().params
+    command: list[str] = [sys.executable, "-m", "cg"]
+    if root_params.get("config"):
+        command.extend(["--config", str(root_params["config"])])
+    if root_params.get("database"):
+        command.extend(["--database", root_params["database"]])
+    if root_params.get("log_level"):
+        command.extend(["--log-level", root_params["log_level"]])
+    if root_params.get("verbose"):
+        command.append("--verbose")
+    if root_params.get("profile_sql_statements"):
+        command.append("--profile-sql")
+    command.extend(["upload", "--case", case_id])
+    return command
+
+
+def run_case_upload(command: list[str], case_id: str, timeout: int | None) -> CaseUploadResult:
+    """Run the upload of a case in a separate process, killing it if it exceeds the timeout.
+    The output of the process is logged line by line, prefixed with the case id."""
+    LOG.info(f"Uploading analysis for case: {case_id}")
+    start_time: float = time.perf_counter()
+    timed_out = threading.Event()
+    with subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    ) as process:
+
+        def kill_process() -> None:
+            timed_out.set()
+            process.kill()
+
+        timer: threading.Timer | None = (
+            threading.Timer(interval=timeout, function=kill_process) if timeout else None
+        )
+        if timer:
+            timer.start()
+        try:
+            for line in process.stdout:
+                LOG.info(f"{case_id}: {line.rstrip()}")
+            process.wait()
+        finally:
+            if timer:
+                timer.cancel()
+    if timed_out.is_set():
+        LOG.error(
+            f"Case {case_id} upload timed out after {timeout} seconds, "
+            "restart the upload with 'cg upload --restart'"
+        )
+        status = CaseUploadStatus.TIMED_OUT
+    elif process.returncode == EXIT_SUCCESS:
+        status = CaseUploadStatus.UPLOADED
+    else:
+        LOG.error(f"Case {case_id} upload failed")
+        status = CaseUploadStatus.FAILED
+    return CaseUploadResult(
+        case_id=case_id, status=status, seconds=time.perf_counter() - start_time
+    )
+
+
+def log_upload_summary(results: list[CaseUploadResult]) -> None:
+    """Log the number of uploaded, failed and timed out cases."""
+    status_counts = Counter(result.status for result in results)
+    LOG.info(
+        f"Upload summary: {len(results)} cases, "
+        + ", ".join(f"{status_counts[status]} {status}" for status in CaseUploadStatus)
+    )
+    for result in results:
+        if result.status != CaseUploadStatus.UPLOADED:
+            LOG.warning(f"Case {result.case_id}: {result.status} after {result.seconds:.0f} s")
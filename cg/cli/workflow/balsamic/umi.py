@@ -9,6 +9,7 @@ from cg.cli.utils import CLICK_CONTEXT_SETTINGS
 from cg.cli.workflow.balsamic.base import report_deliver, store, store_available, store_housekeeper
 from cg.cli.workflow.balsamic.options import OPTION_PANEL_BED, OPTION_WORKFLOW_PROFILE
 from cg.cli.workflow.commands import ARGUMENT_CASE_ID, link, resolve_compression
+from cg.constants.cli_options import WORKERS
 from cg.constants.constants import Workflow
 from cg.meta.workflow.balsamic_umi import BalsamicUmiAnalysisAPI
 from cg.models.cg_config import CGConfig
@@ -107,8 +108,9 @@ def start(
 
 
 @balsamic_umi.command("start-available")
+@WORKERS
 @click.pass_obj
-def start_available(cg_config: CGConfig):
+def start_available(cg_config: CGConfig, workers: int = 1):
     """
     Starts all available Balsamic-UMI cases.
 
@@ -120,6 +122,6 @@ def start_available(cg_config: CGConfig):
     LOG.info("Starting Balsamic-UMI workflow for all available cases.")
     factory = AnalysisStarterFactory(cg_config)
     analysis_starter = factory.get_analysis_starter_for_workflow(Workflow.BALSAMIC_UMI)
-    succeeded: bool = analysis_starter.start_available()
+    succeeded: bool = analysis_starter.start_available(max_workers=workers)
     if not succeeded:
         raise click.Abort
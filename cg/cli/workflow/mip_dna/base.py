@@ -15,6 +15,7 @@ from cg.cli.workflow.mip.options import (
     START_WITH_PROGRAM,
 )
 from cg.constants import Workflow
+from cg.constants.cli_options import WORKERS
 from cg.meta.workflow.analysis import AnalysisAPI
 from cg.meta.workflow.mip_dna import MipDNAAnalysisAPI
 from cg.models.cg_config import CGConfig
@@ -114,8 +115,9 @@ def start(
 
 
 @mip_dna.command("start-available")
+@WORKERS
 @click.pass_obj
-def start_available(cg_config: CGConfig):
+def start_available(cg_config: CGConfig, workers: int = 1):
     """
     Starts all available MIP-DNA cases.
 
@@ -128,7 +130,7 @@ def start_available(cg_config: CGConfig):
     LOG.info("Starting MIP-DNA workflow for all available cases.")
     factory = AnalysisStarterFactory(cg_config)
     analysis_starter: AnalysisStarter = factory.get_analysis_starter_for_workflow(Workflow.MIP_DNA)
-    succeeded: bool = analysis_starter.start_available()
+    succeeded: bool = analysis_starter.start_available(max_workers=workers)
     if not succeeded:
         raise click.Abort
 
@@ -16,6 +16,7 @@ from cg.cli.workflow.nf_analysis import (
     store_available,
     store_housekeeper,
 )
+from cg.constants.cli_options import WORKERS
 from cg.constants.constants import MetaApis, Workflow
 from cg.meta.workflow.analysis import AnalysisAPI
 from cg.meta.workflow.nallo import NalloAnalysisAPI
@@ -102,12 +103,13 @@ def start(cg_config: CGConfig, case_id: str, revision: str | None):
 
 
 @nallo.command("start-available")
+@WORKERS
 @click.pass_obj
-def start_available(cg_config: CGConfig):
+def start_available(cg_config: CGConfig, workers: int = 1):
     """Starts all available Nallo cases."""
     LOG.info("Starting Nallo workflow for all available cases.")
     factory = AnalysisStarterFactory(cg_config)
     analysis_starter: AnalysisStarter = factory.get_analysis_starter_for_workflow(Workflow.NALLO)
-    succeeded: bool = analysis_starter.start_available()
+    succeeded: bool = analysis_starter.start_available(max_workers=workers)
     if not succeeded:
         raise click.Abort
@@ -16,6 +16,7 @@ from cg.cli.workflow.nf_analysis import (
     store_available,
     store_housekeeper,
 )
+from cg.constants.cli_options import WORKERS
 from cg.constants.constants import MetaApis, Workflow
 from cg.meta.workflow.analysis import AnalysisAPI
 from cg.meta.workflow.raredisease import RarediseaseAnalysisAPI
@@ -107,13 +108,14 @@ def start(cg_config: CGConfig, case_id: str, revision: str | None):
 
 
 @raredisease.command()
+@WORKERS
 @click.pass_obj
-def start_available(cg_config: CGConfig) -> None:
+def start_available(cg_config: CGConfig, workers: int = 1) -> None:
     """Starts all available raredisease cases."""
     LOG.info("Starting raredisease workflow for all available cases.")
     analysis_starter = AnalysisStarterFactory(cg_config).get_analysis_starter_for_workflow(
         Workflow.RAREDISEASE
     )
-    succeeded: bool = analysis_starter.start_available()
+    succeeded: bool = analysis_starter.start_available(max_workers=workers)
     if not succeeded:
         raise click.Abort
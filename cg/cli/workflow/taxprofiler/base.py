@@ -16,6 +16,7 @@ from cg.cli.workflow.nf_analysis import (
     store_available,
     store_housekeeper,
 )
+from cg.constants.cli_options import WORKERS
 from cg.constants.constants import MetaApis, Workflow
 from cg.meta.workflow.analysis import AnalysisAPI
 from cg.meta.workflow.taxprofiler import TaxprofilerAnalysisAPI
@@ -59,15 +60,16 @@ def start(cg_config: CGConfig, case_id: str, revision: str | None) -> None:
 
 
 @taxprofiler.command()
+@WORKERS
 @click.pass_obj
-def start_available(cg_config: CGConfig) -> None:
+def start_available(cg_config: CGConfig, workers: int = 1) -> None:
     """Starts all available Taxprofiler cases."""
     LOG.info("Starting Taxprofiler workflow for all available cases.")
     factory = AnalysisStarterFactory(cg_config)
     analysis_starter: AnalysisStarter = factory.get_analysis_starter_for_workflow(
         Workflow.TAXPROFILER
     )
-    succeeded: bool = analysis_starter.start_available()
+    succeeded: bool = analysis_starter.start_available(max_workers=workers)
     if not succeeded:
         raise click.Abort
 
@@ -1 +1,7 @@
 MAX_PROCESSING_ILLUMINA_RUNS: int = 1
+
+# Size of the chunks relayed from decryption to extraction when streaming a run from backup
+STREAM_CHUNK_SIZE: int = 8 * 1024 * 1024
+
+# Number of Illumina runs to start encryption for at the same time
+MAX_CONCURRENT_RUN_ENCRYPTIONS: int = 4
@@ -43,3 +43,11 @@ SIGNATURE = click.option(
     type=str,
     help="Signature (initials) of the user performing the delivery.",
 )
+
+WORKERS = click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of cases to fetch input files for and configure at the same time",
+)
@@ -24,6 +24,17 @@ DECOMPRESSION_MEMORY_INTERCEPT: float = 8
 DECOMPRESSION_MINUTES_PER_READ: float = 3.0918e-07
 DECOMPRESSION_TIME_INTERCEPT: float = 5.51
 
+# Grouping of runs with similar resource estimates into SLURM job arrays
+ARRAY_MEMORY_STEP: int = 8  # GB
+ARRAY_MINUTES_STEP: int = 30
+MAX_ARRAY_TASKS: int = 1000
+
+# Number of threads checking compression files on disk
+FILE_CHECK_WORKERS: int = 8
+
+# Number of samples for which sequencing metrics are fetched together
+COMPRESSION_SAMPLE_CHUNK_SIZE: int = 100
+
 
 # Number of days until FASTQs counts as old
 FASTQ_DELTA = 21
@@ -338,3 +338,9 @@ class SampleStatus(StrEnum):
     @classmethod
     def statuses(cls) -> list[str]:
         return [cls.INCOMING, cls.LABPREP, cls.SEQUENCING]
+
+
+class CaseUploadStatus(StrEnum):
+    UPLOADED = "uploaded"
+    FAILED = "failed"
+    TIMED_OUT = "timed out"
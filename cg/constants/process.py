@@ -4,3 +4,5 @@ EXIT_SUCCESS = 0
 EXIT_WARNING = 8
 EXIT_FAIL = 1
 EXIT_PARSE_ERROR = 2
+
+MAX_CONCURRENT_PROCESSES = 4
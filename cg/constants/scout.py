@@ -197,3 +197,12 @@ class ScoutAnalysisType(StrEnum):
     WGS = "wgs"
     WGS_LR = "wgs-lr"
     WTS = "wts"
+
+
+SCOUT_EXPORT_CACHE_TTL_SECONDS: int = 3600
+SCOUT_GENE_PANEL_HEADER: str = "##gene_panel="
+
+
+class ScoutExportKind(StrEnum):
+    GENE_PANEL = "gene_panel"
+    MANAGED_VARIANTS = "managed_variants"
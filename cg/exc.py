@@ -134,6 +134,10 @@ class IlluminaRunEncryptionError(CgError):
     """Raised when there is a problem with encrypting a flow cell."""
 
 
+class IlluminaRunDecryptionError(CgError):
+    """Raised when a decrypted flow cell archive does not match its checksum."""
+
+
 class IlluminaRunAlreadyBackedUpError(CgError):
     """Raised when a flow cell is already backed-up."""
 
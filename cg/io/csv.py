@@ -3,42 +3,83 @@
 import csv
 import io
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, Type, TypeVar
+
+from pydantic import BaseModel
 
 from cg.constants import FileExtensions
 from cg.io.validate_path import validate_file_suffix
 
 DELIMITER_TO_SUFFIX = {",": FileExtensions.CSV, "\t": FileExtensions.TSV}
 
+RowModel = TypeVar("RowModel", bound=BaseModel)
 
-def read_csv(
+
+def iterate_csv(
     file_path: Path, read_to_dict: bool = False, delimiter: str = ",", ignore_suffix: bool = False
-) -> list[list[str]] | list[dict]:
+) -> Iterator[list[str]] | Iterator[dict]:
     """
-    Read content in a CSV file to a list of list or list of dict.
+    Return an iterator over the rows of a CSV file as lists or dicts, reading one row at a time.
     The delimiter parameter can be used to read TSV files.
     """
     if not ignore_suffix:
         validate_file_suffix(
             path_to_validate=file_path, target_suffix=DELIMITER_TO_SUFFIX[delimiter]
         )
+    return _iterate_csv_rows(file_path=file_path, read_to_dict=read_to_dict, delimiter=delimiter)
+
+
+def _iterate_csv_rows(
+    file_path: Path, read_to_dict: bool, delimiter: str
+) -> Iterator[list[str]] | Iterator[dict]:
     with open(file_path, "r") as file:
         csv_reader = (
             csv.DictReader(file, delimiter=delimiter)
             if read_to_dict
             else csv.reader(file, delimiter=delimiter)
         )
-        return list(csv_reader)
+        yield from csv_reader
+
+
+def iterate_csv_models(
+    file_path: Path, model: Type[RowModel], delimiter: str = ",", ignore_suffix: bool = False
+) -> Iterator[RowModel]:
+    """Return an iterator over the rows of a CSV file with a header, validated as models."""
+    rows: Iterator[dict] = iterate_csv(
+        file_path=file_path, read_to_dict=True, delimiter=delimiter, ignore_suffix=ignore_suffix
+    )
+    return (model.model_validate(row) for row in rows)
+
+
+def read_csv(
+    file_path: Path, read_to_dict: bool = False, delimiter: str = ",", ignore_suffix: bool = False
+) -> list[list[str]] | list[dict]:
+    """
+    Read content in a CSV file to a list of list or list of dict.
+    The delimiter parameter can be used to read TSV files.
+    """
+    return list(
+        iterate_csv(
+            file_path=file_path,
+            read_to_dict=read_to_dict,
+            delimiter=delimiter,
+            ignore_suffix=ignore_suffix,
+        )
+    )
+
+
+def iterate_csv_stream(stream: str, delimiter: str = ",") -> Iterator[list[str]]:
+    """Return an iterator over the rows of a CSV formatted stream."""
+    return csv.reader(stream.splitlines(), delimiter=delimiter)
 
 
 def read_csv_stream(stream: str, delimiter: str = ",") -> list[list[str]]:
     """Read CSV formatted stream."""
-    csv_reader = csv.reader(stream.splitlines(), delimiter=delimiter)
-    return list(csv_reader)
+    return list(iterate_csv_stream(stream=stream, delimiter=delimiter))
 
 
-def write_csv(content: list[list[Any]], file_path: Path, delimiter: str = ",") -> None:
-    """Write content to a CSV file."""
+def write_csv(content: Iterable[list[Any]], file_path: Path, delimiter: str = ",") -> None:
+    """Write content from any iterable of rows to a CSV file, one row at a time."""
     with open(file_path, "w", newline="") as file:
         csv_writer = csv.writer(file, delimiter=delimiter)
         for row in content:
@@ -46,9 +87,9 @@ def write_csv(content: list[list[Any]], file_path: Path, delimiter: str = ",") -
 
 
 def write_csv_from_dict(
-    content: list[dict[Any]], fieldnames: list[str], file_path: Path, delimiter: str = ","
+    content: Iterable[dict[Any]], fieldnames: list[str], file_path: Path, delimiter: str = ","
 ) -> None:
-    """Write content to a CSV file."""
+    """Write content from any iterable of dicts to a CSV file, one row at a time."""
     with open(file_path, "w", newline="") as file:
         csv_writer = csv.DictWriter(file, delimiter=delimiter, fieldnames=fieldnames)
         csv_writer.writeheader()
@@ -1,25 +1,136 @@
+"""Read and write JSON using orjson when it is installed and the standard library otherwise."""
+
 import json
+from datetime import date
+from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def get_serializable(content: Any) -> Any:
+    """Return a JSON serializable representation of pydantic models, paths, dates and enums.
+    Raises:
+        TypeError if the content can not be serialized.
+    """
+    if isinstance(content, BaseModel):
+        return content.model_dump(mode="json")
+    if isinstance(content, Path):
+        return content.as_posix()
+    if isinstance(content, date):
+        return content.isoformat()
+    if isinstance(content, Enum):
+        return content.value
+    raise TypeError(f"Object of type {type(content).__name__} is not JSON serializable")
+
+
+class JsonBackend:
+    """Encode and decode JSON with the standard library."""
+
+    name: str = "json"
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(
+        self,
+        content: Any,
+        indent: int | None = None,
+        compact: bool = False,
+        sort_keys: bool = False,
+        default: Callable[[Any], Any] = get_serializable,
+        datetime_default: bool = False,
+    ) -> str:
+        """Encode content as JSON, without whitespace between items if compact. Dates are always
+        passed to the default function, the datetime_default flag only matters for backends that
+        can encode dates themselves."""
+        return json.dumps(
+            content,
+            indent=indent,
+            separators=(",", ":") if compact else None,
+            sort_keys=sort_keys,
+            default=default,
+        )
+
+
+class OrjsonBackend(JsonBackend):
+    """Encode and decode JSON with orjson. orjson only writes compact or two space indented
+    JSON, other layouts and content that orjson does not support, such as NaN values in a file,
+    are handled by the standard library."""
+
+    name: str = "orjson"
+
+    def loads(self, data: str | bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(data)
+
+    def dumps(
+        self,
+        content: Any,
+        indent: int | None = None,
+        compact: bool = False,
+        sort_keys: bool = False,
+        default: Callable[[Any], Any] = get_serializable,
+        datetime_default: bool = False,
+    ) -> str:
+        """Encode content as JSON, without whitespace between items if compact. With
+        datetime_default, dates are passed to the default function instead of being encoded as
+        ISO 8601."""
+        is_orjson_layout: bool = indent == 2 and not compact or indent is None and compact
+        if not is_orjson_layout:
+            return super().dumps(content, indent, compact, sort_keys, default)
+        option: int = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if datetime_default:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        try:
+            return orjson.dumps(content, default=default, option=option).decode()
+        except orjson.JSONEncodeError:
+            return super().dumps(content, indent, compact, sort_keys, default)
+
+
+_backend: JsonBackend = OrjsonBackend() if orjson else JsonBackend()
+
+
+def get_json_backend() -> JsonBackend:
+    """Return the backend used to read and write JSON."""
+    return _backend
+
+
+def set_json_backend(backend: JsonBackend) -> None:
+    """Set the backend used to read and write JSON."""
+    global _backend
+    _backend = backend
 
 
 def read_json(file_path: Path) -> Any:
     """Read content in a json file"""
-    with open(file_path, "r") as file:
-        return json.load(file)
+    with open(file_path, "rb") as file:
+        return _backend.loads(file.read())
 
 
 def read_json_stream(stream: str) -> Any:
     """Read json formatted stream"""
-    return json.loads(stream)
+    return _backend.loads(stream)
 
 
 def write_json(content: Any, file_path: Path) -> None:
     """Write content to a json file"""
     with open(file_path, "w") as file:
-        json.dump(content, file, indent=4)
+        file.write(_backend.dumps(content, indent=4))
 
 
 def write_json_stream(content: Any) -> str:
     """Write content to a json stream"""
-    return json.dumps(content)
+    return _backend.dumps(content)
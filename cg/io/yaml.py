@@ -5,16 +5,18 @@ from typing import Any
 
 import yaml
 
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def read_yaml(file_path: Path) -> Any:
-    """Read content in a yaml file"""
+    """Read content in a yaml file, with the libyaml parser when it is available"""
     with open(file_path, "r") as file:
-        return yaml.safe_load(file)
+        return yaml.load(file, Loader=SafeLoader)
 
 
 def read_yaml_stream(stream: str) -> Any:
-    """Read yaml formatted stream"""
-    return yaml.safe_load(stream)
+    """Read yaml formatted stream, with the libyaml parser when it is available"""
+    return yaml.load(stream, Loader=SafeLoader)
 
 
 def write_yaml(content: Any, file_path: Path) -> None:
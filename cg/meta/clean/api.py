@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Iterator
@@ -13,6 +14,8 @@ from cg.store.store import Store
 
 LOG = logging.getLogger(__name__)
 
+FILE_EXISTS_WORKERS: int = 16
+
 
 class CleanAPI:
     def __init__(self, status_db: Store, housekeeper_api: HousekeeperAPI):
@@ -20,8 +23,8 @@ class CleanAPI:
         self.housekeeper_api = housekeeper_api
 
     def get_bundle_files(self, before: datetime, workflow: Workflow) -> Iterator[list[File]]:
-        """Get any bundle files for a specific version."""
-
+        """Get the bundle files of the analyses for a workflow, fetched for many versions at a
+        time. The files of analyses without a Housekeeper version are fetched by bundle name."""
         completed_analyses_for_workflow: list[Analysis] = (
             self.status_db.get_completed_analyses_for_workflow_started_at_before(
                 workflow=workflow, started_at_before=before
@@ -31,35 +34,59 @@ class CleanAPI:
             f"number of {workflow} analyses before: {before} : {len(completed_analyses_for_workflow)}"
         )
         for analysis in completed_analyses_for_workflow:
-            bundle_name = analysis.case.internal_id
             LOG.info(
                 f"Version with id {analysis.housekeeper_version_id} found for "
-                f"bundle:{bundle_name}; "
+                f"bundle:{analysis.case.internal_id}; "
                 f"workflow: {workflow}; "
             )
-            yield self.housekeeper_api.get_files(
-                bundle=bundle_name, version=analysis.housekeeper_version_id
-            ).all()
+        yield from self.housekeeper_api.get_files_by_version_ids(
+            version_ids=[
+                analysis.housekeeper_version_id
+                for analysis in completed_analyses_for_workflow
+                if analysis.housekeeper_version_id
+            ]
+        )
+        for analysis in completed_analyses_for_workflow:
+            if not analysis.housekeeper_version_id:
+                yield self.housekeeper_api.get_files(bundle=analysis.case.internal_id).all()
+
+    @staticmethod
+    def get_protected_tag_sets(protected_tags_lists: list[list[str]]) -> list[frozenset[str]]:
+        """Return each combination of protected tags as a set."""
+        return [frozenset(protected_tags) for protected_tags in protected_tags_lists]
 
     @staticmethod
-    def has_protected_tags(file: File, protected_tags_lists: list[list[str]]) -> bool:
+    def has_protected_tags(file: File, protected_tag_sets: list[frozenset[str]]) -> bool:
         """Check if a file has any protected tags"""
 
         LOG.info(f"File {file.full_path} has the tags {file.tags}")
-        file_tags: list[str] = HousekeeperAPI.get_tag_names_from_file(file)
+        file_tags = frozenset(HousekeeperAPI.get_tag_names_from_file(file))
 
-        _has_protected_tags: bool = False
-        for protected_tags in protected_tags_lists:
-            if set(protected_tags).issubset(set(file_tags)):
+        for protected_tags in protected_tag_sets:
+            if protected_tags <= file_tags:
                 LOG.debug(
-                    f"File {file.full_path} has the protected tag(s) {protected_tags}, skipping."
+                    f"File {file.full_path} has the protected tag(s) {sorted(protected_tags)}, "
+                    "skipping."
                 )
-                _has_protected_tags = True
-                break
+                return True
 
-        if not _has_protected_tags:
-            LOG.info(f"File {file.full_path} has no protected tags.")
-        return _has_protected_tags
+        LOG.info(f"File {file.full_path} has no protected tags.")
+        return False
+
+    @staticmethod
+    def get_existing_files(
+        files: list[File], max_workers: int = FILE_EXISTS_WORKERS
+    ) -> Iterator[File]:
+        """Yield the files that exist on disk, checking for them in parallel."""
+        file_paths: list[Path] = [Path(file.full_path) for file in files]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            file_exists: list[bool] = list(executor.map(Path.exists, file_paths))
+        for file, file_path, exists in zip(files, file_paths, file_exists):
+            if not exists:
+                LOG.info(f"File {file_path} not on disk.")
+                continue
+            LOG.info(f"File {file_path} found on disk.")
+            yield file
 
     def get_unprotected_existing_bundle_files(self, before: datetime) -> Iterator[File]:
         """Returns all existing bundle files from analyses started before 'before' that have no protected tags"""
@@ -70,17 +97,15 @@ class CleanAPI:
             if not protected_tags_lists:
                 LOG.debug(f"No protected tags defined for {workflow}, skipping")
                 continue
+            protected_tag_sets: list[frozenset[str]] = self.get_protected_tag_sets(
+                protected_tags_lists
+            )
 
             hk_files: list[File]
             for hk_files in self.get_bundle_files(before=before, workflow=workflow):
-                hk_file: File
-                for hk_file in hk_files:
-                    if self.has_protected_tags(hk_file, protected_tags_lists=protected_tags_lists):
-                        continue
-
-                    file_path: Path = Path(hk_file.full_path)
-                    if not file_path.exists():
-                        LOG.info(f"File {file_path} not on disk.")
-                        continue
-                    LOG.info(f"File {file_path} found on disk.")
-                    yield hk_file
+                unprotected_files: list[File] = [
+                    hk_file
+                    for hk_file in hk_files
+                    if not self.has_protected_tags(hk_file, protected_tag_sets=protected_tag_sets)
+                ]
+                yield from self.get_existing_files(unprotected_files)
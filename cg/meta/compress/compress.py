@@ -9,7 +9,7 @@ from pathlib import Path
 from housekeeper.store.models import File, Version
 
 from cg.apps.crunchy import CrunchyAPI
-from cg.apps.crunchy.files import scale_resource_by_reads, update_metadata_date
+from cg.apps.crunchy.files import parse_run_name, scale_resource_by_reads, update_metadata_date
 from cg.apps.housekeeper.hk import HousekeeperAPI
 from cg.constants import SequencingFileTag
 from cg.constants.compression import (
@@ -29,7 +29,12 @@ from cg.constants.compression import (
 from cg.constants.constants import PIPELINES_USING_PARTIAL_ANALYSES
 from cg.exc import DecompressionCouldNotStartError
 from cg.meta.compress import files
-from cg.models.compression_data import CaseCompressionData, CompressionData, SampleCompressionData
+from cg.models.compression_data import (
+    CaseCompressionData,
+    CompressionBatch,
+    CompressionData,
+    SampleCompressionData,
+)
 from cg.store.models import Case, Sample
 from cg.store.store import Store
 
@@ -52,6 +57,22 @@ class CompressAPI:
         self.demux_root: Path = Path(demux_root)
         self.status_db: Store = status_db
         self.dry_run: bool = dry_run
+        self.lane_read_counts: dict[tuple[str, str, int], int | None] = {}
+        self.prefetched_sample_ids: set[str] = set()
+
+    def prefetch_lane_read_counts(self, sample_ids: list[str]) -> None:
+        """Fetch the lane read counts of the samples in one query, replacing earlier prefetches."""
+        self.lane_read_counts = self.status_db.get_illumina_lane_read_counts_by_sample_internal_ids(
+            sample_internal_ids=sample_ids
+        )
+        self.prefetched_sample_ids = set(sample_ids)
+
+    def _get_reads_for_run(self, compression_obj: CompressionData) -> int | None:
+        """Return the reads in the lane of the run, from the prefetched read counts if possible."""
+        parsed: tuple[str, str, int] | None = parse_run_name(compression_obj.run_name)
+        if parsed and parsed[1] in self.prefetched_sample_ids:
+            return self.lane_read_counts.get(parsed)
+        return files.get_reads_for_run(compression_obj, self.status_db)
 
     def _get_resources_for_run(
         self,
@@ -71,7 +92,7 @@ class CompressAPI:
         illumina_sample_sequencing_metrics; otherwise falls back to CrunchyAPI's configured
         fallback_memory/fallback_minutes.
         """
-        reads: int | None = files.get_reads_for_run(compression_obj, self.status_db)
+        reads: int | None = self._get_reads_for_run(compression_obj)
         if not reads:
             return self.crunchy_api.fallback_memory, self.crunchy_api.fallback_minutes
         memory: int = scale_resource_by_reads(
@@ -92,8 +113,11 @@ class CompressAPI:
         if self.crunchy_api.dry_run is False:
             self.crunchy_api.set_dry_run(dry_run)
 
-    def compress_fastq(self, sample_id: str) -> bool:
-        """Compress the FASTQ files for an individual."""
+    def compress_fastq(self, sample_id: str, batch: CompressionBatch | None = None) -> bool:
+        """Compress the FASTQ files for an individual.
+
+        If a batch is given, the runs are added to it instead of being submitted one job each.
+        """
         LOG.debug(f"Check if FASTQ compression is possible for {sample_id}")
         version: Version = self.hk_api.get_latest_bundle_version(bundle_name=sample_id)
         if not version:
@@ -105,6 +129,9 @@ class CompressAPI:
         if not sample_fastq:
             return False
 
+        are_files_compressible: dict[str, bool] = files.get_fastq_compression_possible_by_run(
+            [sample_fastq[run_name]["compression_data"] for run_name in sample_fastq]
+        )
         all_ok: bool = True
         for run_name in sample_fastq:
             LOG.debug(f"Check if compression possible for run {run_name}")
@@ -112,6 +139,7 @@ class CompressAPI:
             is_compression_possible: bool = self._is_fastq_compression_possible(
                 compression=compression,
                 sample_id=sample_id,
+                are_files_compressible=are_files_compressible[compression.run_name],
             )
             if not is_compression_possible:
                 LOG.info(f"FASTQ to SPRING not possible for {sample_id}, run {run_name}")
@@ -132,16 +160,39 @@ class CompressAPI:
                 min_minutes=MINUTES_FLOOR,
                 max_minutes=MINUTES_CEIL,
             )
+            if batch is not None:
+                batch.add(compression=compression, memory=memory, minutes=minutes)
+                continue
             self.crunchy_api.fastq_to_spring(
                 compression_obj=compression, sample_id=sample_id, memory=memory, minutes=minutes
             )
         return all_ok
 
-    def _is_fastq_compression_possible(self, compression: CompressionData, sample_id: str) -> bool:
+    def submit_fastq_compression_batch(self, batch: CompressionBatch) -> dict[str, str]:
+        """Submit FASTQ compression of the runs in a batch as one job array per resource group.
+
+        Return the job id of the array task compressing each run, keyed by run name.
+        """
+        job_ids: dict[str, str] = {}
+        for (memory, minutes), compressions in batch.groups.items():
+            LOG.info(
+                f"Submitting {len(compressions)} runs for compression "
+                f"with {memory} GB and {minutes} minutes"
+            )
+            job_ids.update(
+                self.crunchy_api.fastq_to_spring_array(
+                    compression_objects=compressions, memory=memory, minutes=minutes
+                )
+            )
+        return job_ids
+
+    def _is_fastq_compression_possible(
+        self, compression: CompressionData, sample_id: str, are_files_compressible: bool
+    ) -> bool:
         if self._is_spring_archived(compression):
             LOG.debug(f"Found archived Spring file for {sample_id} - compression not possible")
             return False
-        return compression.is_fastq_compression_possible
+        return are_files_compressible
 
     def _is_spring_archived(self, compression_data: CompressionData) -> bool:
         spring_file: File | None = self.hk_api.get_file_insensitive_path(
@@ -2,6 +2,7 @@
 
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from housekeeper.store.models import File, Version
@@ -12,6 +13,7 @@ from cg.constants.compression import (
     FASTQ_DATETIME_DELTA,
     FASTQ_FIRST_READ_SUFFIX,
     FASTQ_SECOND_READ_SUFFIX,
+    FILE_CHECK_WORKERS,
 )
 from cg.models.compression_data import CompressionData
 from cg.store.models import IlluminaSampleSequencingMetrics
@@ -115,6 +117,23 @@ def get_reads_for_run(compression_obj: CompressionData, status_db: Store) -> int
     return metrics.total_reads_in_lane
 
 
+def get_fastq_compression_possible_by_run(
+    compressions: list[CompressionData], max_workers: int = FILE_CHECK_WORKERS
+) -> dict[str, bool]:
+    """Return if the files of each run allow FASTQ compression, keyed by run name.
+    The files of the runs are checked concurrently."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        is_compression_possible: list[bool] = list(
+            executor.map(
+                lambda compression: compression.is_fastq_compression_possible, compressions
+            )
+        )
+    return {
+        compression.run_name: is_possible
+        for compression, is_possible in zip(compressions, is_compression_possible)
+    }
+
+
 def get_fastq_files(sample_id: str, version_obj: Version) -> dict[str, dict]:
     """Get FASTQ files for sample."""
     hk_files_dict = get_hk_files_dict(tags=HK_FASTQ_TAGS, version_obj=version_obj)
@@ -74,6 +74,14 @@ class EncryptionAPI:
         decryption_parameters.extend(output_parameter)
         return decryption_parameters
 
+    def get_symmetric_stream_decryption_command(
+        self, input_file: Path, encryption_key: Path
+    ) -> list[str]:
+        """Generates the gpg command for symmetric decryption to standard output"""
+        decryption_parameters: list = [self.binary_path] + GPGParameters.SYMMETRIC_DECRYPTION.copy()
+        decryption_parameters.extend([str(encryption_key), str(input_file)])
+        return decryption_parameters
+
     def create_pending_file(self, pending_path: Path) -> None:
         """Create a pending flag file."""
         LOG.info(f"Creating pending flag {pending_path}")
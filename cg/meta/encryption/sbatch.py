@@ -12,11 +12,7 @@ ILLUMINA_RUN_ENCRYPT_COMMANDS = """
 
 {asymmetrically_encrypt_passphrase}
 
-{make_tmp_encrypt_dir}
-
-{copy_run_dir_to_tmp}
-
-{tar_encrypt_tmp_dir} | {parallel_gzip} | {tee} | {run_symmetric_encryption}
+{archive_run_dir} | {parallel_gzip} | {tee} | {run_symmetric_encryption}
 
 {run_symmetric_decryption} | {md5sum}
 
@@ -27,6 +23,4 @@ ILLUMINA_RUN_ENCRYPT_COMMANDS = """
 {remove_pending_file}
 
 {flag_as_complete}
-
-{remove_tmp_encrypt_dir}
 """
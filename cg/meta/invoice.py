@@ -26,16 +26,38 @@ class InvoiceAPI:
         self._set_record_type()
         self.genologics_lims: FlaskLims = genologics_lims
         self.invoice_info: InvoiceInfo | None = None
+        self._samples_by_pool: dict[tuple[str, str], list] = {}
 
     def _set_record_type(self):
         """Define the record_type based on the invoice object.
-        It can only be either pool or sample."""
-        if self.invoice_obj.pools:
-            self.raw_records = self.invoice_obj.pools
+        It can only be either pool or sample. The records are fetched with their applications in
+        one query."""
+        if pools := self.db.get_pools_with_applications_by_invoice_id(self.invoice_obj.id):
+            self.raw_records = pools
             self.record_type = RecordType.Pool
-        elif self.invoice_obj.samples:
+        elif samples := self.db.get_samples_with_applications_by_invoice_id(self.invoice_obj.id):
             self.record_type = RecordType.Sample
-            self.raw_records = self.invoice_obj.samples
+            self.raw_records = samples
+
+    def get_pooled_samples(self) -> list:
+        """Return the LIMS samples of all pools in the invoice.
+        Each pool is only expanded once per invoice, also when the report is generated for several
+        cost centers, and the new samples are fetched from LIMS in one batch."""
+        new_samples: list = []
+        for pool in self.raw_records:
+            pool_key: tuple[str, str] = (pool.name, pool.ticket)
+            if pool_key not in self._samples_by_pool:
+                self._samples_by_pool[pool_key] = self.genologics_lims.samples_in_pools(
+                    pool.name, pool.ticket
+                )
+                new_samples += self._samples_by_pool[pool_key]
+        if new_samples:
+            self.genologics_lims.get_batch(new_samples)
+        return [
+            lims_sample
+            for pool in self.raw_records
+            for lims_sample in self._samples_by_pool[(pool.name, pool.ticket)]
+        ]
 
     def get_customer_by_cost_center(self, cost_center: str) -> Customer | str:
         """Return the costumer based on cost center."""
@@ -87,13 +109,9 @@ class InvoiceAPI:
         """Return invoice information as dictionary to generate Excel report."""
 
         records: list[dict] = []
-        pooled_samples = []
+        pooled_samples = self.get_pooled_samples() if self.record_type == RecordType.Pool else []
 
         for raw_record in self.raw_records:
-            if self.record_type == RecordType.Pool:
-                pooled_samples += self.genologics_lims.samples_in_pools(
-                    raw_record.name, raw_record.ticket
-                )
             record = self.get_invoice_entity_record(
                 cost_center=cost_center.lower(),
                 discount=self.invoice_obj.discount,
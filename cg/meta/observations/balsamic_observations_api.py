@@ -173,6 +173,7 @@ class BalsamicObservationsAPI(ObservationsAPI):
         return self.get_loqusdb_api(loqusdb_instance)
 
     def _upload_wgs_case(self, case: Case) -> None:
+        """Upload the case to the somatic and germline Loqusdb instances at the same time."""
         loqusdb_upload_apis: list[LoqusdbAPI] = [
             self.loqusdb_somatic_api,
             self.loqusdb_tumor_api,
@@ -182,18 +183,22 @@ class BalsamicObservationsAPI(ObservationsAPI):
                 LOG.error(f"Case {case.internal_id} has already been uploaded to Loqusdb")
                 raise LoqusdbDuplicateRecordError
         input_files: BalsamicObservationsInputFiles = self.get_observations_input_files(case)
+        loads: list[tuple[LoqusdbAPI, dict]] = []
         for loqusdb_api in loqusdb_upload_apis:
-            self.load_cancer_observations(
+            if load_parameters := self.get_cancer_load_parameters(
                 case=case, input_files=input_files, loqusdb_api=loqusdb_api
-            )
+            ):
+                loads.append((loqusdb_api, load_parameters))
+        self.load_to_instances(case_id=case.internal_id, loads=loads)
         # Update Statusdb with a germline Loqusdb ID
         loqusdb_id: str = str(self.loqusdb_tumor_api.get_case(case_id=case.internal_id)[LOQUSDB_ID])
         self.update_statusdb_loqusdb_id(samples=case.samples, loqusdb_id=loqusdb_id)
 
-    def load_cancer_observations(
+    def get_cancer_load_parameters(
         self, case: Case, input_files: BalsamicObservationsInputFiles, loqusdb_api: LoqusdbAPI
-    ) -> None:
-        """Load cancer observations to a specific Loqusdb API."""
+    ) -> dict | None:
+        """Return the parameters for loading cancer observations to a specific Loqusdb API, or
+        None if the case should not be loaded to it."""
         is_somatic_db: bool = LoqusdbInstance.SOMATIC in str(loqusdb_api.config_path)
         is_paired_analysis: bool = (
             CancerAnalysisType.TUMOR_NORMAL
@@ -201,7 +206,7 @@ class BalsamicObservationsAPI(ObservationsAPI):
         )
         if is_somatic_db:
             if not is_paired_analysis:
-                return
+                return None
             LOG.info("Uploading somatic observations to Loqusdb")
             snv_vcf_path: Path = input_files.snv_vcf_path
             sv_vcf_path: Path = input_files.sv_vcf_path
@@ -209,19 +214,17 @@ class BalsamicObservationsAPI(ObservationsAPI):
             LOG.info("Uploading germline observations to Loqusdb")
             snv_vcf_path: Path = input_files.snv_germline_vcf_path
             sv_vcf_path: Path = input_files.sv_germline_vcf_path if is_paired_analysis else None
-
-        load_output: dict = loqusdb_api.load(
-            case_id=case.internal_id,
-            snv_vcf_path=snv_vcf_path,
-            sv_vcf_path=sv_vcf_path,
-            qual_gq=True,
-            gq_threshold=(
+        return {
+            "case_id": case.internal_id,
+            "snv_vcf_path": snv_vcf_path,
+            "sv_vcf_path": sv_vcf_path,
+            "qual_gq": True,
+            "gq_threshold": (
                 BalsamicLoadParameters.QUAL_THRESHOLD.value
                 if is_somatic_db
                 else BalsamicLoadParameters.QUAL_GERMLINE_THRESHOLD.value
             ),
-        )
-        LOG.info(f"Uploaded {load_output['variants']} variants to {repr(loqusdb_api)}")
+        }
 
     def get_observations_files_from_hk(
         self, hk_version: Version, case_id: str = None
@@ -251,8 +254,7 @@ class BalsamicObservationsAPI(ObservationsAPI):
             if not loqusdb_api.get_case(case_id):
                 LOG.error(f"Case {case_id} could not be found in Loqusdb. Skipping case deletion.")
                 raise CaseNotFoundError
-        for loqusdb_api in loqusdb_apis:
-            loqusdb_api.delete_case(case_id)
+        self.delete_from_instances(case_id=case_id, loqusdb_apis=loqusdb_apis)
         self.update_statusdb_loqusdb_id(samples=case.samples, loqusdb_id=None)
         LOG.info(f"Removed observations for case {case_id} from Loqusdb")
 
@@ -1,6 +1,7 @@
 """Observations API."""
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from housekeeper.store.models import Version
@@ -116,6 +117,48 @@ class ObservationsAPI:
         )
         return bool(loqusdb_case or duplicate or case.loqusdb_uploaded_samples)
 
+    @staticmethod
+    def load_to_instances(case_id: str, loads: list[tuple[LoqusdbAPI, dict]]) -> None:
+        """Load a case to several Loqusdb instances at the same time. If a load fails, the case is
+        removed from the instances it was loaded to and the first error is raised."""
+        if not loads:
+            return
+        with ThreadPoolExecutor(max_workers=len(loads)) as executor:
+            futures: list[tuple[LoqusdbAPI, Future]] = [
+                (loqusdb_api, executor.submit(loqusdb_api.load, **load_parameters))
+                for loqusdb_api, load_parameters in loads
+            ]
+        loaded_apis: list[LoqusdbAPI] = []
+        errors: list[Exception] = []
+        for loqusdb_api, future in futures:
+            try:
+                load_output: dict = future.result()
+            except Exception as error:
+                LOG.error(f"Could not upload case {case_id} to {repr(loqusdb_api)}: {error}")
+                errors.append(error)
+                continue
+            LOG.info(f"Uploaded {load_output['variants']} variants to {repr(loqusdb_api)}")
+            loaded_apis.append(loqusdb_api)
+        if not errors:
+            return
+        for loqusdb_api in loaded_apis:
+            LOG.warning(f"Removing case {case_id} from {repr(loqusdb_api)} after failed upload")
+            try:
+                loqusdb_api.delete_case(case_id)
+            except Exception as error:
+                LOG.error(f"Could not remove case {case_id} from {repr(loqusdb_api)}: {error}")
+        raise errors[0]
+
+    @staticmethod
+    def delete_from_instances(case_id: str, loqusdb_apis: list[LoqusdbAPI]) -> None:
+        """Delete a case from several Loqusdb instances at the same time."""
+        with ThreadPoolExecutor(max_workers=max(len(loqusdb_apis), 1)) as executor:
+            futures: list[Future] = [
+                executor.submit(loqusdb_api.delete_case, case_id) for loqusdb_api in loqusdb_apis
+            ]
+        for future in futures:
+            future.result()
+
     def update_statusdb_loqusdb_id(self, samples: list[Sample], loqusdb_id: str | None) -> None:
         """Update Loqusdb ID field in StatusDB for each of the provided samples."""
         for sample in samples:
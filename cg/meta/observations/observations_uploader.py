@@ -0,0 +1,36 @@
+"""Concurrent upload of observations from several cases to Loqusdb."""
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from cg.meta.observations.observations_api import ObservationsAPI
+from cg.utils.sessions import remove_thread_sessions
+
+LOG = logging.getLogger(__name__)
+
+
+def upload_observations(
+    observations_apis: dict[str, ObservationsAPI], max_workers: int
+) -> dict[str, Exception]:
+    """Upload the observations of several cases at the same time, each thread with its own
+    database sessions. Return the errors of the cases that could not be uploaded."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        uploads: dict[str, Future] = {
+            case_id: executor.submit(_upload_case, observations_api, case_id)
+            for case_id, observations_api in observations_apis.items()
+        }
+    errors: dict[str, Exception] = {}
+    for case_id, upload in uploads.items():
+        try:
+            upload.result()
+        except Exception as error:
+            errors[case_id] = error
+    return errors
+
+
+def _upload_case(observations_api: ObservationsAPI, case_id: str) -> None:
+    LOG.info(f"Uploading observations for {case_id}")
+    try:
+        observations_api.upload(case_id)
+    finally:
+        remove_thread_sessions()
@@ -38,6 +38,38 @@ class TarAPI:
             extraction_parameters.append("--strip-components=6")
         return extraction_parameters
 
-    def get_compress_cmd(self, input_path: Path) -> str:
-        """Return compression command of input path."""
-        return " ".join([self.binary_path, "-cf", "-", input_path.as_posix()])
+    def get_extract_stream_command(
+        self, output_dir: Path, is_current: bool, decompression_program: str | None = None
+    ) -> list[str]:
+        """Generates the Tar command for extracting a gzipped flow cell run directory archive read
+        from standard input. A parallel decompression program, like pigz, can be given."""
+        extraction_parameters: list[str] = [self.binary_path, "-x", "-f", "-"]
+        extraction_parameters.append(
+            f"--use-compress-program={decompression_program}" if decompression_program else "--gzip"
+        )
+        extraction_parameters.extend(FlowCellExtractionParameters.EXCLUDE_FILES.copy())
+        extraction_parameters.extend(FlowCellExtractionParameters.CHANGE_TO_DIR.copy())
+        extraction_parameters.append(str(output_dir))
+        if is_current:
+            extraction_parameters.append("--strip-components=6")
+        return extraction_parameters
+
+    def get_compress_in_place_cmd(
+        self, input_path: Path, member_prefix: Path, exclude_patterns: list[str] | None = None
+    ) -> str:
+        """Return compression command of input path, archived in place with member names as if the
+        input path was located in the member prefix directory. Tar exits with an error if a file
+        changes while being read, so a successful archive is a consistent snapshot."""
+        exclude_parameters: list[str] = [
+            f"--exclude={pattern}" for pattern in exclude_patterns or []
+        ]
+        return " ".join(
+            [self.binary_path, "-cf", "-"]
+            + exclude_parameters
+            + [
+                f"--transform=s,^,{member_prefix.as_posix().lstrip('/')}/,S",
+                "-C",
+                input_path.parent.as_posix(),
+                input_path.name,
+            ]
+        )
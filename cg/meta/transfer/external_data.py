@@ -11,6 +11,8 @@ from cg.meta.meta import MetaAPI
 from cg.meta.transfer.utils import are_all_fastq_valid
 from cg.models.cg_config import CGConfig
 from cg.models.slurm.sbatch import Sbatch
+from cg.services.checksum_service.checksum_service import ChecksumService
+from cg.services.checksum_service.models import FileDigest
 from cg.services.deliver_files.rsync.sbatch_commands import (
     ERROR_RSYNC_FUNCTION,
     RSYNC_CONTENTS_COMMAND,
@@ -63,6 +65,12 @@ class ExternalDataAPI(MetaAPI):
         """Returns the path to where the files are to be transferred."""
         return Path(self.destination_path_stub % self.customer_id, lims_sample_id)
 
+    def _get_checksum_cache_path(self) -> Path | None:
+        """Return the path of the checksum cache for the ticket, unless this is a dry run."""
+        if self.dry_run:
+            return None
+        return Path(self.base_path, f"{self.ticket}_external_data_checksums{FileExtensions.JSON}")
+
     def transfer_sample_files_from_source(self, ticket: str, dry_run: bool = False) -> None:
         """Transfers all sample files on given ticket, from source to destination."""
         self._set_parameters(ticket=ticket, dry_run=dry_run)
@@ -160,16 +168,25 @@ class ExternalDataAPI(MetaAPI):
         return fastq_paths_to_add
 
     def _add_and_include_files_to_bundles(
-        self, fastq_paths: list[Path], lims_sample_id: str
+        self,
+        fastq_paths: list[Path],
+        lims_sample_id: str,
+        digests: dict[Path, FileDigest] | None = None,
     ) -> None:
-        """Add the given fastq files to the the Housekeeper bundle."""
+        """Add the given fastq files to the the Housekeeper bundle, with the sha1 checksums from
+        the given digests."""
         if self.dry_run:
             LOG.info(f"No files will be added for sample {lims_sample_id} since this is a dry-run")
             return
+        digests: dict[Path, FileDigest] = digests or {}
         for path in fastq_paths:
             LOG.info(f"Adding path {path} to bundle {lims_sample_id} in Housekeeper")
+            digest: FileDigest | None = digests.get(path)
             self.housekeeper_api.add_and_include_file_to_latest_version(
-                bundle_name=lims_sample_id, file=path, tags=HK_FASTQ_TAGS
+                bundle_name=lims_sample_id,
+                file=path,
+                tags=HK_FASTQ_TAGS,
+                checksum=digest.sha1 if digest else None,
             )
 
     def _start_cases(self, cases: list[Case] | None) -> None:
@@ -198,15 +215,30 @@ class ExternalDataAPI(MetaAPI):
             f"Adding fastq files to Housekeeper for ticket {self.ticket} of customer {self.customer_id}"
         )
         available_sample_ids: list[str] = self._get_available_sample_ids()
-        for sample_id in available_sample_ids:
-            fastq_paths_to_add: list[Path] = self._get_fastq_paths_to_add(sample_id=sample_id)
+        fastq_paths_per_sample: dict[str, list[Path]] = {
+            sample_id: self._get_fastq_paths_to_add(sample_id=sample_id)
+            for sample_id in available_sample_ids
+        }
+        checksum_service = ChecksumService(cache_path=self._get_checksum_cache_path())
+        digests: dict[Path, FileDigest] = checksum_service.get_digests(
+            [
+                path
+                for fastq_paths in fastq_paths_per_sample.values()
+                for path in fastq_paths
+                if path.exists()
+            ]
+        )
+        for sample_id, fastq_paths_to_add in fastq_paths_per_sample.items():
             if not fastq_paths_to_add:
                 LOG.info(f"Did not find any fastq file to add for sample {sample_id}, skipping")
                 continue
-            if are_all_fastq_valid(fastq_paths=fastq_paths_to_add):
+            if are_all_fastq_valid(
+                fastq_paths=fastq_paths_to_add, checksum_service=checksum_service
+            ):
                 self._add_and_include_files_to_bundles(
                     fastq_paths=fastq_paths_to_add,
                     lims_sample_id=sample_id,
+                    digests=digests,
                 )
                 self._start_cases(
                     cases=self.status_db.get_not_analysed_cases_by_sample_internal_id(
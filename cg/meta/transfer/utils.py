@@ -1,16 +1,17 @@
 import logging
 from pathlib import Path
 
-from cg.utils.checksum.checksum import is_md5sum_correct
+from cg.services.checksum_service.checksum_service import ChecksumService
 
 LOG = logging.getLogger(__name__)
 
 
-def are_all_fastq_valid(fastq_paths: list[Path]) -> bool:
+def are_all_fastq_valid(
+    fastq_paths: list[Path], checksum_service: ChecksumService | None = None
+) -> bool:
     """Return True if all fastq files of a given sample pass md5 checksum."""
-    are_all_valid: bool = True
-    for path in fastq_paths:
-        if not is_md5sum_correct(path):
-            are_all_valid = False
-            LOG.warning(f"Sample {path} did not match the given md5sum")
-    return are_all_valid
+    checksum_service: ChecksumService = checksum_service or ChecksumService()
+    invalid_paths: list[Path] = checksum_service.get_files_with_incorrect_md5sum(fastq_paths)
+    for path in invalid_paths:
+        LOG.warning(f"Sample {path} did not match the given md5sum")
+    return not invalid_paths
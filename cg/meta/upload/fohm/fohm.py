@@ -4,6 +4,7 @@ import logging
 import os
 import re
 from pathlib import Path
+from typing import Iterator
 
 import paramiko
 
@@ -13,7 +14,7 @@ from cg.constants import FileExtensions
 from cg.constants.constants import SARS_COV_REGEX, DataDelivery
 from cg.constants.housekeeper_tags import FohmTag
 from cg.exc import CgError
-from cg.io.csv import read_csv, write_csv_from_dict
+from cg.io.csv import iterate_csv, write_csv_from_dict
 from cg.models.cg_config import CGConfig
 from cg.models.email import EmailInfo
 from cg.models.fohm.reports import FohmComplementaryReport, FohmPangolinReport
@@ -108,16 +109,10 @@ class FOHMUploadAPI:
         return self._dry_run
 
     @staticmethod
-    def get_reports_contents(file_paths: list[Path]) -> list[dict]:
-        """Return a list of dicts with all CSV files reports."""
-        csv_reports = [
-            read_csv(file_path=file_path, read_to_dict=True, ignore_suffix=True)
-            for file_path in file_paths
-        ]
-        reports: list[dict] = []
-        for report in csv_reports:
-            reports.extend(iter(report))
-        return reports
+    def iterate_reports_contents(file_paths: list[Path]) -> Iterator[dict]:
+        """Yield the rows of all CSV file reports, reading one row at a time."""
+        for file_path in file_paths:
+            yield from iterate_csv(file_path=file_path, read_to_dict=True, ignore_suffix=True)
 
     @staticmethod
     def validate_fohm_complementary_reports(reports: list[dict]) -> list[FohmComplementaryReport]:
@@ -340,9 +335,8 @@ class FOHMUploadAPI:
 
     def parse_and_write_complementary_report(self) -> list[FohmComplementaryReport]:
         """Parse and write a complementary report."""
-        complementary_reports_raw: list[dict] = self.get_reports_contents(self.daily_reports_list)
         unique_complementary_reports_raw: list[dict] = remove_duplicate_dicts(
-            complementary_reports_raw
+            self.iterate_reports_contents(self.daily_reports_list)
         )
         sars_cov_complementary_reports: list[FohmComplementaryReport] = (
             self.validate_fohm_complementary_reports(unique_complementary_reports_raw)
@@ -357,8 +351,9 @@ class FOHMUploadAPI:
 
     def parse_and_write_pangolin_report(self) -> list[FohmPangolinReport]:
         """Create and write a Pangolin report."""
-        pangolin_reports_raw: list[dict] = self.get_reports_contents(self.daily_pangolin_list)
-        unique_pangolin_reports_raw: list[dict] = remove_duplicate_dicts(pangolin_reports_raw)
+        unique_pangolin_reports_raw: list[dict] = remove_duplicate_dicts(
+            self.iterate_reports_contents(self.daily_pangolin_list)
+        )
         sars_cov_pangolin_reports: list[FohmPangolinReport] = self.validate_fohm_pangolin_reports(
             unique_pangolin_reports_raw
         )
@@ -2,10 +2,12 @@
 
 import csv
 import logging
+import os
 import re
 import tempfile
-from collections.abc import ValuesView
+from contextlib import contextmanager
 from pathlib import Path
+from typing import IO, Iterable, Iterator
 
 from housekeeper.store.models import File
 
@@ -58,34 +60,48 @@ class GisaidAPI:
             raise HousekeeperFileMissingError(message=msg)
         return completion_file
 
-    def get_completion_dict(self, completion_file: File):
-        """Read completion file in to dictionary similar to a pandas dataframe and drop duplicates"""
+    @staticmethod
+    def _get_completion_reader(file) -> csv.DictReader:
+        csv_reader: csv.DictReader = csv.DictReader(file)
+        if not csv_reader.fieldnames:
+            raise CgError(f"{file.name} is malformed.")
+        return csv_reader
+
+    @staticmethod
+    def _get_unique_rows(rows: Iterable[dict[str, str]]) -> Iterator[dict[str, str]]:
+        """Yield the rows in order, skipping rows that are identical to an earlier row."""
+        seen_rows: set[tuple] = set()
+        for row in rows:
+            row_key: tuple = tuple(row.items())
+            if row_key in seen_rows:
+                continue
+            seen_rows.add(row_key)
+            yield row
+
+    def get_completion_rows(self, completion_file: File) -> Iterator[dict[str, str]]:
+        """Yield the unique SARS-CoV-2 rows of the completion file without reading the whole
+        file into memory."""
         with open(Path(completion_file.full_path), "r") as file:
-            csv_reader: csv.DictReader = csv.DictReader(file)
-            if not csv_reader.fieldnames:
-                raise CgError(f"{completion_file.full_path} is malformed.")
-
-            deduplicated_csv: ValuesView = {tuple(row.items()): row for row in csv_reader}.values()
-            completion_dict: dict = {field: {} for field in csv_reader.fieldnames}
-
-            for i, row in enumerate(deduplicated_csv):
-                if not re.match(SARS_COV_REGEX, row["provnummer"]):
-                    continue
-                for key, value in row.items():
-                    completion_dict[key][i] = value
-
-        return completion_dict
+            for row in self._get_unique_rows(self._get_completion_reader(file)):
+                if re.match(SARS_COV_REGEX, row["provnummer"]):
+                    yield row
 
     def get_gisaid_sample_list(self, case_id: str) -> list[Sample]:
         """Get list of Sample objects eligeble for upload.
         The criteria is that the sample reached 20x coverage for >95% bases.
-        The sample will be included in completion file."""
+        The sample will be included in completion file.
+        Raises:
+            CgError if a sample in the completion file is not in StatusDB."""
 
         completion_file = self.get_completion_file_from_hk(case_id=case_id)
-        completion_dict = self.get_completion_dict(completion_file=completion_file)
         # deduplicate by provnummer and preserve order to match legacy pandas unique()
-        sample_names = list(dict.fromkeys(completion_dict["provnummer"].values()))
-        return [self.status_db.get_sample_by_name(name=sample_name) for sample_name in sample_names]
+        sample_names: list[str] = list(
+            dict.fromkeys(row["provnummer"] for row in self.get_completion_rows(completion_file))
+        )
+        samples_by_name: dict[str, Sample] = self.status_db.get_samples_by_names(sample_names)
+        if missing_names := [name for name in sample_names if name not in samples_by_name]:
+            raise CgError(f"Samples {', '.join(missing_names)} not found in StatusDB")
+        return [samples_by_name[sample_name] for sample_name in sample_names]
 
     def get_gisaid_fasta_path(self, case_id: str) -> Path:
         """Get path to gisaid fasta"""
@@ -137,8 +153,7 @@ class GisaidAPI:
         else:
             gisaid_fasta_path: Path = self.get_gisaid_fasta_path(case_id=case_id)
 
-        fasta_lines: list[str] = []
-
+        consensus_files: list[tuple[GisaidSample, File]] = []
         for sample in gisaid_samples:
             fasta_file: File = self.housekeeper_api.get_file_from_latest_version(
                 bundle_name=case_id, tags=[sample.cg_lims_id, "consensus-sample"]
@@ -147,15 +162,16 @@ class GisaidAPI:
                 raise HousekeeperFileMissingError(
                     message=f"No fasta file found for sample {sample.cg_lims_id}"
                 )
-            with open(str(fasta_file.full_path)) as handle:
-                for line in handle.readlines():
-                    if line[0] == ">":
-                        fasta_lines.append(f">{sample.covv_virus_name}\n")
-                    else:
-                        fasta_lines.append(line)
+            consensus_files.append((sample, fasta_file))
 
-        with open(gisaid_fasta_path, "w") as write_file_obj:
-            write_file_obj.writelines(fasta_lines)
+        with self._open_for_replacement(Path(gisaid_fasta_path)) as write_file_obj:
+            for sample, fasta_file in consensus_files:
+                with open(str(fasta_file.full_path)) as handle:
+                    for line in handle:
+                        if line[0] == ">":
+                            write_file_obj.write(f">{sample.covv_virus_name}\n")
+                        else:
+                            write_file_obj.write(line)
 
         if gisaid_fasta_file:
             return
@@ -316,27 +332,34 @@ class GisaidAPI:
         """Update completion file with accession numbers"""
         completion_file = self.get_completion_file_from_hk(case_id=case_id)
         accession_dict = self.get_accession_numbers(case_id=case_id)
-        completion_dict = self.get_completion_dict(completion_file=completion_file)
-
-        for index, completion_provnummer in completion_dict["provnummer"].items():
-            new_value = accession_dict[completion_provnummer]
-            completion_dict["GISAID_accession"][index] = new_value
-
-        fieldnames = list(completion_dict.keys())
-        indices = list(next(iter(completion_dict.values())).keys())
-        rows = [{col: completion_dict[col][i] for col in fieldnames} for i in indices]
+        with open(Path(completion_file.full_path), "r") as file:
+            fieldnames: list[str] = list(self._get_completion_reader(file).fieldnames)
 
-        with open(completion_file.full_path, "w", newline="") as csv_file:
+        with self._open_for_replacement(Path(completion_file.full_path), newline="") as csv_file:
             writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
             writer.writeheader()
-            writer.writerows(rows)
+            for row in self.get_completion_rows(completion_file):
+                row["GISAID_accession"] = accession_dict[row["provnummer"]]
+                writer.writerow(row)
+
+    @staticmethod
+    @contextmanager
+    def _open_for_replacement(file_path: Path, newline: str | None = None) -> Iterator[IO[str]]:
+        """Open a temporary file next to the given file and move it in place once it is written,
+        so that the file is never left partially written."""
+        temporary_path = Path(file_path.parent, f".{file_path.name}.tmp")
+        try:
+            with open(temporary_path, "w", newline=newline) as temporary_file:
+                yield temporary_file
+            os.replace(temporary_path, file_path)
+        finally:
+            temporary_path.unlink(missing_ok=True)
 
     def upload(self, case_id: str) -> None:
         """Uploading results to gisaid and saving the accession numbers in completion file"""
 
         completion_file = self.get_completion_file_from_hk(case_id=case_id)
-        completion_dict = self.get_completion_dict(completion_file=completion_file)
-        if self._all_samples_uploaded_dict(completion_dict):
+        if self._are_all_samples_uploaded(completion_file):
             LOG.info("All samples already uploaded")
             return
 
@@ -344,11 +367,7 @@ class GisaidAPI:
         self.upload_results_to_gisaid(case_id=case_id)
         self.update_completion_file(case_id=case_id)
 
-    def _all_samples_uploaded_dict(self, completion_dict: dict) -> bool:
-        if not completion_dict["provnummer"]:
-            return True
-
-        accession_values = [
-            value for value in completion_dict["GISAID_accession"].values() if value
-        ]
-        return len(accession_values) == len(completion_dict["provnummer"])
+    def _are_all_samples_uploaded(self, completion_file: File) -> bool:
+        """Return whether all SARS-CoV-2 rows of the completion file have an accession. Reading
+        stops at the first row without one."""
+        return all(row["GISAID_accession"] for row in self.get_completion_rows(completion_file))
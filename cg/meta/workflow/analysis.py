@@ -446,8 +446,10 @@ class AnalysisAPI(MetaAPI):
             return
 
         LOG.info(f"Concatenation in progress for sample: {sample.internal_id}")
-        for read, value in linked_reads_paths.items():
-            self.fastq_handler.concatenate(linked_reads_paths[read], concatenated_paths[read])
+        self.fastq_handler.concatenate_reads(
+            linked_reads_paths=linked_reads_paths, concatenated_paths=concatenated_paths
+        )
+        for value in linked_reads_paths.values():
             self.fastq_handler.remove_files(value)
 
     def get_target_bed_from_lims(self, case_id: str) -> str | None:
@@ -11,7 +11,7 @@ import gzip
 import logging
 import os
 import re
-import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from cg.apps.housekeeper.hk import HousekeeperAPI
@@ -21,6 +21,7 @@ from cg.io.gzip import read_gzip_first_line
 from cg.models.fastq import FastqFileMeta, GetFastqFileMeta
 from cg.store.models import Case, Sample
 from cg.store.store import Store
+from cg.utils.files import concatenate_files
 
 LOG = logging.getLogger(__name__)
 
@@ -92,19 +93,27 @@ class FastqHandler:
         """Concatenates a list of fastq files"""
         LOG.info(FastqHandler.display_files(files, concat_file))
 
-        with open(concat_file, "wb") as write_file_obj:
-            for filename in files:
-                with open(filename, "rb") as file_descriptor:
-                    shutil.copyfileobj(file_descriptor, write_file_obj)
-
-        size_before = FastqHandler.size_before(files)
-        size_after = FastqHandler.size_after(concat_file)
+        size_before: int = FastqHandler.size_before(files)
+        size_after: int = concatenate_files(
+            input_files=[Path(file) for file in files], output_file=Path(concat_file)
+        )
 
         try:
             FastqHandler.assert_file_sizes(size_before, size_after)
         except AssertionError as error:
             LOG.warning(error)
 
+    @staticmethod
+    def concatenate_reads(linked_reads_paths: dict[int, list], concatenated_paths: dict[int, str]):
+        """Concatenates the fastq files of all read directions concurrently."""
+        with ThreadPoolExecutor(max_workers=max(len(linked_reads_paths), 1)) as executor:
+            concatenations: list[Future] = [
+                executor.submit(FastqHandler.concatenate, files, concatenated_paths[read])
+                for read, files in linked_reads_paths.items()
+            ]
+            for concatenation in concatenations:
+                concatenation.result()
+
     @staticmethod
     def size_before(files) -> int:
         """Returns the total size of the linked fastq files before concatenation"""
@@ -49,22 +49,29 @@ class MicroSALTQualityController:
         return QualityResult(case=case_result, samples=sample_results, summary=summary)
 
     def quality_control_samples(self, quality_metrics: QualityMetrics) -> list[SampleQualityResult]:
+        """Perform a quality control of all samples in the metrics. The samples are fetched with
+        their applications in one query."""
+        samples: dict[str, Sample] = self.status_db.get_samples_with_applications_by_internal_ids(
+            list(quality_metrics.samples)
+        )
         sample_results: list[SampleQualityResult] = []
         for sample_id, metrics in quality_metrics.samples.items():
-            result = self.quality_control_sample(sample_id=sample_id, metrics=metrics)
+            if sample_id not in samples:
+                # Raises an error for samples missing from StatusDB
+                samples[sample_id] = self.status_db.get_sample_by_internal_id_strict(sample_id)
+            result = self.quality_control_sample(sample=samples[sample_id], metrics=metrics)
             sample_results.append(result)
         return sample_results
 
-    def quality_control_sample(self, sample_id: str, metrics: SampleMetrics) -> SampleQualityResult:
+    def quality_control_sample(self, sample: Sample, metrics: SampleMetrics) -> SampleQualityResult:
         """Perform a quality control of a sample given its metrics."""
-        valid_read_count: bool = self.has_valid_total_reads(sample_id)
+        sample_id: str = sample.internal_id
+        valid_read_count: bool = self.has_sample_valid_total_reads(sample)
         valid_mapping: bool = has_valid_mapping_rate(metrics)
         valid_duplication: bool = has_valid_duplication_rate(metrics)
         valid_inserts: bool = has_valid_median_insert_size(metrics)
         valid_coverage: bool = has_valid_average_coverage(metrics)
         valid_10x_coverage: bool = has_valid_10x_coverage(metrics)
-
-        sample: Sample = self.status_db.get_sample_by_internal_id_strict(sample_id)
         application_tag: str = get_application_tag(sample)
 
         if is_control := is_sample_negative_control(sample):
@@ -113,8 +120,8 @@ class MicroSALTQualityController:
             LOG.warning(f"Skipping QC, report {qc_done_path} already exists.")
         return not qc_done_path.exists()
 
-    def has_valid_total_reads(self, sample_id: str) -> bool:
-        sample: Sample = self.status_db.get_sample_by_internal_id_strict(sample_id)
+    @staticmethod
+    def has_sample_valid_total_reads(sample: Sample) -> bool:
         target_reads: int = get_sample_target_reads(sample)
         percent_reads_guaranteed: int = get_percent_reads_guaranteed(sample)
         sample_reads: int = cast(int, sample.reads)
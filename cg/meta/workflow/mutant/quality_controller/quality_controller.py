@@ -229,10 +229,13 @@ class MutantQualityController:
         return self.status_db.get_sample_by_internal_id(internal_id=internal_negative_control_id)
 
     def _get_mutant_pool_samples(self, case: Case) -> MutantPoolSamples:
+        """Return the samples of the pool sequenced in a case. The case samples are fetched with
+        their applications in one query, and the internal negative control is resolved once for
+        the whole pool."""
         samples = []
         external_negative_control = None
 
-        for sample in case.samples:
+        for sample in self.status_db.get_samples_with_applications_by_case_id(case.internal_id):
             if sample.is_negative_control:
                 external_negative_control = sample
                 continue
@@ -108,16 +108,9 @@ class NalloAnalysisAPI(NfAnalysisAPI):
     def get_nallo_multiqc_json_metrics(self, case_id: str) -> list[MetricsBase]:
         """Return a list of the Nallo metrics specified in a MultiQC json file."""
         multiqc_json: MultiqcDataJson = self.get_multiqc_data_json(case_id=case_id)
-        metrics = []
-
-        for pattern in self.get_multiqc_search_patterns(case_id):
-            metrics_for_pattern: list[MetricsBase] = self.get_multiqc_metrics_for_sample(
-                search_pattern=pattern.pattern,
-                multiqc_json=multiqc_json,
-                sample_id=pattern.sample_id,
-                exact_match=self.is_multiqc_pattern_search_exact,
-            )
-            metrics.extend(metrics_for_pattern)
+        metrics: list[MetricsBase] = self.get_multiqc_metrics_for_search_patterns(
+            case_id=case_id, multiqc_json=multiqc_json
+        )
         for sample_id in self.status_db.get_sample_ids_by_case_id(case_id):
             if raw_metric := self.get_nallo_raw_metric(
                 sample_id=sample_id,
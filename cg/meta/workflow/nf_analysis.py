@@ -12,9 +12,9 @@ from cg.constants.constants import FileExtensions, FileFormat, GenomeVersion, Mu
 from cg.constants.tb import AnalysisStatus
 from cg.exc import CgError, HousekeeperStoreError, MetricsQCError
 from cg.io.controller import ReadFile, WriteFile
-from cg.io.json import read_json
 from cg.io.yaml import read_yaml
 from cg.meta.workflow.analysis import AnalysisAPI
+from cg.meta.workflow.utils.multiqc_index import MultiqcMetricsIndex
 from cg.models.analysis import NextflowAnalysis
 from cg.models.cg_config import CGConfig
 from cg.models.deliverables.metric_deliverables import (
@@ -47,6 +47,7 @@ class NfAnalysisAPI(AnalysisAPI):
         self.pipeline_deliverables: Path | None = None
         self.platform: str | None = None
         self.profile: str | None = None
+        self.qc_conditions_by_sample: dict[str, dict] = {}
         self.references: str | None = None
         self.resources: str | None = None
         self.revision: str | None = None
@@ -194,57 +195,71 @@ class NfAnalysisAPI(AnalysisAPI):
         return deduplicated_metrics
 
     def get_multiqc_data_json(self, case_id: str) -> MultiqcDataJson:
-        return MultiqcDataJson(**read_json(file_path=self.get_multiqc_json_path(case_id=case_id)))
+        """Return the MultiQC data of a case, decoded and validated in a single pass."""
+        return MultiqcDataJson.model_validate_json(
+            self.get_multiqc_json_path(case_id=case_id).read_bytes()
+        )
 
     def get_multiqc_json_metrics(self, case_id: str) -> list[MetricsBase]:
         """Return a list of the metrics specified in a MultiQC json file."""
         multiqc_json: MultiqcDataJson = self.get_multiqc_data_json(case_id=case_id)
-        metrics = []
+        metrics: list[MetricsBase] = self.get_multiqc_metrics_for_search_patterns(
+            case_id=case_id, multiqc_json=multiqc_json
+        )
+        metrics = self.get_deduplicated_metrics(metrics=metrics)
+        return metrics
+
+    def get_multiqc_metrics_for_search_patterns(
+        self, case_id: str, multiqc_json: MultiqcDataJson
+    ) -> list[MetricsBase]:
+        """Return the metrics of all search patterns of a case, indexing the MultiQC general
+        statistics once and fetching the QC conditions once per sample."""
+        self.qc_conditions_by_sample.clear()
+        multiqc_index = MultiqcMetricsIndex(self._get_list_of_metric_dicts(multiqc_json))
+        metrics: list[MetricsBase] = []
         for pattern in self.get_multiqc_search_patterns(case_id=case_id):
             metrics_for_pattern: list[MetricsBase] = self.get_multiqc_metrics_for_sample(
                 search_pattern=pattern.pattern,
                 multiqc_json=multiqc_json,
                 sample_id=pattern.sample_id,
                 exact_match=self.is_multiqc_pattern_search_exact,
+                multiqc_index=multiqc_index,
             )
             metrics.extend(metrics_for_pattern)
-        metrics = self.get_deduplicated_metrics(metrics=metrics)
         return metrics
 
-    @staticmethod
-    def _is_pattern_found(pattern: str, text: str, exact_match: bool) -> bool:
-        if exact_match:
-            is_pattern_found: bool = pattern == text
-        else:
-            is_pattern_found: bool = pattern in text
-        return is_pattern_found
-
     def get_multiqc_metrics_for_sample(
         self,
         search_pattern: str,
         multiqc_json: MultiqcDataJson,
         sample_id: str,
         exact_match: bool = False,
+        multiqc_index: MultiqcMetricsIndex | None = None,
     ) -> list[MetricsBase]:
         """Parse a MultiqcDataJson and returns a list of metrics."""
+        if not multiqc_index:
+            multiqc_index = MultiqcMetricsIndex(self._get_list_of_metric_dicts(multiqc_json))
         metrics: list[MetricsBase] = []
-        list_of_metric_dicts: list[dict[str, Any]] = self._get_list_of_metric_dicts(multiqc_json)
-
-        for section in list_of_metric_dicts:
-            for subsection, metrics_dict in section.items():
-                if self._is_pattern_found(
-                    pattern=search_pattern, text=subsection, exact_match=exact_match
-                ):
-                    for metric_name, metric_value in metrics_dict.items():
-                        metric: MetricsBase = self.get_multiqc_metric(
-                            metric_name=metric_name, metric_value=metric_value, sample_id=sample_id
-                        )
-                        metrics.append(metric)
+        for metrics_dict in multiqc_index.get_metrics_dicts(
+            pattern=search_pattern, exact_match=exact_match
+        ):
+            for metric_name, metric_value in metrics_dict.items():
+                metric: MetricsBase = self.get_multiqc_metric(
+                    metric_name=metric_name, metric_value=metric_value, sample_id=sample_id
+                )
+                metrics.append(metric)
         return metrics
 
     def _get_list_of_metric_dicts(self, multiqc_json: MultiqcDataJson) -> list[dict[str, Any]]:
         return multiqc_json.report_general_stats_data
 
+    def get_memoized_qc_conditions(self, sample_id: str) -> dict:
+        """Return the workflow metric conditions for a sample, fetching them once per collection
+        of metrics."""
+        if sample_id not in self.qc_conditions_by_sample:
+            self.qc_conditions_by_sample[sample_id] = self.get_qc_conditions_for_workflow(sample_id)
+        return self.qc_conditions_by_sample[sample_id]
+
     def get_multiqc_metric(
         self, metric_name: str, metric_value: str | int | float, sample_id: str
     ) -> MetricsBase:
@@ -256,7 +271,7 @@ class NfAnalysisAPI(AnalysisAPI):
             name=metric_name,
             step=MultiQC.MULTIQC,
             value=metric_value,
-            condition=self.get_qc_conditions_for_workflow(sample_id).get(metric_name, None),
+            condition=self.get_memoized_qc_conditions(sample_id).get(metric_name, None),
         )
 
     @staticmethod
@@ -102,15 +102,9 @@ class RarediseaseAnalysisAPI(NfAnalysisAPI):
     def get_raredisease_multiqc_json_metrics(self, case_id: str) -> list[MetricsBase]:
         """Return a list of the metrics specified in a MultiQC json file."""
         multiqc_json: MultiqcDataJson = self.get_multiqc_data_json(case_id=case_id)
-        metrics = []
-        for pattern in self.get_multiqc_search_patterns(case_id=case_id):
-            metrics_for_pattern: list[MetricsBase] = self.get_multiqc_metrics_for_sample(
-                search_pattern=pattern.pattern,
-                multiqc_json=multiqc_json,
-                sample_id=pattern.sample_id,
-                exact_match=self.is_multiqc_pattern_search_exact,
-            )
-            metrics.extend(metrics_for_pattern)
+        metrics: list[MetricsBase] = self.get_multiqc_metrics_for_search_patterns(
+            case_id=case_id, multiqc_json=multiqc_json
+        )
         for sample_pair in self._get_sample_pair_patterns(case_id):
             if parent_error_metric := self.get_parent_error_ped_check_metric(
                 pair_sample_ids=sample_pair, multiqc_raw_data=multiqc_json.report_saved_raw_data
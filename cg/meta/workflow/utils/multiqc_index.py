@@ -0,0 +1,45 @@
+"""Index of the general statistics in a MultiQC report."""
+
+from typing import Any
+
+
+class MultiqcMetricsIndex:
+    """Index the subsections of the MultiQC general statistics sections once per case, so that
+    the metrics of each sample can be looked up without scanning every section.
+
+    Subsections are returned in the order they appear in the report, which keeps the first metric
+    when the same metric is reported by several sections.
+    """
+
+    def __init__(self, metric_dicts: list[dict[str, Any]]):
+        self.subsections: list[tuple[str, dict[str, Any]]] = [
+            (subsection, metrics_dict)
+            for section in metric_dicts
+            for subsection, metrics_dict in section.items()
+        ]
+        self.positions_by_subsection: dict[str, list[int]] = {}
+        for position, (subsection, _) in enumerate(self.subsections):
+            self.positions_by_subsection.setdefault(subsection, []).append(position)
+        self._positions_by_substring: dict[str, list[int]] = {}
+
+    def _get_positions_containing(self, pattern: str) -> list[int]:
+        """Return the positions of the subsections containing the pattern. Each distinct
+        subsection name is only searched once per pattern."""
+        if pattern not in self._positions_by_substring:
+            self._positions_by_substring[pattern] = sorted(
+                position
+                for subsection, positions in self.positions_by_subsection.items()
+                if pattern in subsection
+                for position in positions
+            )
+        return self._positions_by_substring[pattern]
+
+    def get_metrics_dicts(self, pattern: str, exact_match: bool = False) -> list[dict[str, Any]]:
+        """Return the metrics of the subsections matching the pattern. Without exact match, the
+        pattern must be present in the subsection name but does not need to be equal to it."""
+        positions: list[int] = (
+            self.positions_by_subsection.get(pattern, [])
+            if exact_match
+            else self._get_positions_containing(pattern)
+        )
+        return [self.subsections[position][1] for position in positions]
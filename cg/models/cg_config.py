@@ -14,6 +14,7 @@ from cg.apps.housekeeper.hk import HousekeeperAPI
 from cg.apps.lims import LimsAPI
 from cg.apps.loqus import LoqusdbAPI
 from cg.apps.madeline.api import MadelineAPI
+from cg.apps.scout.export_cache import ScoutExportCache
 from cg.apps.scout.scoutapi import ScoutAPI
 from cg.apps.tb import TrailblazerAPI
 from cg.clients.arnold.api import ArnoldAPIClient
@@ -21,6 +22,7 @@ from cg.clients.chanjo2.client import Chanjo2APIClient
 from cg.clients.janus.api import JanusAPIClient
 from cg.constants.observations import BalsamicObservationPanel, LoqusdbInstance
 from cg.constants.priority import SlurmQos
+from cg.constants.scout import SCOUT_EXPORT_CACHE_TTL_SECONDS
 from cg.meta.delivery.delivery import DeliveryAPI
 from cg.services.analysis_service.analysis_service import AnalysisService
 from cg.services.decompression_service.decompressor import Decompressor
@@ -145,6 +147,11 @@ class CommonAppConfig(BaseModel):
     container_mount_volume: str | None = None
 
 
+class ScoutConfig(CommonAppConfig):
+    export_cache_directory: Path | None = None
+    export_cache_ttl: int = SCOUT_EXPORT_CACHE_TTL_SECONDS
+
+
 class ChanjoConfig(BaseModel):
     binary_path: str
     config_path: str
@@ -162,6 +169,7 @@ class NatsConfig(BaseModel):
 
 class HermesConfig(CommonAppConfig):
     container_path: str
+    in_process: bool = False
 
 
 class FluffyUploadConfig(BaseModel):
@@ -560,8 +568,8 @@ class CGConfig(BaseModel):
     run_names_services_: RunNamesServices | None = None
     sample_sheet_api_: IlluminaSampleSheetService | None = None
     seqera_platform: SeqeraPlatformConfig | None = None
-    scout: CommonAppConfig = None
-    scout_38: CommonAppConfig = None
+    scout: ScoutConfig = None
+    scout_38: ScoutConfig = None
     scout_api_37_: ScoutAPI = None
     scout_api_38_: ScoutAPI = None
     tar: CommonAppConfig | None = None
@@ -796,7 +804,11 @@ class CGConfig(BaseModel):
         api = self.scout_api_37_
         if not api:
             LOG.debug("Instantiating scout api, genome build 37")
-            api = ScoutAPI(scout_config=self.scout, slurm_upload_service=self.slurm_upload_service)
+            api = ScoutAPI(
+                scout_config=self.scout,
+                slurm_upload_service=self.slurm_upload_service,
+                export_cache=self._get_scout_export_cache(self.scout),
+            )
             self.scout_api_37_ = api
         return api
 
@@ -806,11 +818,21 @@ class CGConfig(BaseModel):
         if api is None:
             LOG.debug("Instantiating scout api, genome build 38")
             api = ScoutAPI(
-                scout_config=self.scout_38, slurm_upload_service=self.slurm_upload_service
+                scout_config=self.scout_38,
+                slurm_upload_service=self.slurm_upload_service,
+                export_cache=self._get_scout_export_cache(self.scout_38),
             )
             self.scout_api_38_ = api
         return api
 
+    @staticmethod
+    def _get_scout_export_cache(scout_config: ScoutConfig) -> ScoutExportCache:
+        return ScoutExportCache(
+            directory=scout_config.export_cache_directory,
+            ttl_seconds=scout_config.export_cache_ttl,
+            instance=f"{scout_config.binary_path}:{scout_config.config_path}",
+        )
+
     @property
     def status_db(self) -> Store:
         status_db = self.__dict__.get("status_db_")
@@ -826,7 +848,7 @@ class CGConfig(BaseModel):
         api = self.__dict__.get("trailblazer_api_")
         if api is None:
             LOG.debug("Instantiating trailblazer api")
-            api = TrailblazerAPI(config=self.dict())
+            api = TrailblazerAPI(config=self.dict(), memoize_latest_analyses=True)
             self.trailblazer_api_ = api
         return api
 
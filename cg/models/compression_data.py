@@ -8,7 +8,13 @@ from pathlib import Path
 from cg.apps.crunchy.files import check_if_update_spring, get_crunchy_metadata, get_file_updated_at
 from cg.apps.crunchy.models import CrunchyMetadata
 from cg.constants import FASTQ_FIRST_READ_SUFFIX, FASTQ_SECOND_READ_SUFFIX, FileExtensions
-from cg.constants.compression import PENDING_PATH_SUFFIX
+from cg.constants.compression import (
+    ARRAY_MEMORY_STEP,
+    ARRAY_MINUTES_STEP,
+    MEMORY_CEIL,
+    MINUTES_CEIL,
+    PENDING_PATH_SUFFIX,
+)
 
 LOG = logging.getLogger(__name__)
 
@@ -322,3 +328,39 @@ class CaseCompressionData:
             sample_compression.can_be_decompressed()
             for sample_compression in self.sample_compression_data
         )
+
+
+class CompressionBatch:
+    """Runs to submit together as SLURM job arrays.
+
+    Runs are grouped by their memory and time estimates rounded up to the given steps, so that runs
+    with similar resource needs end up in the same job array.
+    """
+
+    def __init__(
+        self,
+        memory_step: int = ARRAY_MEMORY_STEP,
+        minutes_step: int = ARRAY_MINUTES_STEP,
+        max_memory: int = MEMORY_CEIL,
+        max_minutes: int = MINUTES_CEIL,
+    ):
+        self.memory_step: int = memory_step
+        self.minutes_step: int = minutes_step
+        self.max_memory: int = max_memory
+        self.max_minutes: int = max_minutes
+        self.groups: dict[tuple[int, int], list[CompressionData]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(compressions) for compressions in self.groups.values())
+
+    def add(self, compression: CompressionData, memory: int, minutes: int) -> None:
+        """Add a run to the group matching its rounded up resource estimates."""
+        resources: tuple[int, int] = (
+            min(_round_up(value=memory, step=self.memory_step), max(memory, self.max_memory)),
+            min(_round_up(value=minutes, step=self.minutes_step), max(minutes, self.max_minutes)),
+        )
+        self.groups.setdefault(resources, []).append(compression)
+
+
+def _round_up(value: int, step: int) -> int:
+    return -(-value // step) * step
@@ -22,8 +22,10 @@ from cg.models.demultiplex.run_parameters import (
     RunParametersNovaSeq6000,
     RunParametersNovaSeqX,
 )
+from cg.models.run_devices.run_metadata_cache import RUN_METADATA_CACHE
 from cg.models.run_devices.utils import parse_date
 from cg.utils.files import get_source_creation_time_stamp
+from cg.utils.run_directory_index import RunDirectoryIndex
 from cg.utils.time import format_time_from_ctime
 
 LOG = logging.getLogger(__name__)
@@ -50,6 +52,7 @@ class IlluminaRunDirectoryData:
         self.position: Literal["A", "B"] = "A"
         self.parse_sequencing_run_dir_name()
         self._sample_sheet_path_hk: Path | None = None
+        self._demultiplexed_runs_index: RunDirectoryIndex | None = None
         self.sample_sheet_validator = SampleSheetValidator()
 
     def parse_sequencing_run_dir_name(self):
@@ -151,15 +154,23 @@ class IlluminaRunDirectoryData:
             )
         return self.path
 
+    @property
+    def demultiplexed_runs_index(self) -> RunDirectoryIndex:
+        """Return an index of the files in the demultiplexed run directory, scanned on first use."""
+        if not self._demultiplexed_runs_index:
+            self._demultiplexed_runs_index = RunDirectoryIndex(self.get_demultiplexed_runs_dir())
+        return self._demultiplexed_runs_index
+
     @property
     def run_parameters_path(self) -> Path:
         """Return path to run parameters file if it exists.
         Raises:
             FlowCellError if the sequencing run has no run parameters file."""
         flow_cell_run_dir: Path = self.get_sequencing_runs_dir()
-        if DemultiplexingDirsAndFiles.RUN_PARAMETERS_PASCAL_CASE in os.listdir(flow_cell_run_dir):
+        run_dir_content: list[str] = os.listdir(flow_cell_run_dir)
+        if DemultiplexingDirsAndFiles.RUN_PARAMETERS_PASCAL_CASE in run_dir_content:
             return Path(flow_cell_run_dir, DemultiplexingDirsAndFiles.RUN_PARAMETERS_PASCAL_CASE)
-        elif DemultiplexingDirsAndFiles.RUN_PARAMETERS_CAMEL_CASE in os.listdir(flow_cell_run_dir):
+        elif DemultiplexingDirsAndFiles.RUN_PARAMETERS_CAMEL_CASE in run_dir_content:
             return Path(flow_cell_run_dir, DemultiplexingDirsAndFiles.RUN_PARAMETERS_CAMEL_CASE)
         else:
             message: str = f"No run parameters file found in sequencing run {flow_cell_run_dir}"
@@ -170,8 +181,9 @@ class IlluminaRunDirectoryData:
     def run_parameters(self) -> RunParameters:
         """Return run parameters object."""
         if not self._run_parameters:
-            self._run_parameters = RUN_PARAMETERS_CONSTRUCTOR[self.sequencer_type](
-                run_parameters_path=self.run_parameters_path
+            self._run_parameters = RUN_METADATA_CACHE.get_run_parameters(
+                run_parameters_path=self.run_parameters_path,
+                constructor=RUN_PARAMETERS_CONSTRUCTOR[self.sequencer_type],
             )
         return self._run_parameters
 
@@ -269,8 +281,9 @@ class IlluminaRunDirectoryData:
         """Return sample sheet object."""
         if not self._sample_sheet_path_hk:
             raise FlowCellError("Sample sheet path has not been assigned yet")
-        return self.sample_sheet_validator.get_sample_sheet_object_from_file(
-            file_path=self._sample_sheet_path_hk
+        return RUN_METADATA_CACHE.get_sample_sheet(
+            sample_sheet_path=self._sample_sheet_path_hk,
+            parse=self.sample_sheet_validator.get_sample_sheet_object_from_file,
         )
 
     def is_sequencing_done(self) -> bool:
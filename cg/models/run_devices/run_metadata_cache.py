@@ -0,0 +1,150 @@
+"""Cache of parsed sequencing run metadata files."""
+
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Type
+
+from pydantic import BaseModel, ValidationError
+
+from cg.apps.demultiplex.sample_sheet.sample_sheet_models import SampleSheet
+from cg.constants.constants import FileExtensions, FileFormat
+from cg.io.controller import ReadFile, WriteFile
+from cg.models.demultiplex.run_parameters import RunParameters
+
+LOG = logging.getLogger(__name__)
+
+RUN_METADATA_CACHE_DIR_ENV: str = "CG_RUN_METADATA_CACHE_DIR"
+MAX_CACHED_ENTRIES: int = 512
+
+
+class SidecarEntry(BaseModel):
+    """Parsed content of a metadata file stored on disk."""
+
+    path: str
+    modified_time_ns: int
+    content: dict
+
+
+class RunMetadataCache:
+    """Cache parsed run metadata keyed by file path, modification time and size.
+
+    Parsed files are kept in an in-process LRU cache. When a sidecar directory is given, parsed
+    sample sheets are also stored there as JSON so that other processes can skip parsing them.
+    """
+
+    def __init__(
+        self, sidecar_directory: Path | None = None, max_entries: int = MAX_CACHED_ENTRIES
+    ):
+        self.sidecar_directory: Path | None = sidecar_directory
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[tuple[int, int], Any]] = OrderedDict()
+
+    def _get_from_memory(self, key: tuple[str, str], file_signature: tuple[int, int]) -> Any | None:
+        entry: tuple[tuple[int, int], Any] | None = self._entries.get(key)
+        if not entry or entry[0] != file_signature:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _add_to_memory(
+        self, key: tuple[str, str], file_signature: tuple[int, int], value: Any
+    ) -> None:
+        self._entries[key] = (file_signature, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _get(self, kind: str, file_path: Path, parse: Callable[[Path], Any]) -> Any:
+        file_stat: os.stat_result = os.stat(file_path)
+        key: tuple[str, str] = (kind, file_path.as_posix())
+        file_signature: tuple[int, int] = (file_stat.st_mtime_ns, file_stat.st_size)
+        value: Any | None = self._get_from_memory(key=key, file_signature=file_signature)
+        if value is None:
+            LOG.debug(f"Parsing {kind} file {file_path}")
+            value = parse(file_path)
+            self._add_to_memory(key=key, file_signature=file_signature, value=value)
+        return value
+
+    def clear(self) -> None:
+        """Remove all parsed files from the in-process cache."""
+        self._entries.clear()
+
+    def _get_sidecar_path(self, kind: str, file_path: Path) -> Path:
+        path_hash: str = hashlib.sha1(file_path.resolve().as_posix().encode()).hexdigest()
+        return Path(self.sidecar_directory, f"{kind}_{path_hash}{FileExtensions.JSON}")
+
+    def _read_sidecar(self, kind: str, file_path: Path) -> dict | None:
+        sidecar_path: Path = self._get_sidecar_path(kind=kind, file_path=file_path)
+        if not sidecar_path.exists():
+            return None
+        try:
+            entry = SidecarEntry.model_validate(
+                ReadFile.get_content_from_file(file_format=FileFormat.JSON, file_path=sidecar_path)
+            )
+        except (OSError, ValueError, ValidationError) as error:
+            LOG.debug(f"Could not read metadata sidecar {sidecar_path}: {error}")
+            return None
+        if entry.modified_time_ns != os.stat(file_path).st_mtime_ns:
+            return None
+        return entry.content
+
+    def _write_sidecar(self, kind: str, file_path: Path, content: dict) -> None:
+        sidecar_path: Path = self._get_sidecar_path(kind=kind, file_path=file_path)
+        entry = SidecarEntry(
+            path=file_path.as_posix(),
+            modified_time_ns=os.stat(file_path).st_mtime_ns,
+            content=content,
+        )
+        try:
+            sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+            WriteFile.write_file_from_content(
+                content=entry.model_dump(), file_format=FileFormat.JSON, file_path=sidecar_path
+            )
+        except OSError as error:
+            LOG.debug(f"Could not write metadata sidecar {sidecar_path}: {error}")
+
+    def get_run_parameters(
+        self, run_parameters_path: Path, constructor: Type[RunParameters]
+    ) -> RunParameters:
+        """Return the parsed run parameters file, parsing it only if it has changed."""
+        return self._get(
+            kind=constructor.__name__,
+            file_path=run_parameters_path,
+            parse=lambda file_path: constructor(run_parameters_path=file_path),
+        )
+
+    def get_sample_sheet(
+        self, sample_sheet_path: Path, parse: Callable[[Path], SampleSheet]
+    ) -> SampleSheet:
+        """Return a copy of the parsed sample sheet, parsing it only if it has changed."""
+        sample_sheet: SampleSheet = self._get(
+            kind=SampleSheet.__name__,
+            file_path=sample_sheet_path,
+            parse=lambda file_path: self._parse_sample_sheet(file_path=file_path, parse=parse),
+        )
+        return sample_sheet.model_copy(deep=True)
+
+    def _parse_sample_sheet(
+        self, file_path: Path, parse: Callable[[Path], SampleSheet]
+    ) -> SampleSheet:
+        if not self.sidecar_directory:
+            return parse(file_path)
+        if content := self._read_sidecar(kind=SampleSheet.__name__, file_path=file_path):
+            return SampleSheet.model_validate(content)
+        sample_sheet: SampleSheet = parse(file_path)
+        self._write_sidecar(
+            kind=SampleSheet.__name__, file_path=file_path, content=sample_sheet.model_dump()
+        )
+        return sample_sheet
+
+
+def get_sidecar_directory() -> Path | None:
+    """Return the directory for metadata sidecar files, if configured."""
+    sidecar_directory: str | None = os.environ.get(RUN_METADATA_CACHE_DIR_ENV)
+    return Path(sidecar_directory) if sidecar_directory else None
+
+
+RUN_METADATA_CACHE = RunMetadataCache(sidecar_directory=get_sidecar_directory())
@@ -22,6 +22,7 @@ class Sbatch(BaseModel):
     partition: str | None = None
     chdir: str | None = None
     cpus_per_task: str | None = None
+    array: str | None = None
 
 
 class SbatchDragen(Sbatch):
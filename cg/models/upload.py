@@ -0,0 +1,13 @@
+"""Models for uploads of analysis results."""
+
+from pydantic import BaseModel
+
+from cg.constants.constants import CaseUploadStatus
+
+
+class CaseUploadResult(BaseModel):
+    """Outcome of uploading the analysis results of a case."""
+
+    case_id: str
+    status: CaseUploadStatus
+    seconds: float
@@ -27,6 +27,7 @@ from cg.server.endpoints.sequencing_run.pacbio_smrt_cell_metrics import (
     PACBIO_SMRT_CELL_METRICS_BLUEPRINT,
 )
 from cg.server.endpoints.users import USERS_BLUEPRINT
+from cg.server.sql_profiling import register_sql_profiling
 from cg.store.database import get_scoped_session_registry
 from cg.store.models import (
     Analysis,
@@ -60,6 +61,8 @@ def create_app():
     _configure_extensions(app)
     _register_blueprints(app)
     _register_teardowns(app)
+    if app_config.cg_sql_profiling:
+        register_sql_profiling(app)
 
     return app
 
@@ -80,7 +83,7 @@ def _configure_extensions(app: Flask):
     ext.lims.init_app(app)
     ext.analysis_client.init_app(app)
     ext.admin.init_app(app, index_view=AdminIndexView(endpoint="admin"))
-    app.json_provider_class = ext.CustomJSONEncoder
+    app.json = ext.JSONBackendProvider(app)
 
 
 def _initialize_logging(app):
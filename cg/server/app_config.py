@@ -15,6 +15,7 @@ class AppConfig(BaseSettings):
 
     # Database settings
     cg_sql_database_uri: str = "sqlite:///"
+    cg_sql_profiling: bool = False
 
     # Security settings
     cg_secret_key: str = "thisIsNotASafeKey"
@@ -1,6 +1,6 @@
-from decimal import Decimal
-from json import JSONEncoder
+from typing import Any
 
+from flask.json.provider import DefaultJSONProvider
 from flask_admin import Admin
 from flask_cors import CORS
 from flask_wtf.csrf import CSRFProtect
@@ -8,6 +8,7 @@ from flask_wtf.csrf import CSRFProtect
 from cg.apps.lims import LimsAPI
 from cg.apps.tb.api import TrailblazerAPI
 from cg.clients.freshdesk.freshdesk_client import FreshdeskClient
+from cg.io.json import get_json_backend
 from cg.server.app_config import app_config
 from cg.services.delivery_message.delivery_message_service import DeliveryMessageService
 from cg.services.mark_as_delivered_service import MarkAsDeliveredService
@@ -57,11 +58,27 @@ class FlaskStore(Store):
         super(FlaskStore, self).__init__()
 
 
-class CustomJSONEncoder(JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        return super().default(obj)
+class JSONBackendProvider(DefaultJSONProvider):
+    """Encode and decode JSON with the backend of cg.io.json. As with the default provider,
+    dates are encoded as HTTP dates, keys are sorted and responses are only indented in debug
+    mode."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if set(kwargs) - {"indent", "separators"}:
+            return super().dumps(obj, **kwargs)
+        return get_json_backend().dumps(
+            obj,
+            indent=kwargs.get("indent"),
+            compact=kwargs.get("separators") == (",", ":"),
+            sort_keys=self.sort_keys,
+            default=self.default,
+            datetime_default=True,
+        )
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return get_json_backend().loads(s)
 
 
 class AnalysisClient(TrailblazerAPI):
@@ -0,0 +1,30 @@
+"""Profiling of the SQL statements executed by each request to the server."""
+
+from flask import Flask, Response, g, request
+
+from cg.store.profiler import SQL_PROFILE_HEADER, SqlProfile, start_profile, stop_profile
+
+
+def register_sql_profiling(app: Flask):
+    """Profile the SQL statements of each request, which are summarised in a response header
+    and logged together with any likely N+1 queries."""
+
+    @app.before_request
+    def start_sql_profile():
+        profile = SqlProfile(name=f"{request.method} {request.path}")
+        g.sql_profile_token = start_profile(profile)
+        g.sql_profile = profile
+
+    @app.after_request
+    def add_sql_profile_header(response: Response) -> Response:
+        profile: SqlProfile | None = g.get("sql_profile")
+        if profile:
+            response.headers[SQL_PROFILE_HEADER] = profile.get_summary()
+            profile.log_summary()
+        return response
+
+    @app.teardown_request
+    def stop_sql_profile(exception=None):
+        token = g.pop("sql_profile_token", None)
+        if token:
+            stop_profile(token)
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from subprocess import CalledProcessError
 
 from requests import HTTPError
@@ -12,6 +13,7 @@ from cg.services.analysis_starter.submitters.submitter import Submitter
 from cg.services.analysis_starter.tracker.tracker import Tracker
 from cg.store.models import Case
 from cg.store.store import Store
+from cg.utils.sessions import remove_thread_sessions
 
 LOG = logging.getLogger(__name__)
 
@@ -33,19 +35,70 @@ class AnalysisStarter:
         self.tracker = tracker
         self.workflow = workflow
 
-    def start_available(self, limit: int | None = None) -> bool:
-        """Starts available cases. Returns True if all ready cases started without an error."""
-        succeeded = True
+    def start_available(self, limit: int | None = None, max_workers: int = 1) -> bool:
+        """Starts available cases. Returns True if all ready cases started without an error.
+        With more than one worker, the input files of several cases are fetched and the cases
+        configured at the same time, each thread with its own database sessions. The cases are
+        submitted one at a time."""
         cases: list[Case] = self.store.get_cases_to_analyze(workflow=self.workflow, limit=limit)
         LOG.info(f"Found {len(cases)} {self.workflow} cases to start")
-        for case in cases:
+        case_ids: list[str] = [case.internal_id for case in cases]
+        errors: dict[str, Exception] = {}
+        if max_workers > 1:
+            case_configs: dict[str, CaseConfig] = self._prepare_cases(
+                case_ids=case_ids, max_workers=max_workers, errors=errors
+            )
+            for case_id, case_config in case_configs.items():
+                try:
+                    self._run_and_track(case_id=case_id, case_config=case_config)
+                except Exception as error:
+                    errors[case_id] = error
+        else:
+            for case_id in case_ids:
+                try:
+                    self.start(case_id)
+                except Exception as error:
+                    errors[case_id] = error
+        return self._log_start_errors(errors)
+
+    def _prepare_cases(
+        self, case_ids: list[str], max_workers: int, errors: dict[str, Exception]
+    ) -> dict[str, CaseConfig]:
+        """Fetch input files for and configure cases in a thread pool. Return the configurations
+        of the cases that succeeded and add the errors of the others."""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            preparations: dict[str, Future] = {
+                case_id: executor.submit(self._prepare_case, case_id) for case_id in case_ids
+            }
+        case_configs: dict[str, CaseConfig] = {}
+        for case_id, preparation in preparations.items():
             try:
-                self.start(case.internal_id)
-            except AnalysisNotReadyError as warning:
-                LOG.warning(warning)
+                case_configs[case_id] = preparation.result()
             except Exception as error:
-                LOG.error(error)
-                succeeded = False
+                errors[case_id] = error
+        return case_configs
+
+    def _prepare_case(self, case_id: str) -> CaseConfig:
+        LOG.info(f"Preparing case {case_id}")
+        try:
+            self._ensure_case_matches_workflow(case_id)
+            self.tracker.ensure_analysis_not_ongoing(case_id)
+            self.input_fetcher.ensure_files_are_ready(case_id)
+            return self.configurator.configure(case_id=case_id)
+        finally:
+            remove_thread_sessions()
+
+    @staticmethod
+    def _log_start_errors(errors: dict[str, Exception]) -> bool:
+        """Log the errors of cases that could not be started. Return True if no case failed with
+        an error other than not being ready."""
+        succeeded = True
+        for case_id, error in errors.items():
+            if isinstance(error, AnalysisNotReadyError):
+                LOG.warning(error)
+                continue
+            LOG.error(f"{case_id}: {error}")
+            succeeded = False
         return succeeded
 
     def start(self, case_id: str, **flags) -> None:
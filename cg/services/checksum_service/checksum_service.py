@@ -0,0 +1,112 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from cg.constants import FileExtensions
+from cg.constants.constants import FileFormat
+from cg.io.controller import ReadFile, WriteFile
+from cg.services.checksum_service.models import FileDigest
+from cg.services.checksum_service.utils import calculate_file_digest, is_digest_current
+from cg.utils.checksum.checksum import extract_md5sum
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS: int = 4
+
+
+class ChecksumService:
+    """Calculate file checksums in parallel, remembering digests of unchanged files.
+
+    The cache maps a file path to its digest and the file size and modification time it was
+    calculated for, so that files are only reread when they have changed.
+    """
+
+    def __init__(self, cache_path: Path | None = None, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.cache_path: Path | None = cache_path
+        self.max_workers: int = max_workers
+        self.cache: dict[str, FileDigest] = self._read_cache()
+
+    def _read_cache(self) -> dict[str, FileDigest]:
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            content: dict = ReadFile.get_content_from_file(
+                file_format=FileFormat.JSON, file_path=self.cache_path
+            )
+            return {path: FileDigest.model_validate(digest) for path, digest in content.items()}
+        except (AttributeError, OSError, ValueError) as error:
+            LOG.warning(f"Ignoring unreadable checksum cache {self.cache_path}: {error}")
+            return {}
+
+    def _write_cache(self) -> None:
+        """Write the cache to a temporary file and move it into place, so that an interrupted
+        write never leaves a truncated cache."""
+        if not self.cache_path:
+            return
+        temporary_path = Path(f"{self.cache_path}.{os.getpid()}.tmp")
+        try:
+            WriteFile.write_file_from_content(
+                content={path: digest.model_dump() for path, digest in self.cache.items()},
+                file_format=FileFormat.JSON,
+                file_path=temporary_path,
+            )
+            os.replace(temporary_path, self.cache_path)
+        except OSError as error:
+            LOG.warning(f"Could not write checksum cache {self.cache_path}: {error}")
+            temporary_path.unlink(missing_ok=True)
+
+    def _get_cached_digest(self, file_path: Path) -> FileDigest | None:
+        digest: FileDigest | None = self.cache.get(file_path.as_posix())
+        if digest and is_digest_current(digest=digest, file_path=file_path):
+            return digest
+        return None
+
+    def get_digests(self, file_paths: list[Path]) -> dict[Path, FileDigest]:
+        """Return the digests of the given files, calculating those not in the cache in parallel."""
+        digests: dict[Path, FileDigest] = {}
+        paths_to_digest: list[Path] = []
+        for file_path in file_paths:
+            if digest := self._get_cached_digest(file_path):
+                digests[file_path] = digest
+            else:
+                paths_to_digest.append(file_path)
+        LOG.debug(f"Calculating checksums for {len(paths_to_digest)} of {len(file_paths)} files")
+        if paths_to_digest:
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(paths_to_digest))
+            ) as executor:
+                for file_path, digest in zip(
+                    paths_to_digest, executor.map(calculate_file_digest, paths_to_digest)
+                ):
+                    digests[file_path] = digest
+                    self.cache[file_path.as_posix()] = digest
+            self._write_cache()
+        return digests
+
+    @staticmethod
+    def is_md5sum_correct(file_path: Path, digest: FileDigest) -> bool:
+        """Return True if the file has an md5 file matching the digest."""
+        md5sum_file = Path(f"{file_path}{FileExtensions.MD5}")
+        if not md5sum_file.exists():
+            LOG.info(f"No md5sum file found for {file_path}")
+            return False
+        if extract_md5sum(md5sum_file=md5sum_file) != digest.md5:
+            LOG.info(f"The given md5sum does not match the md5sum for file {file_path}")
+            return False
+        return True
+
+    def get_files_with_incorrect_md5sum(self, file_paths: list[Path]) -> list[Path]:
+        """Return the files that do not exist or do not match their md5 file."""
+        existing_paths: list[Path] = [
+            file_path
+            for file_path in file_paths
+            if Path(f"{file_path}{FileExtensions.MD5}").exists() and file_path.exists()
+        ]
+        digests: dict[Path, FileDigest] = self.get_digests(existing_paths)
+        return [
+            file_path
+            for file_path in file_paths
+            if file_path not in digests
+            or not self.is_md5sum_correct(file_path=file_path, digest=digests[file_path])
+        ]
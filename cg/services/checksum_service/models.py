@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class FileDigest(BaseModel):
+    """Checksums of a file together with the file attributes they were calculated for."""
+
+    size: int
+    modified_time_ns: int
+    md5: str
+    sha1: str
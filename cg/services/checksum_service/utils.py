@@ -0,0 +1,32 @@
+import hashlib
+import os
+from pathlib import Path
+
+from cg.services.checksum_service.models import FileDigest
+
+READ_BUFFER_SIZE: int = 16 * 1024 * 1024
+
+
+def calculate_file_digest(file_path: Path) -> FileDigest:
+    """Calculate the md5 and sha1 checksums of a file in one pass with large aligned reads."""
+    file_stat: os.stat_result = os.stat(file_path)
+    md5_hash = hashlib.md5()
+    sha1_hash = hashlib.sha1()
+    buffer = bytearray(READ_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as file:
+        while read_bytes := file.readinto(buffer):
+            md5_hash.update(view[:read_bytes])
+            sha1_hash.update(view[:read_bytes])
+    return FileDigest(
+        size=file_stat.st_size,
+        modified_time_ns=file_stat.st_mtime_ns,
+        md5=md5_hash.hexdigest(),
+        sha1=sha1_hash.hexdigest(),
+    )
+
+
+def is_digest_current(digest: FileDigest, file_path: Path) -> bool:
+    """Return True if the file has the same size and modification time as when it was digested."""
+    file_stat: os.stat_result = os.stat(file_path)
+    return digest.size == file_stat.st_size and digest.modified_time_ns == file_stat.st_mtime_ns
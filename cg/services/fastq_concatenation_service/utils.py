@@ -1,24 +1,32 @@
 from pathlib import Path
 import re
-import shutil
 import uuid
 
 from cg.services.fastq_concatenation_service.exceptions import ConcatenationError
 from cg.constants.constants import ReadDirection, FileFormat
 from cg.constants import FileExtensions
+from cg.utils.files import concatenate_files
 
 
 def concatenate_fastq_reads_for_direction(
-    directory: Path, sample_id: str, direction: ReadDirection
+    directory: Path, sample_id: str, direction: ReadDirection, output_directory: Path | None = None
 ) -> Path | None:
+    """Concatenate the fastq files of a sample for one read direction into a new unique file.
+    args:
+        directory: Path: The directory containing the fastq files.
+        sample_id: str: The identifier to identify the samples by.
+        direction: ReadDirection: The direction of the reads.
+        output_directory: Path | None: Where the concatenated file is written. Defaults to directory.
+    """
     fastqs: list[Path] = get_fastqs_by_direction(
         fastq_directory=directory, direction=direction, sample_id=sample_id
     )
     if not fastqs:
         return
-    output_file: Path = get_new_unique_file(directory)
-    concatenate(input_files=fastqs, output_file=output_file)
-    validate_concatenation(input_files=fastqs, output_file=output_file)
+    expected_size: int = get_total_size(fastqs)
+    output_file: Path = get_new_unique_file(output_directory or directory)
+    written_size: int = concatenate(input_files=fastqs, output_file=output_file)
+    validate_concatenation(expected_size=expected_size, written_size=written_size)
     return output_file
 
 
@@ -46,18 +54,17 @@ def get_total_size(files: list[Path]) -> int:
     return sum(file.stat().st_size for file in files)
 
 
-def concatenate(input_files: list[Path], output_file: Path) -> None:
-    with open(output_file, "wb") as write_file_obj:
-        for file in input_files:
-            with open(file, "rb") as file_descriptor:
-                shutil.copyfileobj(file_descriptor, write_file_obj)
+def concatenate(input_files: list[Path], output_file: Path) -> int:
+    """Concatenate the input files into the output file and return the number of written bytes."""
+    return concatenate_files(input_files=input_files, output_file=output_file)
 
 
-def validate_concatenation(input_files: list[Path], output_file: Path) -> None:
-    total_size: int = get_total_size(input_files)
-    concatenated_size: int = get_total_size([output_file])
-    if total_size != concatenated_size:
-        raise ConcatenationError
+def validate_concatenation(expected_size: int, written_size: int) -> None:
+    """Validate that the concatenated size equals the total size of the input files."""
+    if expected_size != written_size:
+        raise ConcatenationError(
+            f"Concatenated size {written_size} differs from input size {expected_size}"
+        )
 
 
 def sort_files_by_name(files: list[Path]) -> list[Path]:
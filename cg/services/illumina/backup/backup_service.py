@@ -1,13 +1,17 @@
+import shutil
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from cg.apps.slurm.slurm_api import SlurmAPI
 from cg.constants import FileExtensions, SequencingRunDataAvailability
-from cg.constants.backup import MAX_PROCESSING_ILLUMINA_RUNS
+from cg.constants.backup import MAX_CONCURRENT_RUN_ENCRYPTIONS, MAX_PROCESSING_ILLUMINA_RUNS
 from cg.constants.demultiplexing import DemultiplexingDirsAndFiles
 from cg.exc import (
     DsmcAlreadyRunningError,
+    FlowCellError,
     IlluminaRunAlreadyBackedUpError,
+    IlluminaRunDecryptionError,
     IlluminaRunEncryptionError,
     PdcError,
     PdcNoFilesMatchingSearchError,
@@ -18,6 +22,7 @@ from cg.meta.tar.tar import TarAPI
 from cg.models.cg_config import PDCArchivingDirectory
 from cg.models.run_devices.illumina_run_directory_data import IlluminaRunDirectoryData
 from cg.services.illumina.backup.encrypt_service import IlluminaRunEncryptionService
+from cg.services.illumina.backup.stream import decrypt_and_extract
 from cg.services.illumina.backup.utils import (
     get_latest_archived_encryption_key_path,
     get_latest_archived_sequencing_run_path,
@@ -40,6 +45,8 @@ class IlluminaBackupService:
         pdc_service: PdcService,
         sequencing_runs_dir: str,
         dry_run: bool = False,
+        stream_extraction: bool = False,
+        pigz_binary_path: str | None = None,
     ):
         self.encryption_api = encryption_api
         self.pdc_archiving_directory: PDCArchivingDirectory = pdc_archiving_directory
@@ -48,6 +55,8 @@ class IlluminaBackupService:
         self.pdc: PdcService = pdc_service
         self.sequencing_runs_dir: str = sequencing_runs_dir
         self.dry_run: bool = dry_run
+        self.stream_extraction: bool = stream_extraction
+        self.pigz_binary_path: str | None = pigz_binary_path
 
     def has_processing_queue_capacity(self) -> bool:
         """Check if the processing queue for illumina runs is not full."""
@@ -121,27 +130,44 @@ class IlluminaBackupService:
         self.retrieve_archived_key(
             archived_key=archived_key, sequencing_run=sequencing_run, run_dir=run_dir
         )
+        if self.stream_extraction:
+            self.retrieve_archived_md5sum(archived_run=archived_run, run_dir=run_dir)
         self.retrieve_archived_sequencing_run(
             archived_run=archived_run, sequencing_run=sequencing_run, run_dir=run_dir
         )
 
         try:
-            (
-                decrypted_run,
-                encryption_key,
-                retrieved_run,
-                retrieved_key,
-            ) = self.decrypt_sequencing_run(
-                archived_run=archived_run, archived_key=archived_key, run_dir=run_dir
-            )
-            self.extract_sequencing_run(
-                decrypted_run=decrypted_run, is_current=is_current, run_dir=run_dir
-            )
+            if self.stream_extraction:
+                (
+                    decrypted_run,
+                    encryption_key,
+                    retrieved_run,
+                    retrieved_key,
+                ) = self.decrypt_and_extract_sequencing_run(
+                    archived_run=archived_run,
+                    archived_key=archived_key,
+                    is_current=is_current,
+                    run_dir=run_dir,
+                )
+            else:
+                (
+                    decrypted_run,
+                    encryption_key,
+                    retrieved_run,
+                    retrieved_key,
+                ) = self.decrypt_sequencing_run(
+                    archived_run=archived_run, archived_key=archived_key, run_dir=run_dir
+                )
+                self.extract_sequencing_run(
+                    decrypted_run=decrypted_run, is_current=is_current, run_dir=run_dir
+                )
             self.create_rta_complete(sequencing_run_output_dir)
             self.create_copy_complete(sequencing_run_output_dir)
             self.unlink_files(decrypted_run, encryption_key, retrieved_run, retrieved_key)
-        except subprocess.CalledProcessError as error:
-            LOG.error(f"Decryption failed: {error.stderr}")
+        except (subprocess.CalledProcessError, IlluminaRunDecryptionError) as error:
+            LOG.error(f"Decryption failed: {getattr(error, 'stderr', error)}")
+            if isinstance(error, IlluminaRunDecryptionError):
+                self.remove_extracted_run(sequencing_run_output_dir)
             if not self.dry_run:
                 self.status_db.update_illumina_sequencing_run_data_availability(
                     sequencing_run=sequencing_run,
@@ -193,6 +219,14 @@ class IlluminaBackupService:
             encryption_key.unlink()
         except FileNotFoundError:
             LOG.info(message)
+        retrieved_run.with_suffix(FileExtensions.MD5SUM).unlink(missing_ok=True)
+
+    def remove_extracted_run(self, sequencing_run_output_dir: Path) -> None:
+        """Remove a sequencing run extracted from an archive that failed validation."""
+        if self.dry_run:
+            return
+        LOG.warning(f"Removing invalid extracted sequencing run {sequencing_run_output_dir}")
+        shutil.rmtree(sequencing_run_output_dir, ignore_errors=True)
 
     @staticmethod
     def create_rta_complete(flow_cell_directory: Path):
@@ -214,10 +248,8 @@ class IlluminaBackupService:
         LOG.debug(f"Extract sequencing run command: {extraction_command}")
         self.tar_api.run_tar_command(extraction_command)
 
-    def decrypt_sequencing_run(
-        self, archived_run: Path, archived_key: Path, run_dir: Path
-    ) -> tuple[Path, Path, Path, Path]:
-        """Decrypt the sequencing run."""
+    def decrypt_encryption_key(self, archived_key: Path, run_dir: Path) -> tuple[Path, Path]:
+        """Decrypt the retrieved encryption key. Return the retrieved and decrypted key paths."""
         retrieved_key: Path = run_dir / archived_key.name
         encryption_key: Path = retrieved_key.with_suffix(FileExtensions.NO_EXTENSION)
         decryption_command: list[str] = self.encryption_api.get_asymmetric_decryption_command(
@@ -225,6 +257,48 @@ class IlluminaBackupService:
         )
         LOG.debug(f"Decrypt key command: {decryption_command}")
         self.encryption_api.run_gpg_command(decryption_command)
+        return retrieved_key, encryption_key
+
+    def decrypt_and_extract_sequencing_run(
+        self, archived_run: Path, archived_key: Path, is_current: bool, run_dir: Path
+    ) -> tuple[Path, Path, Path, Path]:
+        """Decrypt the sequencing run straight into tar extraction, without writing the decrypted
+        archive to disk. The md5sum of the decrypted archive is validated against a retrieved
+        md5sum file, if there is one."""
+        retrieved_key, encryption_key = self.decrypt_encryption_key(
+            archived_key=archived_key, run_dir=run_dir
+        )
+        retrieved_run: Path = run_dir / archived_run.name
+        decrypted_run: Path = retrieved_run.with_suffix(FileExtensions.NO_EXTENSION)
+        decrypt_and_extract(
+            decryption_command=self.encryption_api.get_symmetric_stream_decryption_command(
+                input_file=retrieved_run, encryption_key=encryption_key
+            ),
+            extraction_command=self.tar_api.get_extract_stream_command(
+                output_dir=run_dir,
+                is_current=is_current,
+                decompression_program=self.pigz_binary_path,
+            ),
+            expected_md5sum=self._get_expected_md5sum(retrieved_run),
+        )
+        return decrypted_run, encryption_key, retrieved_run, retrieved_key
+
+    @staticmethod
+    def _get_expected_md5sum(retrieved_run: Path) -> str | None:
+        """Return the md5sum of the decrypted archive recorded at encryption, if retrieved."""
+        md5sum_file: Path = retrieved_run.with_suffix(FileExtensions.MD5SUM)
+        if not md5sum_file.exists():
+            LOG.debug(f"No md5sum file {md5sum_file}, decrypted archive will not be validated")
+            return None
+        return md5sum_file.read_text().split()[0]
+
+    def decrypt_sequencing_run(
+        self, archived_run: Path, archived_key: Path, run_dir: Path
+    ) -> tuple[Path, Path, Path, Path]:
+        """Decrypt the sequencing run."""
+        retrieved_key, encryption_key = self.decrypt_encryption_key(
+            archived_key=archived_key, run_dir=run_dir
+        )
         retrieved_run: Path = run_dir / archived_run.name
         decrypted_run: Path = retrieved_run.with_suffix(FileExtensions.NO_EXTENSION)
         decryption_command: list[str] = self.encryption_api.get_symmetric_decryption_command(
@@ -277,6 +351,15 @@ class IlluminaBackupService:
                 )
             raise error
 
+    def retrieve_archived_md5sum(self, archived_run: Path, run_dir: Path) -> None:
+        """Attempt to retrieve the md5sum file archived with the sequencing run. Runs backed up
+        before the md5sum file was archived are retrieved without it."""
+        archived_md5sum: Path = archived_run.with_suffix(FileExtensions.MD5SUM)
+        try:
+            self.retrieve_archived_file(archived_file=archived_md5sum, run_dir=run_dir)
+        except PdcError:
+            LOG.warning(f"No archived md5sum file {archived_md5sum}, skipping validation")
+
     def query_pdc_for_sequencing_run(self, flow_cell_id: str) -> list[str]:
         """Query PDC for a given flow cell id.
         Raise:
@@ -365,11 +448,55 @@ class IlluminaBackupService:
             sequencing_run=sequencing_run,
             illumina_run_encryption_service=illumina_run_encryption_service,
         )
+        files_to_archive: list[Path] = [
+            illumina_run_encryption_service.final_passphrase_file_path,
+            illumina_run_encryption_service.encrypted_gpg_file_path,
+        ]
+        if illumina_run_encryption_service.encrypted_md5sum_file_path.exists():
+            files_to_archive.append(illumina_run_encryption_service.encrypted_md5sum_file_path)
         self.backup_run(
-            files_to_archive=[
-                illumina_run_encryption_service.final_passphrase_file_path,
-                illumina_run_encryption_service.encrypted_gpg_file_path,
-            ],
+            files_to_archive=files_to_archive,
             store=status_db,
             sequencing_run=sequencing_run,
         )
+
+    def start_run_encryptions(
+        self,
+        runs_dir_data: list[IlluminaRunDirectoryData],
+        binary_path: str,
+        encryption_dir: Path,
+        pigz_binary_path: str,
+        sbatch_parameter: dict[str, str | int],
+        max_workers: int = MAX_CONCURRENT_RUN_ENCRYPTIONS,
+    ) -> list[str]:
+        """Start encryption of several sequencing runs at the same time. Return the ids of the
+        runs for which encryption was started."""
+        encryption_services: list[IlluminaRunEncryptionService] = [
+            IlluminaRunEncryptionService(
+                binary_path=binary_path,
+                dry_run=self.dry_run,
+                encryption_dir=encryption_dir,
+                run_dir_data=run_dir_data,
+                pigz_binary_path=pigz_binary_path,
+                slurm_api=SlurmAPI(),
+                sbatch_parameter=sbatch_parameter,
+                tar_api=self.tar_api,
+            )
+            for run_dir_data in runs_dir_data
+        ]
+        started_run_ids: list[str] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            encryptions: dict[str, Future] = {
+                encryption_service.run_dir_data.id: executor.submit(
+                    encryption_service.start_encryption
+                )
+                for encryption_service in encryption_services
+            }
+            for run_id, encryption in encryptions.items():
+                try:
+                    encryption.result()
+                except (FlowCellError, IlluminaRunEncryptionError) as error:
+                    LOG.error(f"{error}")
+                    continue
+                started_run_ids.append(run_id)
+        return started_run_ids
@@ -11,6 +11,7 @@ from cg.meta.encryption.sbatch import ILLUMINA_RUN_ENCRYPT_COMMANDS, ILLUMINA_RU
 from cg.meta.tar.tar import TarAPI
 from cg.models.run_devices.illumina_run_directory_data import IlluminaRunDirectoryData
 from cg.models.slurm.sbatch import Sbatch
+from cg.services.illumina.backup.models import RunEncryptionCommands
 
 
 class IlluminaRunEncryptionService(EncryptionAPI):
@@ -45,7 +46,9 @@ class IlluminaRunEncryptionService(EncryptionAPI):
         return Path(self.encryption_dir, self.run_dir_data.full_name)
 
     @property
-    def run_encrypt_tmp_dir(self) -> Path:
+    def run_archive_member_dir(self) -> Path:
+        """Return the directory that archived run members are placed under. Runs used to be
+        copied here before archiving, and retrieval strips these path components."""
         return Path(self.run_encryption_dir, "tmp")
 
     @property
@@ -133,35 +136,28 @@ class IlluminaRunEncryptionService(EncryptionAPI):
             )
         return True
 
-    def make_tmp_encrypt_dir(self) -> str:
-        return f"mkdir -p {self.run_encrypt_tmp_dir}"
-
-    def copy_run_dir_to_tmp(self) -> str:
-        return (
-            f"rsync -r --exclude={DemultiplexingDirsAndFiles.ONBOARD_ANALYSIS}"
-            f" {self.run_dir_data.path} {self.run_encrypt_tmp_dir}"
+    def get_archive_run_dir_command(self) -> str:
+        """Return the command archiving the run directory in place, without the onboard
+        analysis."""
+        return self.tar_api.get_compress_in_place_cmd(
+            input_path=self.run_dir_data.path,
+            member_prefix=self.run_archive_member_dir,
+            exclude_patterns=[DemultiplexingDirsAndFiles.ONBOARD_ANALYSIS],
         )
 
-    def remove_tmp_encrypt_dir(self) -> str:
-        return f"rm -rf {self.run_encrypt_tmp_dir}"
-
-    def encrypt_run(
-        self,
-    ) -> None:
-        """Encrypt a sequencing run via GPG and SLURM."""
-        error_function: str = ILLUMINA_RUN_ENCRYPT_ERROR.format(
-            pending_file_path=self.pending_file_path
-        )
-        commands: str = ILLUMINA_RUN_ENCRYPT_COMMANDS.format(
+    def get_encryption_commands(self) -> RunEncryptionCommands:
+        """Return the commands for each stage of the run encryption. The run directory is
+        archived, compressed and encrypted in a single pass, with the md5sum of the compressed
+        archive computed on the way. The encrypted archive is then decrypted and its md5sum
+        compared with the recorded one before the encryption is flagged as complete."""
+        return RunEncryptionCommands(
             symmetric_passphrase=self.get_symmetric_passphrase_cmd(
                 passphrase_file_path=self.symmetric_passphrase_file_path
             ),
             asymmetrically_encrypt_passphrase=self.get_asymmetrically_encrypt_passphrase_cmd(
                 passphrase_file_path=self.symmetric_passphrase_file_path
             ),
-            make_tmp_encrypt_dir=self.make_tmp_encrypt_dir(),
-            copy_run_dir_to_tmp=self.copy_run_dir_to_tmp(),
-            tar_encrypt_tmp_dir=self.tar_api.get_compress_cmd(input_path=self.run_encrypt_tmp_dir),
+            archive_run_dir=self.get_archive_run_dir_command(),
             parallel_gzip=f"{self.pigz_binary_path} -p {self.slurm_number_tasks - LIMIT_PIGZ_TASK} --fast -c",
             tee=f"tee >(md5sum > {self.encrypted_md5sum_file_path})",
             run_symmetric_encryption=self.get_run_symmetric_encryption_command(
@@ -177,7 +173,17 @@ class IlluminaRunEncryptionService(EncryptionAPI):
             mv_passphrase_file=f"mv {self.symmetric_passphrase_file_path.with_suffix(FileExtensions.GPG)} {self.final_passphrase_file_path}",
             remove_pending_file=f"rm -f {self.pending_file_path}",
             flag_as_complete=f"touch {self.complete_file_path}",
-            remove_tmp_encrypt_dir=self.remove_tmp_encrypt_dir(),
+        )
+
+    def encrypt_run(
+        self,
+    ) -> None:
+        """Encrypt a sequencing run via GPG and SLURM."""
+        error_function: str = ILLUMINA_RUN_ENCRYPT_ERROR.format(
+            pending_file_path=self.pending_file_path
+        )
+        commands: str = ILLUMINA_RUN_ENCRYPT_COMMANDS.format(
+            **self.get_encryption_commands().model_dump()
         )
         sbatch_parameters = Sbatch(
             account=self.slurm_account,
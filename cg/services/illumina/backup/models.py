@@ -22,3 +22,40 @@ class PdcSequencingFile(BaseModel):
 
     date_time: datetime
     path: Annotated[Path, BeforeValidator(validated_pdc_sequencing_file_path)]
+
+
+class StageThroughput(BaseModel):
+    """Bytes processed and time spent in one stage of a streaming pipeline."""
+
+    stage: str
+    bytes: int
+    seconds: float
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes / self.seconds / 1_000_000 if self.seconds else 0.0
+
+
+class StreamExtractionResult(BaseModel):
+    """Checksum and throughput of a streamed decryption and extraction."""
+
+    md5sum: str
+    bytes: int
+    stages: list[StageThroughput]
+
+
+class RunEncryptionCommands(BaseModel):
+    """Shell commands for the stages of encrypting a sequencing run directory."""
+
+    symmetric_passphrase: str
+    asymmetrically_encrypt_passphrase: str
+    archive_run_dir: str
+    parallel_gzip: str
+    tee: str
+    run_symmetric_encryption: str
+    run_symmetric_decryption: str
+    md5sum: str
+    diff: str
+    mv_passphrase_file: str
+    remove_pending_file: str
+    flag_as_complete: str
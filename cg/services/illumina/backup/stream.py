@@ -0,0 +1,108 @@
+"""Streaming decryption and extraction of Illumina run archives retrieved from backup."""
+
+import hashlib
+import logging
+import subprocess
+import tempfile
+import time
+from typing import IO
+
+from cg.constants.backup import STREAM_CHUNK_SIZE
+from cg.constants.process import EXIT_SUCCESS
+from cg.exc import IlluminaRunDecryptionError
+from cg.services.illumina.backup.models import StageThroughput, StreamExtractionResult
+
+LOG = logging.getLogger(__name__)
+
+
+def decrypt_and_extract(
+    decryption_command: list[str],
+    extraction_command: list[str],
+    expected_md5sum: str | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> StreamExtractionResult:
+    """Pipe the output of a decryption command into an extraction command without writing the
+    decrypted archive to disk. The md5sum of the decrypted stream is computed on the way.
+
+    Raises:
+        CalledProcessError if the decryption or the extraction fails.
+        IlluminaRunDecryptionError if the md5sum does not match the expected md5sum.
+    """
+    LOG.info(f"Streaming {' '.join(decryption_command)} | {' '.join(extraction_command)}")
+    md5 = hashlib.md5()
+    stage_seconds: dict[str, float] = {"decrypt": 0.0, "checksum": 0.0, "extract": 0.0}
+    streamed_bytes: int = 0
+    is_extraction_stopped: bool = False
+    with (
+        tempfile.TemporaryFile() as decryption_stderr,
+        tempfile.TemporaryFile() as extraction_stderr,
+    ):
+        decryption = subprocess.Popen(
+            decryption_command, stdout=subprocess.PIPE, stderr=decryption_stderr
+        )
+        extraction = subprocess.Popen(
+            extraction_command, stdin=subprocess.PIPE, stderr=extraction_stderr
+        )
+        try:
+            while True:
+                start: float = time.perf_counter()
+                chunk: bytes = decryption.stdout.read(chunk_size)
+                checksum_start: float = time.perf_counter()
+                stage_seconds["decrypt"] += checksum_start - start
+                if not chunk:
+                    break
+                md5.update(chunk)
+                extract_start: float = time.perf_counter()
+                stage_seconds["checksum"] += extract_start - checksum_start
+                extraction.stdin.write(chunk)
+                stage_seconds["extract"] += time.perf_counter() - extract_start
+                streamed_bytes += len(chunk)
+        except BrokenPipeError:
+            LOG.error("Extraction stopped before the end of the decrypted stream")
+            is_extraction_stopped = True
+            decryption.kill()
+        finally:
+            decryption.stdout.close()
+            try:
+                extraction.stdin.close()
+            except BrokenPipeError:
+                pass
+            decryption.wait()
+            extraction.wait()
+        # Report the stage that failed first, a stopped extraction also ends the decryption
+        stages: list[tuple[subprocess.Popen, list[str], IO[bytes]]] = [
+            (decryption, decryption_command, decryption_stderr),
+            (extraction, extraction_command, extraction_stderr),
+        ]
+        for process, command, stderr in reversed(stages) if is_extraction_stopped else stages:
+            _raise_on_failure(process=process, command=command, stderr=stderr)
+
+    result = StreamExtractionResult(
+        md5sum=md5.hexdigest(),
+        bytes=streamed_bytes,
+        stages=[
+            StageThroughput(stage=stage, bytes=streamed_bytes, seconds=seconds)
+            for stage, seconds in stage_seconds.items()
+        ],
+    )
+    for stage in result.stages:
+        LOG.info(
+            f"{stage.stage}: {stage.bytes} bytes in {stage.seconds:.1f} s "
+            f"({stage.megabytes_per_second:.1f} MB/s)"
+        )
+    if expected_md5sum and expected_md5sum != result.md5sum:
+        raise IlluminaRunDecryptionError(
+            f"Decrypted archive md5sum {result.md5sum} does not match {expected_md5sum}"
+        )
+    LOG.info(f"Decrypted archive md5sum: {result.md5sum}")
+    return result
+
+
+def _raise_on_failure(process: subprocess.Popen, command: list[str], stderr: IO[bytes]) -> None:
+    if process.returncode == EXIT_SUCCESS:
+        return
+    stderr.seek(0)
+    error_output: str = stderr.read().decode("utf-8").rstrip()
+    LOG.critical(f"Call {command} exit with a non zero exit code")
+    LOG.critical(error_output)
+    raise subprocess.CalledProcessError(process.returncode, command, stderr=error_output)
@@ -5,19 +5,19 @@ from pathlib import Path
 from typing import Type
 
 from cg.apps.demultiplex.sample_sheet.validators import is_valid_sample_internal_id
-from cg.constants.constants import SCALE_TO_READ_PAIRS, FileFormat
+from cg.constants.constants import SCALE_TO_READ_PAIRS
 from cg.constants.demultiplexing import UNDETERMINED
 from cg.constants.metrics import (
     ADAPTER_METRICS_FILE_NAME,
     DEMUX_METRICS_FILE_NAME,
     QUALITY_METRICS_FILE_NAME,
 )
-from cg.io.controller import ReadFile
+from cg.io.csv import iterate_csv_models
 from cg.services.illumina.file_parsing.models import (
     DemuxMetrics,
     SequencingQualityMetrics,
 )
-from cg.utils.files import get_file_in_directory
+from cg.utils.run_directory_index import RunDirectoryIndex
 
 LOG = logging.getLogger(__name__)
 
@@ -31,15 +31,10 @@ class BCLConvertMetricsParser:
     ) -> None:
         """Initialize the class."""
         self.bcl_convert_demultiplex_dir: Path = bcl_convert_metrics_dir_path
-        self.quality_metrics_path: Path = get_file_in_directory(
-            directory=self.bcl_convert_demultiplex_dir, file_name=QUALITY_METRICS_FILE_NAME
-        )
-        self.demux_metrics_path: Path = get_file_in_directory(
-            directory=self.bcl_convert_demultiplex_dir, file_name=DEMUX_METRICS_FILE_NAME
-        )
-        self.adapter_metrics_path: Path = get_file_in_directory(
-            directory=self.bcl_convert_demultiplex_dir, file_name=ADAPTER_METRICS_FILE_NAME
-        )
+        run_directory_index = RunDirectoryIndex(self.bcl_convert_demultiplex_dir)
+        self.quality_metrics_path: Path = run_directory_index.get_file(QUALITY_METRICS_FILE_NAME)
+        self.demux_metrics_path: Path = run_directory_index.get_file(DEMUX_METRICS_FILE_NAME)
+        self.adapter_metrics_path: Path = run_directory_index.get_file(ADAPTER_METRICS_FILE_NAME)
         self.quality_metrics: list[SequencingQualityMetrics] = self.parse_metrics_file(
             metrics_file_path=self.quality_metrics_path,
             metrics_model=SequencingQualityMetrics,
@@ -55,13 +50,7 @@ class BCLConvertMetricsParser:
     ) -> list[SequencingQualityMetrics | DemuxMetrics]:
         """Parse specified metrics file."""
         LOG.info(f"Parsing BCLConvert metrics file: {metrics_file_path}")
-        parsed_metrics: list[SequencingQualityMetrics | DemuxMetrics] = []
-        metrics_content: list[dict] = ReadFile.get_content_from_file(
-            file_format=FileFormat.CSV, file_path=metrics_file_path, read_to_dict=True
-        )
-        for sample_metrics_dict in metrics_content:
-            parsed_metrics.append(metrics_model(**sample_metrics_dict))
-        return parsed_metrics
+        return list(iterate_csv_models(file_path=metrics_file_path, model=metrics_model))
 
     def get_sample_internal_ids(self) -> list[str]:
         """Return a list of sample internal ids."""
@@ -19,6 +19,7 @@ from cg.services.illumina.post_processing.utils import (
 from cg.store.models import Sample
 from cg.store.store import Store
 from cg.utils.files import get_files_matching_pattern
+from cg.utils.run_directory_index import RunDirectoryIndex
 
 LOG = logging.getLogger(__name__)
 
@@ -66,10 +67,12 @@ def add_sample_fastq_files_to_housekeeper(
 ) -> None:
     """Add sample fastq files from the demultiplex directory to Housekeeper."""
     sample_internal_ids: list[str] = run_directory_data.sample_sheet.get_sample_ids()
+    run_directory_index: RunDirectoryIndex = run_directory_data.demultiplexed_runs_index
     for sample_internal_id in sample_internal_ids:
         sample_fastq_paths: list[Path] | None = get_sample_fastqs_from_flow_cell(
             demultiplexed_run_path=run_directory_data.get_demultiplexed_runs_dir(),
             sample_internal_id=sample_internal_id,
+            run_directory_index=run_directory_index,
         )
         if not sample_fastq_paths:
             LOG.warning(
@@ -105,7 +108,9 @@ def store_undetermined_fastq_files(
 
     for lane, sample_id in non_pooled_lanes_and_samples:
         undetermined_fastqs: list[Path] = get_undetermined_fastqs(
-            lane=lane, demultiplexed_run_path=run_directory_data.get_demultiplexed_runs_dir()
+            lane=lane,
+            demultiplexed_run_path=run_directory_data.get_demultiplexed_runs_dir(),
+            run_directory_index=run_directory_data.demultiplexed_runs_index,
         )
 
         for fastq_path in undetermined_fastqs:
@@ -11,6 +11,7 @@ from cg.services.illumina.data_transfer.models import (
     IlluminaSampleSequencingMetricsDTO,
 )
 from cg.utils.files import get_files_matching_pattern, is_pattern_in_file_path_name, rename_file
+from cg.utils.run_directory_index import RunDirectoryIndex
 
 LOG = logging.getLogger(__name__)
 
@@ -68,10 +69,32 @@ def _get_valid_sample_fastqs(fastq_paths: list[Path], sample_internal_id: str) -
     ]
 
 
+def _get_sample_fastqs_matching_pattern(
+    demultiplexed_run_path: Path,
+    pattern: str,
+    sample_internal_id: str,
+    run_directory_index: RunDirectoryIndex | None,
+) -> list[Path]:
+    """Return the sample fastq files matching a pattern, looked up by sample id in the run
+    directory index if given."""
+    if not run_directory_index:
+        return get_files_matching_pattern(directory=demultiplexed_run_path, pattern=pattern)
+    return [
+        file_path
+        for file_path in run_directory_index.get_files_with_name_prefix(
+            prefix=sample_internal_id, separator="_S"
+        )
+        if run_directory_index.is_matching_glob(file_path=file_path, pattern=pattern)
+    ]
+
+
 def get_sample_fastqs_from_flow_cell(
-    demultiplexed_run_path: Path, sample_internal_id: str
+    demultiplexed_run_path: Path,
+    sample_internal_id: str,
+    run_directory_index: RunDirectoryIndex | None = None,
 ) -> list[Path] | None:
-    """Retrieve all fastq files for a specific sample in a demultiplex run directory."""
+    """Retrieve all fastq files for a specific sample in a demultiplex run directory.
+    An index of the demultiplexed run directory can be given to avoid scanning it per sample."""
 
     # The flat output structure for runs demultiplexed with BCLConvert on hasta
     root_pattern = f"{sample_internal_id}_S*_L*_R*_*{FileExtensions.FASTQ}{FileExtensions.GZIP}"
@@ -86,8 +109,11 @@ def get_sample_fastqs_from_flow_cell(
         root_pattern,
         demux_on_sequencer_pattern,
     ]:
-        sample_fastqs: list[Path] = get_files_matching_pattern(
-            directory=demultiplexed_run_path, pattern=pattern
+        sample_fastqs: list[Path] = _get_sample_fastqs_matching_pattern(
+            demultiplexed_run_path=demultiplexed_run_path,
+            pattern=pattern,
+            sample_internal_id=sample_internal_id,
+            run_directory_index=run_directory_index,
         )
         valid_sample_fastqs: list[Path] = _get_valid_sample_fastqs(
             fastq_paths=sample_fastqs, sample_internal_id=sample_internal_id
@@ -189,9 +215,13 @@ def combine_sample_metrics_with_undetermined(
     return list(metrics.values())
 
 
-def get_undetermined_fastqs(lane: int, demultiplexed_run_path: Path) -> list[Path]:
+def get_undetermined_fastqs(
+    lane: int, demultiplexed_run_path: Path, run_directory_index: RunDirectoryIndex | None = None
+) -> list[Path]:
     """Get the undetermined fastq files for a specific lane on a flow cell."""
     undetermined_pattern = f"Undetermined*_L00{lane}_*{FileExtensions.FASTQ}{FileExtensions.GZIP}"
+    if run_directory_index:
+        return run_directory_index.glob(undetermined_pattern)
     undetermined_in_root: list[Path] = get_files_matching_pattern(
         directory=demultiplexed_run_path,
         pattern=undetermined_pattern,
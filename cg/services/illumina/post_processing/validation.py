@@ -51,6 +51,7 @@ def validate_flow_cell_has_fastq_files(flow_cell: IlluminaRunDirectoryData) -> N
         fastq_files: list[Path] | None = get_sample_fastqs_from_flow_cell(
             demultiplexed_run_path=flow_cell.get_demultiplexed_runs_dir(),
             sample_internal_id=sample_id,
+            run_directory_index=flow_cell.demultiplexed_runs_index,
         )
         if fastq_files:
             LOG.debug(f"Flow cell {flow_cell.id} has at least one sample with fastq files")
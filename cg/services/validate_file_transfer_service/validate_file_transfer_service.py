@@ -2,7 +2,7 @@ import logging
 from pathlib import Path
 
 from cg.io.controller import ReadFile
-from cg.utils.files import get_file_in_directory
+from cg.utils.run_directory_index import RunDirectoryIndex
 
 LOG = logging.getLogger(__name__)
 
@@ -50,15 +50,6 @@ class ValidateFileTransferService:
                 file_names.append(Path(formatted_line).name)
         return file_names
 
-    @staticmethod
-    def _is_file_in_directory_tree(file_name: str, source_dir: Path) -> bool:
-        """Check if a file is present in the directory tree."""
-        try:
-            if get_file_in_directory(directory=source_dir, file_name=file_name):
-                return True
-        except FileNotFoundError:
-            return False
-
     def _get_files_in_manifest(self, manifest_file: Path, manifest_file_format: str) -> list[str]:
         """Get the files listed in the manifest file."""
         manifest_content: list[str] = self._get_manifest_file_content(
@@ -67,8 +58,6 @@ class ValidateFileTransferService:
         return self._extract_file_names_from_manifest(manifest_content)
 
     def _are_all_files_present(self, files_to_validate: list[str], source_dir: Path) -> bool:
-        """Check if all files are present in the directory tree."""
-        for file_name in files_to_validate:
-            if not self._is_file_in_directory_tree(file_name=file_name, source_dir=source_dir):
-                return False
-        return True
+        """Check if all files are present in the directory tree, scanning it only once."""
+        run_directory_index = RunDirectoryIndex(source_dir)
+        return all(run_directory_index.has_file(file_name) for file_name in files_to_validate)
@@ -7,7 +7,7 @@ from typing import Callable, Iterator, Literal
 
 import sqlalchemy
 from sqlalchemy import ScalarSelect, Select, and_, or_, select
-from sqlalchemy.orm import Query
+from sqlalchemy.orm import Query, joinedload
 
 from cg.constants import SequencingRunDataAvailability, Workflow
 from cg.constants.constants import (
@@ -121,9 +121,12 @@ from cg.store.models import (
     SampleRunMetrics,
     User,
 )
+from cg.utils.utils import get_chunks
 
 LOG = logging.getLogger(__name__)
 
+SAMPLE_INTERNAL_ID_CHUNK_SIZE: int = 1000
+
 
 class ReadHandler(BaseHandler):
     """Class for reading items in the database."""
@@ -395,6 +398,21 @@ class ReadHandler(BaseHandler):
         self._is_case_found(case=case, case_id=case_id)
         return case.samples if case else []
 
+    def get_samples_with_applications_by_case_id(self, case_id: str) -> list[Sample]:
+        """Return the samples of a case in one query, with their application versions and
+        applications loaded. The samples are returned in the order they were linked to the case."""
+        query: Select[tuple[Sample]] = (
+            select(Sample)
+            .join(CaseSample, CaseSample.sample_id == Sample.id)
+            .join(Case, Case.id == CaseSample.case_id)
+            .where(Case.internal_id == case_id)
+            .options(
+                joinedload(Sample.application_version).joinedload(ApplicationVersion.application)
+            )
+            .order_by(CaseSample.id)
+        )
+        return list(self.session.scalars(query).unique())
+
     def get_sample_ids_by_case_id(self, case_id: str = None) -> Iterator[str]:
         """Return sample ids from case id."""
         case: Case = self.get_case_by_internal_id(internal_id=case_id)
@@ -585,6 +603,40 @@ class ReadHandler(BaseHandler):
         ).all()
         return pools + samples
 
+    def get_pools_with_applications_by_invoice_id(self, invoice_id: int) -> list[Pool]:
+        """Return the pools of an invoice in one query, with their application versions,
+        applications and customers loaded."""
+        return (
+            apply_pool_filter(
+                pools=self._get_query(table=Pool),
+                invoice_id=invoice_id,
+                filter_functions=[PoolFilter.BY_INVOICE_ID],
+            )
+            .options(
+                joinedload(Pool.application_version).joinedload(ApplicationVersion.application),
+                joinedload(Pool.customer),
+            )
+            .order_by(Pool.id)
+            .all()
+        )
+
+    def get_samples_with_applications_by_invoice_id(self, invoice_id: int) -> list[Sample]:
+        """Return the samples of an invoice in one query, with their application versions,
+        applications and customers loaded."""
+        return (
+            apply_sample_filter(
+                samples=self._get_query(table=Sample),
+                invoice_id=invoice_id,
+                filter_functions=[SampleFilter.BY_INVOICE_ID],
+            )
+            .options(
+                joinedload(Sample.application_version).joinedload(ApplicationVersion.application),
+                joinedload(Sample.customer),
+            )
+            .order_by(Sample.id)
+            .all()
+        )
+
     def new_invoice_id(self) -> int:
         """Fetch invoices."""
         query: Query = self._get_query(table=Invoice)
@@ -753,6 +805,29 @@ class ReadHandler(BaseHandler):
             )
         return samples
 
+    def get_samples_with_applications_by_internal_ids(
+        self, internal_ids: list[str], chunk_size: int = SAMPLE_INTERNAL_ID_CHUNK_SIZE
+    ) -> dict[str, Sample]:
+        """Return the samples with the given internal ids keyed by internal id, with their
+        application versions and applications loaded. The internal ids are queried in chunks to
+        keep the IN clauses bounded."""
+        samples: dict[str, Sample] = {}
+        for internal_ids_chunk in get_chunks(
+            items=list(dict.fromkeys(internal_ids)), chunk_size=chunk_size
+        ):
+            query: Select[tuple[Sample]] = (
+                select(Sample)
+                .where(Sample.internal_id.in_(internal_ids_chunk))
+                .options(
+                    joinedload(Sample.application_version).joinedload(
+                        ApplicationVersion.application
+                    )
+                )
+            )
+            for sample in self.session.scalars(query).unique():
+                samples[sample.internal_id] = sample
+        return samples
+
     def get_sample_by_name(self, name: str) -> Sample:
         """Get sample by name."""
         samples = self._get_query(table=Sample)
@@ -760,6 +835,18 @@ class ReadHandler(BaseHandler):
             samples=samples, filter_functions=[SampleFilter.BY_SAMPLE_NAME], name=name
         ).first()
 
+    def get_samples_by_names(self, names: list[str]) -> dict[str, Sample]:
+        """Return the first sample with each of the given names in one query, keyed by name."""
+        samples: Query = apply_sample_filter(
+            samples=self._get_query(table=Sample),
+            filter_functions=[SampleFilter.BY_SAMPLE_NAMES],
+            names=list(set(names)),
+        ).order_by(Sample.id)
+        samples_by_name: dict[str, Sample] = {}
+        for sample in samples:
+            samples_by_name.setdefault(sample.name, sample)
+        return samples_by_name
+
     def is_case_down_sampled(self, case_id: str) -> bool:
         """Returns True if all samples in a case are down sampled from another sample."""
         case: Case = self.get_case_by_internal_id(internal_id=case_id)
@@ -1233,6 +1320,23 @@ class ReadHandler(BaseHandler):
             workflow=workflow,
         ).all()
 
+    def get_latest_analyses_to_upload(self, workflow: Workflow | None = None) -> list[Analysis]:
+        """Return the latest completed analysis of each case, if it has not been uploaded and its
+        upload has not started."""
+        analysis_filter_functions: list[Callable] = [
+            AnalysisFilter.WITH_WORKFLOW,
+            AnalysisFilter.IS_LATEST_COMPLETED_FOR_CASE,
+            AnalysisFilter.IS_NOT_UPLOADED,
+            AnalysisFilter.UPLOAD_NOT_STARTED,
+            AnalysisFilter.VALID_IN_PRODUCTION,
+            AnalysisFilter.ORDER_BY_COMPLETED_AT,
+        ]
+        return apply_analysis_filter(
+            filter_functions=analysis_filter_functions,
+            analyses=self._get_join_analysis_case_query(),
+            workflow=workflow,
+        ).all()
+
     def get_analyses_to_clean(
         self, before: datetime, workflow: Workflow | None = None
     ) -> list[Analysis]:
@@ -2070,7 +2174,10 @@ class ReadHandler(BaseHandler):
         )
 
     def get_compressible_samples_by_internal_ids(
-        self, internal_ids: list[str], case_created_before_date: datetime
+        self,
+        internal_ids: list[str],
+        case_created_before_date: datetime,
+        chunk_size: int = SAMPLE_INTERNAL_ID_CHUNK_SIZE,
     ) -> list[Sample]:
         """
         Return samples, restricted to the given internal ids, that are compressible:
@@ -2079,6 +2186,7 @@ class ReadHandler(BaseHandler):
                 - Has an active action
                 - Was created on or after case_created_before_date
             - Ordered by created date, with the oldest first
+        The internal ids are queried in chunks to keep the IN clauses bounded.
         """
         incompressible_case_samples_subquery: ScalarSelect = (
             select(CaseSample.sample_id)
@@ -2092,17 +2200,40 @@ class ReadHandler(BaseHandler):
             )
         ).scalar_subquery()
 
-        query: Select[tuple[Sample]] = (
-            select(Sample)
-            .where(
-                Sample.id.not_in(incompressible_case_samples_subquery),
-                Sample.internal_id.in_(internal_ids),
+        samples: list[Sample] = []
+        for internal_ids_chunk in get_chunks(
+            items=list(dict.fromkeys(internal_ids)), chunk_size=chunk_size
+        ):
+            query: Select[tuple[Sample]] = (
+                select(Sample)
+                .where(
+                    Sample.id.not_in(incompressible_case_samples_subquery),
+                    Sample.internal_id.in_(internal_ids_chunk),
+                )
+                .distinct()
+            )
+            samples.extend(self.session.scalars(query).all())
+        return sorted(samples, key=lambda sample: sample.created_at or datetime.min)
+
+    def get_illumina_lane_read_counts_by_sample_internal_ids(
+        self, sample_internal_ids: list[str]
+    ) -> dict[tuple[str, str, int], int | None]:
+        """Return the total reads in lane for the given samples in one query, keyed by
+        (flow cell internal id, sample internal id, lane)."""
+        rows: Query = (
+            self._get_joined_illumina_sample_tables()
+            .filter(Sample.internal_id.in_(sample_internal_ids))
+            .with_entities(
+                IlluminaFlowCell.internal_id,
+                Sample.internal_id,
+                IlluminaSampleSequencingMetrics.flow_cell_lane,
+                IlluminaSampleSequencingMetrics.total_reads_in_lane,
             )
-            .distinct()
-            .order_by(Sample.created_at.asc())
         )
-
-        return list(self.session.scalars(query).all())
+        read_counts: dict[tuple[str, str, int], int | None] = {}
+        for flow_cell_id, sample_internal_id, lane, total_reads_in_lane in rows:
+            read_counts.setdefault((flow_cell_id, sample_internal_id, lane), total_reads_in_lane)
+        return read_counts
 
 
 def _paginate(query: Query, page: int, page_size: int) -> tuple[list, int]:
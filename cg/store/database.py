@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
 from cg.exc import CgError
 from cg.store.models import Base
+from cg.store.profiler import instrument_engine
 
 SESSION: scoped_session | None = None
 ENGINE: Engine | None = None
@@ -15,6 +16,7 @@ def initialize_database(db_uri: str) -> None:
     global SESSION, ENGINE
 
     ENGINE = create_engine(db_uri, pool_pre_ping=True)
+    instrument_engine(ENGINE)
     session_factory = sessionmaker(ENGINE)
     SESSION = scoped_session(session_factory)
 
@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Callable
 
-from sqlalchemy import and_
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Query
 
 from cg.constants import REPORT_SUPPORTED_WORKFLOW
@@ -35,6 +35,31 @@ def filter_not_uploaded_analyses(analyses: Query, **kwargs) -> Query:
     return analyses.filter(Analysis.uploaded_at.is_(None))
 
 
+def filter_analyses_upload_not_started(analyses: Query, **kwargs) -> Query:
+    """Return analyses that have not started uploading."""
+    return analyses.filter(Analysis.upload_started_at.is_(None))
+
+
+def filter_latest_completed_analyses_per_case(analyses: Query, **kwargs) -> Query:
+    """Return analyses that are the latest completed analysis of their case."""
+    latest_completed_analyses = (
+        select(
+            Analysis.case_id.label("case_id"),
+            func.max(Analysis.completed_at).label("completed_at"),
+        )
+        .where(Analysis.completed_at.isnot(None))
+        .group_by(Analysis.case_id)
+        .subquery()
+    )
+    return analyses.join(
+        latest_completed_analyses,
+        and_(
+            Analysis.case_id == latest_completed_analyses.c.case_id,
+            Analysis.completed_at == latest_completed_analyses.c.completed_at,
+        ),
+    )
+
+
 def filter_analyses_with_delivery_report(analyses: Query, **kwargs) -> Query:
     """Return analyses that have a delivery report generated."""
     return analyses.filter(Analysis.delivery_report_created_at.isnot(None))
@@ -129,6 +154,8 @@ class AnalysisFilter(Enum):
     COMPLETED: Callable = filter_completed_analyses
     IS_UPLOADED: Callable = filter_uploaded_analyses
     IS_NOT_UPLOADED: Callable = filter_not_uploaded_analyses
+    UPLOAD_NOT_STARTED: Callable = filter_analyses_upload_not_started
+    IS_LATEST_COMPLETED_FOR_CASE: Callable = filter_latest_completed_analyses_per_case
     WITH_DELIVERY_REPORT: Callable = filter_analyses_with_delivery_report
     WITHOUT_DELIVERY_REPORT: Callable = filter_analyses_without_delivery_report
     REPORT_BY_WORKFLOW: Callable = filter_report_analyses_by_workflow
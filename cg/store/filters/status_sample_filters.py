@@ -18,6 +18,11 @@ def filter_samples_by_name(name: str, samples: Query, **kwargs) -> Query:
     return samples.filter(Sample.name == name)
 
 
+def filter_samples_by_names(names: list[str], samples: Query, **kwargs) -> Query:
+    """Return samples with any of the sample names."""
+    return samples.filter(Sample.name.in_(names))
+
+
 def filter_samples_with_loqusdb_id(samples: Query, **kwargs) -> Query:
     """Return samples with a loqusdb ID."""
     return samples.filter(Sample.loqusdb_id.isnot(None))
@@ -155,6 +160,7 @@ def apply_sample_filter(
     customer_entry_ids: list[int] | None = None,
     subject_id: str | None = None,
     name: str | None = None,
+    names: list[str] | None = None,
     customer: Customer | None = None,
     search_pattern: str | None = None,
     identifier_name: str = None,
@@ -173,6 +179,7 @@ def apply_sample_filter(
             customer_entry_ids=customer_entry_ids,
             subject_id=subject_id,
             name=name,
+            names=names,
             customer=customer,
             search_pattern=search_pattern,
             identifier_name=identifier_name,
@@ -193,6 +200,7 @@ class SampleFilter(Enum):
     BY_INTERNAL_ID_OR_NAME_SEARCH: Callable = filter_samples_by_internal_id_or_name_search
     BY_INVOICE_ID: Callable = filter_samples_by_invoice_id
     BY_SAMPLE_NAME: Callable = filter_samples_by_name
+    BY_SAMPLE_NAMES: Callable = filter_samples_by_names
     BY_SUBJECT_ID: Callable = filter_samples_by_subject_id
     BY_TUMOUR: Callable = filter_samples_on_tumour
     DO_INVOICE: Callable = filter_samples_do_invoice
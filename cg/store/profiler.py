@@ -0,0 +1,144 @@
+"""Profile the SQL statements emitted by the store and flag likely N+1 query patterns."""
+
+import logging
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+LOG = logging.getLogger(__name__)
+
+N_PLUS_ONE_THRESHOLD: int = 10
+SQL_PROFILE_HEADER: str = "X-SQL-Profile"
+
+_QUERY_START_TIMES: str = "cg_query_start_times"
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAMETER_LIST = re.compile(r"\((?:\s*(?:\?|%s|%\(\w+\)s|:\w+)\s*,?)+\)")
+_WHITESPACE = re.compile(r"\s+")
+
+_current_profile: ContextVar["SqlProfile | None"] = ContextVar("sql_profile", default=None)
+
+
+def get_statement_fingerprint(statement: str) -> str:
+    """Return the shape of a statement, with literals and parameter lists replaced by
+    placeholders, so that statements differing only in their values share a fingerprint."""
+    fingerprint: str = _STRING_LITERAL.sub("?", statement)
+    fingerprint = _NUMBER_LITERAL.sub("?", fingerprint)
+    fingerprint = _PARAMETER_LIST.sub("(?)", fingerprint)
+    return _WHITESPACE.sub(" ", fingerprint).strip()
+
+
+class StatementShape:
+    """Executions of statements sharing a fingerprint."""
+
+    def __init__(self, fingerprint: str):
+        self.fingerprint: str = fingerprint
+        self.count: int = 0
+        self.seconds: float = 0.0
+
+    @property
+    def is_select(self) -> bool:
+        return self.fingerprint.upper().startswith("SELECT")
+
+
+class SqlProfile:
+    """Count and time the SQL statements executed during a command or request.
+
+    A select statement repeated at least n_plus_one_threshold times is flagged as a likely N+1
+    pattern, such as a lazy load of a relationship for each row of a previous query.
+    """
+
+    def __init__(self, name: str, n_plus_one_threshold: int = N_PLUS_ONE_THRESHOLD):
+        self.name: str = name
+        self.n_plus_one_threshold: int = n_plus_one_threshold
+        self.shapes: dict[str, StatementShape] = {}
+        self.statement_count: int = 0
+        self.seconds: float = 0.0
+
+    def record(self, statement: str, seconds: float) -> None:
+        fingerprint: str = get_statement_fingerprint(statement)
+        shape: StatementShape = self.shapes.setdefault(fingerprint, StatementShape(fingerprint))
+        shape.count += 1
+        shape.seconds += seconds
+        self.statement_count += 1
+        self.seconds += seconds
+
+    def get_n_plus_one_suspects(self) -> list[StatementShape]:
+        """Return the select statement shapes repeated enough to be likely N+1 patterns, the
+        most repeated first."""
+        suspects: list[StatementShape] = [
+            shape
+            for shape in self.shapes.values()
+            if shape.is_select and shape.count >= self.n_plus_one_threshold
+        ]
+        return sorted(suspects, key=lambda shape: shape.count, reverse=True)
+
+    def get_summary(self) -> str:
+        return (
+            f"statements={self.statement_count};time_ms={self.seconds * 1000:.1f};"
+            f"shapes={len(self.shapes)};n_plus_one={len(self.get_n_plus_one_suspects())}"
+        )
+
+    def log_summary(self) -> None:
+        LOG.info(
+            f"SQL profile for {self.name}: {self.statement_count} statements in "
+            f"{self.seconds * 1000:.1f} ms, {len(self.shapes)} distinct shapes"
+        )
+        for shape in self.get_n_plus_one_suspects():
+            LOG.warning(
+                f"Possible N+1 query in {self.name}, executed {shape.count} times in "
+                f"{shape.seconds * 1000:.1f} ms: {shape.fingerprint}"
+            )
+
+
+def start_profile(profile: SqlProfile) -> Token:
+    """Record the statements executed in the current context in the profile."""
+    return _current_profile.set(profile)
+
+
+def stop_profile(token: Token) -> None:
+    """Stop recording statements in the profile started with the token."""
+    _current_profile.reset(token)
+
+
+@contextmanager
+def profile_sql(
+    name: str, n_plus_one_threshold: int = N_PLUS_ONE_THRESHOLD
+) -> Iterator[SqlProfile]:
+    """Profile the statements executed within the context and log a summary on exit."""
+    profile = SqlProfile(name=name, n_plus_one_threshold=n_plus_one_threshold)
+    token: Token = start_profile(profile)
+    try:
+        yield profile
+    finally:
+        stop_profile(token)
+        profile.log_summary()
+
+
+def _before_cursor_execute(
+    conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    if _current_profile.get():
+        conn.info.setdefault(_QUERY_START_TIMES, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    profile: SqlProfile | None = _current_profile.get()
+    start_times: list[float] = conn.info.get(_QUERY_START_TIMES, [])
+    if profile and start_times:
+        profile.record(statement=statement, seconds=time.perf_counter() - start_times.pop())
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Listen to the statements executed on the engine. Nothing is recorded unless a profile
+    has been started in the executing context."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
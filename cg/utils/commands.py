@@ -5,9 +5,13 @@ Code to handle communications to the shell from CG.
 import copy
 import logging
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from subprocess import CalledProcessError
+from typing import Iterator, NamedTuple
 
-from cg.constants.process import EXIT_SUCCESS
+from cg.constants.process import EXIT_SUCCESS, MAX_CONCURRENT_PROCESSES
 
 LOG = logging.getLogger(__name__)
 
@@ -58,6 +62,27 @@ class Process:
         self._stdout = ""
         self._stderr = ""
 
+    def get_command(self, parameters: list = None) -> list[str]:
+        """Return the base call extended with the parameters."""
+        command = copy.deepcopy(self.base_call)
+        if parameters:
+            command.extend(parameters)
+        return command
+
+    def _get_popen_arguments(self, command: list[str]) -> str | list[str]:
+        """Return the command as a string to run in a shell if an environment is used."""
+        return " ".join(command) if self.environment else command
+
+    def execute(self, command: list[str]) -> subprocess.CompletedProcess:
+        """Execute a command with captured output, without storing the output on the process."""
+        return subprocess.run(
+            self._get_popen_arguments(command),
+            shell=bool(self.environment),
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
     def run_command(self, parameters: list = None, dry_run: bool = False) -> int:
         """Execute a command in the shell.
         If environment is supplied - shell=True has to be supplied to enable passing as a string for executing multiple
@@ -69,27 +94,14 @@ class Process:
         Return(int): Return code from called process
 
         """
-        command = copy.deepcopy(self.base_call)
-        if parameters:
-            command.extend(parameters)
+        command: list[str] = self.get_command(parameters)
 
         LOG.info("Running command %s", " ".join(command))
         if dry_run:
             LOG.info("Dry run: process call will not be executed!!")
             return EXIT_SUCCESS
 
-        if self.environment:
-            res = subprocess.run(
-                " ".join(command),
-                shell=True,
-                check=False,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-        else:
-            res = subprocess.run(
-                command, check=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-            )
+        res: subprocess.CompletedProcess = self.execute(command)
 
         self.stdout = res.stdout.decode("utf-8").rstrip()
         self.stderr = res.stderr.decode("utf-8").rstrip()
@@ -100,6 +112,46 @@ class Process:
 
         return res.returncode
 
+    def run_command_streaming(
+        self, parameters: list = None, dry_run: bool = False
+    ) -> Iterator[str]:
+        """Execute a command in the shell and yield the lines of stdout while it runs.
+        Stdout is not kept on the process, stderr is stored when the command has finished.
+        The process is killed if the caller stops iterating before the end of the output.
+
+        Raises:
+            CalledProcessError when the command exits with a non zero exit code.
+        """
+        command: list[str] = self.get_command(parameters)
+
+        LOG.info("Running command %s", " ".join(command))
+        if dry_run:
+            LOG.info("Dry run: process call will not be executed!!")
+            return
+
+        self.stdout = ""
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(
+                self._get_popen_arguments(command),
+                shell=bool(self.environment),
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+            )
+            try:
+                for line in process.stdout:
+                    yield line.decode("utf-8").rstrip("\n")
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                process.stdout.close()
+                process.wait()
+            stderr_file.seek(0)
+            self.stderr = stderr_file.read().decode("utf-8").rstrip()
+        if process.returncode != EXIT_SUCCESS:
+            LOG.critical("Call %s exit with a non zero exit code", command)
+            LOG.critical(self.stderr)
+            raise CalledProcessError(process.returncode, command)
+
     @property
     def stdout(self):
         """Fetch stdout"""
@@ -136,3 +188,63 @@ class Process:
 
     def __repr__(self):
         return f"Process:base_call:{self.base_call}"
+
+
+class ProcessCall(NamedTuple):
+    process: Process
+    parameters: list[str] | None = None
+
+
+class ProcessResult(NamedTuple):
+    command: list[str]
+    return_code: int
+    stdout: str
+    stderr: str
+
+
+def _run_process_call(process_call: ProcessCall, dry_run: bool) -> ProcessResult:
+    command: list[str] = process_call.process.get_command(process_call.parameters)
+    LOG.info("Running command %s", " ".join(command))
+    if dry_run:
+        LOG.info("Dry run: process call will not be executed!!")
+        return ProcessResult(command=command, return_code=EXIT_SUCCESS, stdout="", stderr="")
+    completed_process: subprocess.CompletedProcess = process_call.process.execute(command)
+    return ProcessResult(
+        command=command,
+        return_code=completed_process.returncode,
+        stdout=completed_process.stdout.decode("utf-8").rstrip(),
+        stderr=completed_process.stderr.decode("utf-8").rstrip(),
+    )
+
+
+def run_processes(
+    process_calls: list[ProcessCall],
+    max_workers: int = MAX_CONCURRENT_PROCESSES,
+    dry_run: bool = False,
+    check: bool = True,
+) -> list[ProcessResult]:
+    """Run process calls with at most max_workers running at the same time and return their
+    results in the order of the calls. The output is returned in the results and not stored on
+    the processes, so the same process can be called several times.
+
+    Raises:
+        CalledProcessError for the first failed call when all calls have finished, if check is set.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results: list[ProcessResult] = list(
+            executor.map(partial(_run_process_call, dry_run=dry_run), process_calls)
+        )
+    failed_results: list[ProcessResult] = [
+        result for result in results if result.return_code != EXIT_SUCCESS
+    ]
+    for result in failed_results:
+        LOG.critical("Call %s exit with a non zero exit code", result.command)
+        LOG.critical(result.stderr)
+    if check and failed_results:
+        raise CalledProcessError(
+            failed_results[0].return_code,
+            failed_results[0].command,
+            output=failed_results[0].stdout,
+            stderr=failed_results[0].stderr,
+        )
+    return results
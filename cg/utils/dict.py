@@ -1,7 +1,9 @@
 """Module to handle dictionary helper functions."""
 
+from typing import Iterable
 
-def remove_duplicate_dicts(dicts: list[dict]) -> list[dict]:
+
+def remove_duplicate_dicts(dicts: Iterable[dict]) -> list[dict]:
     return [
         dict(dictionary_tuple)
         for dictionary_tuple in {tuple(dictionary.items()) for dictionary in dicts}
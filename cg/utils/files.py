@@ -1,13 +1,18 @@
 """Some helper functions for working with files."""
 
+import errno
 import logging
 import os
 import shutil
 from importlib.resources import files
 from pathlib import Path
+from typing import BinaryIO
 
 LOG = logging.getLogger(__name__)
 
+KERNEL_COPY_CHUNK_SIZE: int = 1 << 30
+KERNEL_COPY_FALLBACK_ERRORS: set[int] = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}
+
 
 def get_project_root_dir() -> Path:
     return Path(files("cg"))
@@ -114,3 +119,63 @@ def get_source_modified_time_stamp(source_path: Path) -> float:
     if not source_path.exists():
         raise FileNotFoundError(f"Directory with path {source_path} is not found.")
     return os.stat(source_path).st_mtime
+
+
+def _copy_with_kernel(copy_function, source_descriptor: int, destination_descriptor: int) -> int:
+    """Copy all remaining bytes from source to destination with a kernel-side copy function."""
+    copied_bytes: int = 0
+    while True:
+        chunk_bytes: int = copy_function(source_descriptor, destination_descriptor)
+        if chunk_bytes == 0:
+            return copied_bytes
+        copied_bytes += chunk_bytes
+
+
+def _copy_file_range(source_descriptor: int, destination_descriptor: int) -> int:
+    return os.copy_file_range(source_descriptor, destination_descriptor, KERNEL_COPY_CHUNK_SIZE)
+
+
+def _sendfile(source_descriptor: int, destination_descriptor: int) -> int:
+    return os.sendfile(destination_descriptor, source_descriptor, None, KERNEL_COPY_CHUNK_SIZE)
+
+
+def append_file_content(source_path: Path, destination: BinaryIO) -> int:
+    """Append the content of a file to an open binary file and return the number of copied bytes.
+    The copy is done kernel-side with copy_file_range or sendfile when the platform and file
+    systems support it, with a fallback to copying through user space."""
+    destination.flush()
+    destination_descriptor: int = destination.fileno()
+    with open(source_path, "rb") as source:
+        source_descriptor: int = source.fileno()
+        for copy_function_name, copy_function in (
+            ("copy_file_range", _copy_file_range),
+            ("sendfile", _sendfile),
+        ):
+            if not hasattr(os, copy_function_name):
+                continue
+            start_position: int = os.lseek(source_descriptor, 0, os.SEEK_CUR)
+            try:
+                return _copy_with_kernel(
+                    copy_function=copy_function,
+                    source_descriptor=source_descriptor,
+                    destination_descriptor=destination_descriptor,
+                )
+            except OSError as error:
+                if error.errno not in KERNEL_COPY_FALLBACK_ERRORS:
+                    raise
+                if os.lseek(source_descriptor, 0, os.SEEK_CUR) != start_position:
+                    raise
+                LOG.debug(f"{copy_function_name} not supported for {source_path}: {error}")
+        start_position: int = os.lseek(destination_descriptor, 0, os.SEEK_CUR)
+        shutil.copyfileobj(source, destination)
+        destination.flush()
+        return os.lseek(destination_descriptor, 0, os.SEEK_CUR) - start_position
+
+
+def concatenate_files(input_files: list[Path], output_file: Path) -> int:
+    """Concatenate files into an output file and return the number of written bytes."""
+    written_bytes: int = 0
+    with open(output_file, "wb") as write_file_obj:
+        for input_file in input_files:
+            written_bytes += append_file_content(source_path=input_file, destination=write_file_obj)
+    return written_bytes
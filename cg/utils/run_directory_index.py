@@ -0,0 +1,102 @@
+"""In-memory index of the files in a run directory tree."""
+
+import logging
+import os
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+LOG = logging.getLogger(__name__)
+
+
+class RunDirectoryIndex:
+    """Scan a directory tree once and answer file queries from memory.
+
+    Symlinked directories are listed but not followed, like os.walk does by default.
+    """
+
+    def __init__(self, directory: Path):
+        """Scan the directory.
+        Raises:
+            FileNotFoundError: If the directory does not exist.
+        """
+        if not directory.is_dir():
+            raise FileNotFoundError(f"Directory {directory} does not exist")
+        self.directory: Path = directory
+        self.files: list[Path] = []
+        self.files_by_name: dict[str, list[Path]] = {}
+        self.relative_paths: dict[Path, str] = {}
+        self._files_by_name_prefix: dict[str, dict[str, list[Path]]] = {}
+        self._scan()
+
+    def _scan(self) -> None:
+        self._scan_directory(self.directory)
+        LOG.debug(f"Indexed {len(self.files)} files in {self.directory}")
+
+    def _scan_directory(self, directory: Path) -> None:
+        """Index the files of a directory before those of its subdirectories, as os.walk does."""
+        subdirectories: list[Path] = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirectories.append(Path(entry.path))
+                    continue
+                self._add_file(Path(entry.path))
+        for subdirectory in subdirectories:
+            self._scan_directory(subdirectory)
+
+    def _add_file(self, file_path: Path) -> None:
+        self.files.append(file_path)
+        self.files_by_name.setdefault(file_path.name, []).append(file_path)
+        self.relative_paths[file_path] = file_path.relative_to(self.directory).as_posix()
+
+    def get_file(self, file_name: str) -> Path:
+        """Return the first file with the given name.
+        Raises:
+            FileNotFoundError: If no file has the name.
+        """
+        if file_paths := self.files_by_name.get(file_name):
+            return file_paths[0]
+        raise FileNotFoundError(f"File {file_name} not found in {self.directory}")
+
+    def has_file(self, file_name: str) -> bool:
+        """Return True if a file with the given name exists in the directory tree."""
+        return file_name in self.files_by_name
+
+    def glob(self, pattern: str) -> list[Path]:
+        """Return the files matching a glob pattern relative to the indexed directory.
+        As with Path.glob, wildcards do not match across directory separators."""
+        return [
+            file_path
+            for file_path in self.files
+            if self.is_matching_glob(file_path=file_path, pattern=pattern)
+        ]
+
+    def is_matching_glob(self, file_path: Path, pattern: str) -> bool:
+        """Return True if an indexed file matches a glob pattern relative to the directory."""
+        relative_parts: list[str] = self.relative_paths[file_path].split("/")
+        pattern_parts: list[str] = pattern.split("/")
+        return len(relative_parts) == len(pattern_parts) and all(
+            fnmatchcase(part, pattern_part)
+            for part, pattern_part in zip(relative_parts, pattern_parts)
+        )
+
+    def get_files_with_name_prefix(self, prefix: str, separator: str) -> list[Path]:
+        """Return the files whose name starts with the prefix directly followed by the separator.
+        The lookup table for a separator is built on first use."""
+        if separator not in self._files_by_name_prefix:
+            self._files_by_name_prefix[separator] = self._group_files_by_name_prefix(separator)
+        return self._files_by_name_prefix[separator].get(prefix, [])
+
+    def _group_files_by_name_prefix(self, separator: str) -> dict[str, list[Path]]:
+        files_by_prefix: dict[str, list[Path]] = {}
+        for file_path in self.files:
+            name: str = file_path.name
+            prefixes: set[str] = set()
+            separator_index: int = name.find(separator)
+            while separator_index != -1:
+                prefixes.add(name[:separator_index])
+                separator_index = name.find(separator, separator_index + 1)
+            for prefix in prefixes:
+                files_by_prefix.setdefault(prefix, []).append(file_path)
+        return files_by_prefix
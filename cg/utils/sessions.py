@@ -0,0 +1,12 @@
+"""Helpers for database sessions used from worker threads."""
+
+from housekeeper.store import database as housekeeper_database
+
+from cg.store.database import get_scoped_session_registry
+
+
+def remove_thread_sessions() -> None:
+    """Close the database sessions of the current thread and return their connections."""
+    for registry in [get_scoped_session_registry(), housekeeper_database.SESSION]:
+        if registry:
+            registry.remove()
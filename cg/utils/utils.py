@@ -1,6 +1,9 @@
 """Helper functions."""
 
 import re
+from typing import Iterator, Sequence, TypeVar
+
+T = TypeVar("T")
 
 
 def build_command_from_dict(options: dict, exclude_true: bool = False) -> list[str]:
@@ -30,3 +33,9 @@ def get_hamming_distance(str_1: str, str_2: str) -> int:
 def replace_non_alphanumeric(string: str, replace_by="_") -> str:
     """Replace non-alphanumeric characters from a string."""
     return re.sub(r"\W+", replace_by, string)
+
+
+def get_chunks(items: Sequence[T], chunk_size: int) -> Iterator[list[T]]:
+    """Yield consecutive chunks of at most chunk_size items."""
+    for start in range(0, len(items), chunk_size):
+        yield list(items[start : start + chunk_size])
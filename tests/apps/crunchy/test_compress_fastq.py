@@ -229,3 +229,48 @@ def test_spring_to_fastq_uses_explicit_memory_and_minutes(
     # THEN the CrunchyAPI instance's own config values are left untouched
     assert crunchy_api.fallback_memory != 42
     assert crunchy_api.fallback_minutes != 195
+
+
+def test_fastq_to_spring_array(
+    crunchy_config: dict,
+    compression_object: CompressionData,
+    sbatch_process: Process,
+    sbatch_job_number: int,
+):
+    """Test submitting FASTQ compression of several runs as a job array"""
+    # GIVEN a crunchy-api and two runs to compress
+    crunchy_api = CrunchyAPI(crunchy_config)
+    crunchy_api.slurm_api.process = sbatch_process
+    other_compression_object = CompressionData(
+        Path(compression_object.stub.parent, "other_run_L001")
+    )
+    compression_objects: list[CompressionData] = [compression_object, other_compression_object]
+
+    # WHEN submitting the runs as a job array
+    job_ids: dict[str, str] = crunchy_api.fastq_to_spring_array(
+        compression_objects=compression_objects, memory=16, minutes=60
+    )
+
+    # THEN each run maps to its array task job id
+    assert job_ids == {
+        compression_object.run_name: f"{sbatch_job_number}_0",
+        other_compression_object.run_name: f"{sbatch_job_number}_1",
+    }
+
+    # THEN the pending path was created for each run
+    assert all(compression.pending_exists() for compression in compression_objects)
+
+    # THEN a single sbatch script requesting one task per run was written
+    sbatch_paths: list[Path] = list(
+        get_log_dir(compression_object.spring_path).glob("*_fastq_to_spring.sh")
+    )
+    assert len(sbatch_paths) == 1
+    sbatch_content: str = sbatch_paths[0].read_text()
+    assert "#SBATCH --array=0-1" in sbatch_content
+    assert "-o ${spring_path}" in sbatch_content
+
+    # THEN the manifest holds the paths of each run in task order
+    manifest_lines: list[str] = (
+        Path(sbatch_paths[0].as_posix().replace(".sh", "_manifest.tsv")).read_text().splitlines()
+    )
+    assert manifest_lines[1].split("\t")[2] == other_compression_object.spring_path.as_posix()
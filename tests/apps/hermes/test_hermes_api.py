@@ -0,0 +1,145 @@
+from pathlib import Path
+from subprocess import CalledProcessError
+from unittest.mock import Mock, create_autospec
+
+import click
+import pytest
+from pytest_mock import MockerFixture
+
+from cg.apps.hermes import hermes_api as hermes_api_module
+from cg.apps.hermes.hermes_api import HermesApi
+from cg.apps.hermes.models import CGDeliverables
+from cg.utils.commands import Process
+
+DELIVERABLES_JSON: str = '{"workflow": "raredisease", "bundle_id": "case_id", "files": []}'
+
+
+@click.command(context_settings={"ignore_unknown_options": True})
+@click.argument("arguments", nargs=-1, type=click.UNPROCESSED)
+def hermes_cli(arguments: tuple[str]):
+    """Stand-in for the Hermes command line interface."""
+    click.echo(DELIVERABLES_JSON)
+
+
+@click.command(context_settings={"ignore_unknown_options": True})
+@click.argument("arguments", nargs=-1, type=click.UNPROCESSED)
+def failing_hermes_cli(arguments: tuple[str]):
+    """Stand-in for a failing Hermes command line interface."""
+    raise click.ClickException("Could not convert deliverables")
+
+
+def get_hermes_api(mocker: MockerFixture, in_process: bool, is_available: bool) -> HermesApi:
+    hermes_api = HermesApi(
+        config={
+            "hermes": {
+                "binary_path": "apptainer",
+                "container_mount_volume": "/home",
+                "container_path": "hermes.sif",
+                "in_process": in_process,
+            }
+        }
+    )
+    hermes_api.process = create_autospec(Process, stdout=DELIVERABLES_JSON)
+    mocker.patch.object(HermesApi, "is_in_process_available", return_value=is_available)
+    return hermes_api
+
+
+def mock_hermes_entry_point(mocker: MockerFixture, command: click.Command) -> Mock:
+    entry_point = Mock(load=Mock(return_value=command))
+    return mocker.patch.object(
+        hermes_api_module.metadata, "entry_points", return_value=[entry_point]
+    )
+
+
+def test_convert_deliverables_in_container(mocker: MockerFixture):
+    # GIVEN a Hermes API converting in the Hermes container
+    hermes_api: HermesApi = get_hermes_api(mocker=mocker, in_process=False, is_available=True)
+
+    # WHEN converting a deliverables file
+    deliverables: CGDeliverables = hermes_api.convert_deliverables(
+        deliverables_file=Path("deliverables.yaml"), workflow="raredisease"
+    )
+
+    # THEN the Hermes container is run
+    hermes_api.process.run_command.assert_called_once_with(
+        [
+            "run",
+            "--bind",
+            "/home",
+            "hermes.sif",
+            "convert",
+            "deliverables",
+            "--workflow",
+            "raredisease",
+            "deliverables.yaml",
+        ]
+    )
+
+    # THEN the deliverables are parsed from the output
+    assert deliverables.bundle_id == "case_id"
+
+
+def test_convert_deliverables_in_process(mocker: MockerFixture):
+    # GIVEN a Hermes API converting in-process with Hermes installed
+    hermes_api: HermesApi = get_hermes_api(mocker=mocker, in_process=True, is_available=True)
+    entry_points: Mock = mock_hermes_entry_point(mocker=mocker, command=hermes_cli)
+
+    # WHEN converting two deliverables files
+    for _ in range(2):
+        deliverables: CGDeliverables = hermes_api.convert_deliverables(
+            deliverables_file=Path("deliverables.yaml"), workflow="raredisease"
+        )
+
+    # THEN the deliverables are parsed from the output of Hermes
+    assert deliverables.bundle_id == "case_id"
+
+    # THEN the Hermes container is not run
+    hermes_api.process.run_command.assert_not_called()
+
+    # THEN the Hermes command is loaded once
+    entry_points.assert_called_once()
+
+
+def test_convert_deliverables_in_process_without_hermes(mocker: MockerFixture):
+    # GIVEN a Hermes API configured to convert in-process without Hermes installed
+    hermes_api: HermesApi = get_hermes_api(mocker=mocker, in_process=True, is_available=False)
+
+    # WHEN converting a deliverables file
+    hermes_api.convert_deliverables(
+        deliverables_file=Path("deliverables.yaml"), workflow="raredisease"
+    )
+
+    # THEN the Hermes container is run instead
+    hermes_api.process.run_command.assert_called_once()
+
+
+def test_convert_deliverables_in_process_without_entry_point(mocker: MockerFixture, caplog):
+    # GIVEN a Hermes API configured to convert in-process with Hermes installed
+    hermes_api: HermesApi = get_hermes_api(mocker=mocker, in_process=True, is_available=True)
+
+    # GIVEN that the Hermes package has no command line entry point
+    mocker.patch.object(hermes_api_module.metadata, "entry_points", return_value=[])
+
+    # WHEN converting a deliverables file
+    hermes_api.convert_deliverables(
+        deliverables_file=Path("deliverables.yaml"), workflow="raredisease"
+    )
+
+    # THEN the Hermes container is run instead
+    hermes_api.process.run_command.assert_called_once()
+
+    # THEN a warning is logged
+    assert "Found 0 hermes entry points" in caplog.text
+
+
+def test_convert_deliverables_in_process_fails(mocker: MockerFixture):
+    # GIVEN a Hermes API converting in-process with a failing Hermes
+    hermes_api: HermesApi = get_hermes_api(mocker=mocker, in_process=True, is_available=True)
+    mock_hermes_entry_point(mocker=mocker, command=failing_hermes_cli)
+
+    # WHEN converting a deliverables file
+    # THEN a CalledProcessError is raised, as when the container fails
+    with pytest.raises(CalledProcessError):
+        hermes_api.convert_deliverables(
+            deliverables_file=Path("deliverables.yaml"), workflow="raredisease"
+        )
@@ -130,6 +130,43 @@ def test_get_files_from_version(
     assert second_file in files
 
 
+def test_get_files_by_version_ids(
+    helpers: StoreHelpers,
+    real_housekeeper_api: HousekeeperAPI,
+    hk_bundle_data: dict[str, Any],
+    hk_tag: str,
+    observations_clinical_snv_file_path: Path,
+    observations_clinical_sv_file_path: Path,
+):
+    """Test getting the files of several versions in chunks."""
+
+    # GIVEN a Housekeeper API with files in a version
+    version: Version = helpers.ensure_hk_version(real_housekeeper_api, hk_bundle_data)
+    first_file: File = real_housekeeper_api.add_file(
+        path=observations_clinical_snv_file_path, version_obj=version, tags=hk_tag
+    )
+    second_file: File = real_housekeeper_api.add_file(
+        path=observations_clinical_sv_file_path, version_obj=version, tags=hk_tag
+    )
+    real_housekeeper_api.commit()
+
+    # WHEN getting the files of the version and a version that does not exist
+    file_chunks: list[list[File]] = list(
+        real_housekeeper_api.get_files_by_version_ids(
+            version_ids=[version.id, version.id + 1000], chunk_size=1
+        )
+    )
+
+    # THEN one chunk per version is returned
+    assert len(file_chunks) == 2
+
+    # THEN the files of the version are returned with their tags
+    assert first_file in file_chunks[0]
+    assert second_file in file_chunks[0]
+    assert hk_tag in [tag.name for tag in first_file.tags]
+    assert file_chunks[1] == []
+
+
 def test_get_latest_file_from_version(
     helpers: StoreHelpers,
     real_housekeeper_api: HousekeeperAPI,
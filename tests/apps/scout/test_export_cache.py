@@ -0,0 +1,85 @@
+from pathlib import Path
+
+from cg.apps.scout.export_cache import ScoutExportCache, get_panel_versions
+from cg.constants.gene_panel import GENOME_BUILD_37, GENOME_BUILD_38
+from cg.constants.scout import ScoutExportKind
+
+PANEL_EXPORT: list[str] = [
+    "##genome_build=37",
+    "##gene_panel=OMIM-AUTO,version=32.0,updated_at=2024-01-01,display_name=OMIM-AUTO",
+    "##gene_panel=PANEL1,version=2.1,updated_at=2024-02-01,display_name=Panel 1",
+    "#chromosome\tgene_start\tgene_stop\thgnc_id\thgnc_symbol",
+    "1\t1\t100\t1\tGENE1",
+]
+
+
+def test_get_panel_versions():
+    # GIVEN the lines of a gene panel export
+
+    # WHEN getting the panel versions
+    panel_versions: dict[str, str] = get_panel_versions(PANEL_EXPORT)
+
+    # THEN the version of each exported panel is returned
+    assert panel_versions == {"OMIM-AUTO": "32.0", "PANEL1": "2.1"}
+
+
+def test_get_key_ignores_panel_order():
+    # GIVEN a Scout export cache
+    cache = ScoutExportCache()
+
+    # WHEN getting the keys for the same panels in different orders and for another build
+    key: str = cache.get_key(
+        kind=ScoutExportKind.GENE_PANEL, genome_build=GENOME_BUILD_37, panels=["B", "A"]
+    )
+    same_key: str = cache.get_key(
+        kind=ScoutExportKind.GENE_PANEL, genome_build=GENOME_BUILD_37, panels=["A", "B", "A"]
+    )
+    other_key: str = cache.get_key(
+        kind=ScoutExportKind.GENE_PANEL, genome_build=GENOME_BUILD_38, panels=["A", "B"]
+    )
+
+    # THEN the order of the panels does not matter
+    assert key == same_key
+
+    # THEN the genome build is part of the key
+    assert key != other_key
+
+
+def test_export_is_shared_between_caches(tmp_path: Path):
+    # GIVEN a Scout export cache with a cache directory and a stored export
+    cache = ScoutExportCache(directory=tmp_path)
+    cache.store(
+        kind=ScoutExportKind.GENE_PANEL,
+        genome_build=GENOME_BUILD_37,
+        panels=["PANEL1", "OMIM-AUTO"],
+        lines=PANEL_EXPORT,
+    )
+
+    # WHEN getting the export from another cache using the same directory
+    lines: list[str] | None = ScoutExportCache(directory=tmp_path).get(
+        kind=ScoutExportKind.GENE_PANEL,
+        genome_build=GENOME_BUILD_37,
+        panels=["OMIM-AUTO", "PANEL1"],
+    )
+
+    # THEN the stored export is returned
+    assert lines == PANEL_EXPORT
+
+
+def test_expired_export_is_not_returned(tmp_path: Path):
+    # GIVEN a Scout export cache without time to live and a stored export
+    cache = ScoutExportCache(directory=tmp_path, ttl_seconds=-1)
+    cache.store(
+        kind=ScoutExportKind.MANAGED_VARIANTS,
+        genome_build=GENOME_BUILD_37,
+        panels=[],
+        lines=["variant"],
+    )
+
+    # WHEN getting the export
+    lines: list[str] | None = cache.get(
+        kind=ScoutExportKind.MANAGED_VARIANTS, genome_build=GENOME_BUILD_37, panels=[]
+    )
+
+    # THEN no export is returned
+    assert lines is None
@@ -1,9 +1,10 @@
-from unittest.mock import Mock, create_autospec
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import create_autospec
 
 import pytest
 from pytest_mock import MockerFixture
 
-from cg.apps.scout import scoutapi
 from cg.apps.scout.scoutapi import ScoutAPI
 from cg.exc import ScoutExportError
 from cg.models.cg_config import CommonAppConfig
@@ -11,20 +12,26 @@ from cg.services.slurm_upload_service.slurm_upload_service import SlurmUploadSer
 from cg.utils.commands import Process
 
 
-def test_export_panels_with_panel_output(mocker: MockerFixture):
-    # GIVEN scout returns panel output
-    process = create_autospec(
-        Process,
-        stdout="exported_1 exported_2",
+def get_completed_process(stdout: str) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=stdout.encode("utf-8"), stderr=b""
     )
-    process.stdout_lines = Mock(return_value=["exported_1", "exported_2"])
-    mocker.patch.object(scoutapi, "Process", return_value=process)
 
-    scout_api = ScoutAPI(
+
+@pytest.fixture
+def scout_api() -> ScoutAPI:
+    return ScoutAPI(
         scout_config=CommonAppConfig(binary_path="scout/binary", config_path="scout/config"),
         slurm_upload_service=create_autospec(SlurmUploadService),
     )
 
+
+def test_export_panels_with_panel_output(mocker: MockerFixture, scout_api: ScoutAPI):
+    # GIVEN scout returns panel output
+    mocker.patch.object(
+        Process, "execute", return_value=get_completed_process("exported_1\nexported_2")
+    )
+
     # WHEN exporting panels
     result = scout_api.export_panels(panels=["some_panel", "another_panel"])
 
@@ -32,17 +39,47 @@ def test_export_panels_with_panel_output(mocker: MockerFixture):
     assert result == ["exported_1", "exported_2"]
 
 
-def test_export_panels_with_empty_output(mocker: MockerFixture):
+def test_export_panels_with_empty_output(mocker: MockerFixture, scout_api: ScoutAPI):
     # GIVEN scout returns no output
-    process = create_autospec(Process, stdout=None)
-    mocker.patch.object(scoutapi, "Process", return_value=process)
-
-    scout_api = ScoutAPI(
-        scout_config=CommonAppConfig(binary_path="scout/binary", config_path="scout/config"),
-        slurm_upload_service=create_autospec(SlurmUploadService),
-    )
+    mocker.patch.object(Process, "execute", return_value=get_completed_process(""))
 
     # WHEN exporting panels
     # THEN a ScoutExportError is raised
     with pytest.raises(ScoutExportError):
         scout_api.export_panels(panels=["some_panel", "another_panel"])
+
+
+def test_export_panels_reuses_cached_export(mocker: MockerFixture, scout_api: ScoutAPI):
+    # GIVEN scout returns panel output
+    execute = mocker.patch.object(
+        Process, "execute", return_value=get_completed_process("exported_1\nexported_2")
+    )
+
+    # GIVEN that the panels have been exported
+    scout_api.export_panels(panels=["some_panel", "another_panel"])
+
+    # WHEN exporting the same panels in another order
+    result = scout_api.export_panels(panels=["another_panel", "some_panel"])
+
+    # THEN the cached export is returned without calling scout again
+    assert result == ["exported_1", "exported_2"]
+    execute.assert_called_once()
+
+
+def test_export_panels_from_several_threads(mocker: MockerFixture, scout_api: ScoutAPI):
+    # GIVEN scout exports the panel named in the command
+    mocker.patch.object(
+        Process,
+        "execute",
+        side_effect=lambda command: get_completed_process(command[-3]),
+    )
+
+    # WHEN exporting different panels from several threads with the same scout API
+    panels: list[str] = [f"panel_{index}" for index in range(20)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results: list[list[str]] = list(
+            executor.map(lambda panel: scout_api.export_panels(panels=[panel]), panels)
+        )
+
+    # THEN each export returns the output of its own command
+    assert results == [[panel] for panel in panels]
@@ -177,3 +177,63 @@ def test_submit_sbatch_script_invalid_sbatch_response(
 
     # THEN assert that a job number 0 indicating malfunction
     assert job_number == 0
+
+
+def test_generate_sbatch_header_for_array(sbatch_parameters: Sbatch):
+    # GIVEN a Sbatch object for a job array with three tasks
+    sbatch_parameters.array = "--array=0-2"
+
+    # WHEN building a sbatch header
+    sbatch_header: str = SlurmAPI.generate_sbatch_header(sbatch_parameters)
+
+    # THEN the array option is included
+    assert "#SBATCH --array=0-2\n" in sbatch_header
+
+    # THEN each array task gets its own log files
+    assert f"--error={sbatch_parameters.log_dir}/test_%A_%a.stderr" in sbatch_header
+    assert f"--output={sbatch_parameters.log_dir}/test_%A_%a.stdout" in sbatch_header
+
+
+def test_submit_sbatch_array(
+    sbatch_content: str, slurm_api: SlurmAPI, tmp_path: Path, sbatch_job_number: int
+):
+    # GIVEN a slurm api, some sbatch content and a manifest with two tasks
+    manifest_rows: list[list[str]] = [
+        ["first.fastq.gz", "first.spring"],
+        ["second.fastq.gz", "second.spring"],
+    ]
+    manifest_path = Path(tmp_path, "manifest.tsv")
+
+    # WHEN submitting the job array
+    job_ids: list[str] = slurm_api.submit_sbatch_array(
+        sbatch_content=sbatch_content,
+        sbatch_path=Path(tmp_path, "array.sh"),
+        manifest_rows=manifest_rows,
+        manifest_path=manifest_path,
+    )
+
+    # THEN the manifest has one tab separated line per task
+    assert (
+        manifest_path.read_text()
+        == "first.fastq.gz\tfirst.spring\nsecond.fastq.gz\tsecond.spring\n"
+    )
+
+    # THEN the job id of each array task is returned
+    assert job_ids == [f"{sbatch_job_number}_0", f"{sbatch_job_number}_1"]
+
+
+def test_generate_array_task_commands():
+    # GIVEN some commands using variables from a manifest
+    commands = "crunchy compress ${fastq_first}"
+
+    # WHEN generating the array task commands
+    task_commands: str = SlurmAPI.generate_array_task_commands(
+        commands=commands,
+        manifest_path=Path("manifest.tsv"),
+        variables=["fastq_first", "spring_path"],
+    )
+
+    # THEN the line of the array task is read into the variables before running the commands
+    assert "read -r fastq_first spring_path" in task_commands
+    assert '$((SLURM_ARRAY_TASK_ID + 1))p" manifest.tsv' in task_commands
+    assert task_commands.endswith(commands)
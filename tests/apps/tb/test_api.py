@@ -653,3 +653,49 @@ def test_get_delivered_analyses_for_order_raises_error(
     # THEN a TrailblazerAPIHTTPError should be raised
     with pytest.raises(TrailblazerAPIHTTPError):
         trailblazer_api.get_delivered_analyses_for_order(order_id=1)
+
+
+def get_latest_analysis_response(case_id: str, status: str) -> dict:
+    return {
+        "id": 1,
+        "case_id": case_id,
+        "logged_at": "2025-05-21",
+        "started_at": "2025-05-21",
+        "completed_at": "",
+        "out_dir": "/out/dir",
+        "config_path": "/config/path",
+        "status": status,
+    }
+
+
+@pytest.mark.usefixtures("valid_google_credentials")
+def test_get_latest_analysis_memoized(valid_trailblazer_config: dict, mocker: MockerFixture):
+    # GIVEN a Trailblazer API memoizing latest analyses
+    trailblazer_api = TrailblazerAPI(config=valid_trailblazer_config, memoize_latest_analyses=True)
+
+    # GIVEN that Trailblazer has a completed analysis for a case
+    query_trailblazer: Mock = mocker.patch.object(
+        TrailblazerAPI,
+        "query_trailblazer",
+        side_effect=[
+            get_latest_analysis_response("case_1", "completed"),
+            None,
+            get_latest_analysis_response("case_1", "failed"),
+        ],
+    )
+
+    # WHEN checking the status of the case several times
+    assert trailblazer_api.is_latest_analysis_completed("case_1")
+    assert not trailblazer_api.is_latest_analysis_qc("case_1")
+
+    # THEN the latest analysis of the case is requested once
+    query_trailblazer.assert_called_once_with(
+        command="get-latest-analysis", request_body={"case_id": "case_1"}
+    )
+
+    # WHEN setting the status of the analysis
+    trailblazer_api.set_analysis_status(case_id="case_1", status="failed")
+
+    # THEN the latest analysis of the case is requested again
+    assert trailblazer_api.get_latest_analysis_status("case_1") == "failed"
+    assert query_trailblazer.call_count == 3
@@ -0,0 +1,62 @@
+"""Throughput benchmark for FASTQ concatenation."""
+
+import logging
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from cg.utils.files import concatenate_files
+
+LOG = logging.getLogger(__name__)
+
+NUMBER_OF_LANE_FILES: int = 4
+LANE_FILE_SIZE: int = 256 * 1024 * 1024
+
+
+def concatenate_through_user_space(input_files: list[Path], output_file: Path) -> None:
+    with open(output_file, "wb") as write_file_obj:
+        for input_file in input_files:
+            with open(input_file, "rb") as file_descriptor:
+                shutil.copyfileobj(file_descriptor, write_file_obj)
+
+
+@pytest.fixture(scope="module")
+def lane_fastq_files(tmp_path_factory) -> list[Path]:
+    """Return a number of large lane fastq files."""
+    directory: Path = tmp_path_factory.mktemp("lane_fastqs")
+    lane_files: list[Path] = []
+    for lane in range(1, NUMBER_OF_LANE_FILES + 1):
+        lane_file = Path(directory, f"sample_L00{lane}_R1_001.fastq.gz")
+        with open(lane_file, "wb") as file_obj:
+            file_obj.truncate(LANE_FILE_SIZE)
+        lane_files.append(lane_file)
+    return lane_files
+
+
+@pytest.mark.benchmark
+def test_concatenation_throughput(lane_fastq_files: list[Path], tmp_path: Path):
+    # GIVEN lane fastq files
+    total_size: int = NUMBER_OF_LANE_FILES * LANE_FILE_SIZE
+
+    # WHEN concatenating them through user space and kernel-side
+    start: float = time.perf_counter()
+    concatenate_through_user_space(
+        input_files=lane_fastq_files, output_file=Path(tmp_path, "user_space.fastq.gz")
+    )
+    user_space_time: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    written_bytes: int = concatenate_files(
+        input_files=lane_fastq_files, output_file=Path(tmp_path, "kernel.fastq.gz")
+    )
+    kernel_time: float = time.perf_counter() - start
+
+    LOG.info(
+        f"User space: {total_size / user_space_time / 1e6:.0f} MB/s, "
+        f"kernel-side: {total_size / kernel_time / 1e6:.0f} MB/s"
+    )
+
+    # THEN all bytes are written
+    assert written_bytes == total_size
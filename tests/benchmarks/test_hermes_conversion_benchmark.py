@@ -0,0 +1,67 @@
+"""Benchmark of Hermes deliverables conversion in the Hermes container and in-process.
+
+Set CG_BENCHMARK_HERMES_CONTAINER, CG_BENCHMARK_HERMES_DELIVERABLES and
+CG_BENCHMARK_HERMES_WORKFLOW to run it. The container runtime binary defaults to apptainer.
+"""
+
+import logging
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from cg.apps.hermes.hermes_api import HermesApi
+
+LOG = logging.getLogger(__name__)
+
+NUMBER_OF_CONVERSIONS: int = 5
+
+
+@pytest.fixture
+def hermes_benchmark_config() -> dict:
+    """Return a Hermes configuration from the environment, skipping the benchmark if not set."""
+    container_path: str | None = os.environ.get("CG_BENCHMARK_HERMES_CONTAINER")
+    deliverables_file: str | None = os.environ.get("CG_BENCHMARK_HERMES_DELIVERABLES")
+    if not container_path or not deliverables_file:
+        pytest.skip("No Hermes container or deliverables file configured")
+    if not HermesApi.is_in_process_available():
+        pytest.skip("Hermes is not installed")
+    return {
+        "hermes": {
+            "binary_path": os.environ.get("CG_BENCHMARK_CONTAINER_BINARY", "apptainer"),
+            "container_mount_volume": Path(deliverables_file).parent.as_posix(),
+            "container_path": container_path,
+        }
+    }
+
+
+def time_conversions(hermes_api: HermesApi) -> float:
+    start: float = time.perf_counter()
+    for _ in range(NUMBER_OF_CONVERSIONS):
+        hermes_api.convert_deliverables(
+            deliverables_file=Path(os.environ["CG_BENCHMARK_HERMES_DELIVERABLES"]),
+            workflow=os.environ.get("CG_BENCHMARK_HERMES_WORKFLOW", "raredisease"),
+            force=True,
+        )
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+def test_hermes_conversion_time(hermes_benchmark_config: dict):
+    # GIVEN a Hermes API converting in the container and one converting in-process
+    container_api = HermesApi(config=hermes_benchmark_config)
+    hermes_benchmark_config["hermes"]["in_process"] = True
+    in_process_api = HermesApi(config=hermes_benchmark_config)
+
+    # WHEN converting the same deliverables file several times with each
+    container_time: float = time_conversions(container_api)
+    in_process_time: float = time_conversions(in_process_api)
+
+    LOG.info(
+        f"Container: {container_time / NUMBER_OF_CONVERSIONS:.2f} s per conversion, "
+        f"in-process: {in_process_time / NUMBER_OF_CONVERSIONS:.2f} s per conversion"
+    )
+
+    # THEN the in-process conversion is faster
+    assert in_process_time < container_time
@@ -0,0 +1,60 @@
+"""Decoding and encoding benchmark for the JSON backends."""
+
+import logging
+import time
+from pathlib import Path
+
+import pytest
+
+from cg.io.json import JsonBackend, OrjsonBackend, orjson
+
+LOG = logging.getLogger(__name__)
+
+METRICS_FILE_SIZE: int = 50 * 1024 * 1024
+
+
+@pytest.fixture(scope="module")
+def metrics_file(tmp_path_factory) -> Path:
+    """Return a synthetic MultiQC-like metrics file of about 50 MB."""
+    metrics_file = Path(tmp_path_factory.mktemp("metrics"), "multiqc_data.json")
+    samples: dict[str, dict] = {}
+    sample_index: int = 0
+    size: int = 0
+    while size < METRICS_FILE_SIZE:
+        sample_metrics: dict = {
+            f"metric_{metric}": sample_index * 0.001 + metric for metric in range(100)
+        }
+        samples[f"ACC{sample_index:07d}"] = sample_metrics
+        size += 24 * len(sample_metrics)
+        sample_index += 1
+    metrics_file.write_text(
+        JsonBackend().dumps({"report_general_stats_data": [samples]}, compact=True)
+    )
+    return metrics_file
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(orjson is None, reason="orjson is not installed")
+def test_json_backend_throughput(metrics_file: Path):
+    # GIVEN a large metrics file
+    data: bytes = metrics_file.read_bytes()
+
+    # WHEN decoding and encoding it with the standard library and with orjson
+    timings: dict[str, tuple[float, float]] = {}
+    for backend in [JsonBackend(), OrjsonBackend()]:
+        start: float = time.perf_counter()
+        content: dict = backend.loads(data)
+        decode_time: float = time.perf_counter() - start
+        start = time.perf_counter()
+        backend.dumps(content, compact=True)
+        timings[backend.name] = (decode_time, time.perf_counter() - start)
+
+    for name, (decode_time, encode_time) in timings.items():
+        LOG.info(
+            f"{name}: decode {len(data) / decode_time / 1e6:.0f} MB/s, "
+            f"encode {len(data) / encode_time / 1e6:.0f} MB/s"
+        )
+
+    # THEN orjson is faster than the standard library
+    assert timings["orjson"][0] < timings["json"][0]
+    assert timings["orjson"][1] < timings["json"][1]
@@ -0,0 +1,356 @@
+"""Benchmarks of StatusDB hot paths against a synthetic large-scale database.
+
+Each timing is divided by the time of a reference query, loading all samples of the same
+database, so that the timings can be compared on any host. The relative timings are asserted
+against the baselines in baselines/status_db.json. Run with the environment variable
+CG_UPDATE_BENCHMARK_BASELINES set to store the relative timings of the current run as new
+baselines.
+"""
+
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Generator
+from unittest import mock
+
+import pytest
+
+from cg.apps.lims import LimsAPI
+from cg.apps.tb.api import TrailblazerAPI
+from cg.apps.tb.dto.summary_response import AnalysisSummary, StatusSummary
+from cg.constants import Workflow
+from cg.constants.constants import FileFormat, SequencingQCStatus
+from cg.constants.devices import DeviceType
+from cg.constants.invoice import CostCenters
+from cg.constants.lims import LimsStatus
+from cg.constants.subject import Sex
+from cg.io.controller import ReadFile, WriteFile
+from cg.meta.invoice import InvoiceAPI
+from cg.services.orders.order_service.models import OrderQueryParams
+from cg.services.orders.order_summary_service.order_summary_service import OrderSummaryService
+from cg.store.database import create_all_tables, drop_all_tables, initialize_database
+from cg.store.models import (
+    ApplicationVersion,
+    Case,
+    Customer,
+    IlluminaSampleSequencingMetrics,
+    IlluminaSequencingRun,
+    Invoice,
+    Order,
+    Sample,
+    order_case,
+)
+from cg.store.store import Store
+from tests.store_helpers import StoreHelpers
+
+LOG = logging.getLogger(__name__)
+
+NUMBER_OF_ORDERS: int = 1000
+CASES_PER_ORDER: int = 10
+SAMPLES_PER_CASE: int = 3
+NUMBER_OF_INVOICED_SAMPLES: int = 1000
+NUMBER_OF_CUSTOMERS: int = 20
+ROUNDS: int = 3
+
+BASELINE_FILE = Path(Path(__file__).parent, "baselines", "status_db.json")
+BASELINE_TOLERANCE: float = 3.0
+UPDATE_BASELINES_ENV: str = "CG_UPDATE_BENCHMARK_BASELINES"
+
+SEQUENCING_QC_STATUSES: list[SequencingQCStatus] = [
+    SequencingQCStatus.PASSED,
+    SequencingQCStatus.PENDING,
+    SequencingQCStatus.FAILED,
+]
+LIMS_STATUSES: list[LimsStatus] = [LimsStatus.DONE, LimsStatus.PENDING, LimsStatus.TOP_UP]
+WORKFLOWS: list[Workflow] = [Workflow.MIP_DNA, Workflow.BALSAMIC, Workflow.MICROSALT]
+
+
+def _add_orders_with_cases_and_samples(
+    store: Store,
+    customers: list[Customer],
+    application_version: ApplicationVersion,
+    sequencing_run: IlluminaSequencingRun,
+) -> None:
+    """Add orders with cases, samples and sequencing metrics in one transaction per order."""
+    now = datetime.now()
+    for order_index in range(NUMBER_OF_ORDERS):
+        customer: Customer = customers[order_index % len(customers)]
+        order = Order(
+            customer=customer,
+            name=f"order_{order_index}",
+            order_date=now - timedelta(days=order_index),
+            ticket_id=100_000 + order_index,
+            is_open=order_index % 4 != 0,
+        )
+        store.session.add(order)
+        cases: list[Case] = []
+        for case_index in range(CASES_PER_ORDER):
+            entry: int = order_index * CASES_PER_ORDER + case_index
+            case: Case = store.add_case(
+                data_analysis=WORKFLOWS[entry % len(WORKFLOWS)],
+                data_delivery="fastq",
+                name=f"case_{entry}",
+                ticket=str(order.ticket_id),
+            )
+            case.internal_id = f"case{entry:06d}"
+            case.customer = customer
+            case.aggregated_sequencing_qc = SEQUENCING_QC_STATUSES[entry % 3]
+            for sample_index in range(SAMPLES_PER_CASE):
+                sample_entry: int = entry * SAMPLES_PER_CASE + sample_index
+                is_sequenced: bool = sample_entry % 3 != 0
+                sample: Sample = store.add_sample(
+                    name=f"sample_{sample_entry}",
+                    sex=Sex.FEMALE,
+                    internal_id=f"ACC{sample_entry:07d}",
+                    last_sequenced_at=now if is_sequenced else None,
+                    original_ticket=str(order.ticket_id),
+                    received=now - timedelta(days=1),
+                    prepared_at=now if sample_entry % 5 else None,
+                    lims_status=LIMS_STATUSES[sample_entry % len(LIMS_STATUSES)],
+                )
+                sample.application_version = application_version
+                sample.customer = customer
+                if is_sequenced:
+                    store.session.add(
+                        IlluminaSampleSequencingMetrics(
+                            sample=sample,
+                            instrument_run=sequencing_run,
+                            type=DeviceType.ILLUMINA,
+                            flow_cell_lane=sample_entry % 8 + 1,
+                            total_reads_in_lane=100_000_000,
+                            base_passing_q30_percent=90,
+                            base_mean_quality_score=35,
+                            yield_=100,
+                            yield_q30=0.9,
+                            created_at=now,
+                        )
+                    )
+                store.session.add(
+                    store.relate_sample(
+                        case=case, sample=sample, status="unknown", should_deliver_sample=True
+                    )
+                )
+            cases.append(case)
+        store.session.flush()
+        store.session.execute(
+            order_case.insert(), [{"order_id": order.id, "case_id": case.id} for case in cases]
+        )
+        store.session.commit()
+
+
+@pytest.fixture(scope="module")
+def large_store() -> Generator[Store, None, None]:
+    """Return a store with tens of thousands of samples, cases and sequencing metrics spread
+    over a thousand orders, and an invoice of a thousand samples."""
+    initialize_database("sqlite:///")
+    create_all_tables()
+    store = Store()
+    helpers = StoreHelpers()
+    start: float = time.perf_counter()
+    customers: list[Customer] = [
+        helpers.ensure_customer(store=store, customer_id=f"cust{100 + index}")
+        for index in range(NUMBER_OF_CUSTOMERS)
+    ]
+    application_version: ApplicationVersion = helpers.ensure_application_version(
+        store=store, application_tag="WGSPCFC030"
+    )
+    sequencing_run: IlluminaSequencingRun = helpers.add_illumina_sequencing_run(
+        store=store, flow_cell=helpers.ensure_illumina_flow_cell(store=store)
+    )
+    _add_orders_with_cases_and_samples(
+        store=store,
+        customers=customers,
+        application_version=application_version,
+        sequencing_run=sequencing_run,
+    )
+    invoiced_samples: list[Sample] = [
+        helpers.add_sample(
+            store=store,
+            application_tag="WGSPCFC030",
+            customer_id=customers[0].internal_id,
+            internal_id=f"INV{index:07d}",
+        )
+        for index in range(NUMBER_OF_INVOICED_SAMPLES)
+    ]
+    helpers.ensure_invoice(
+        store=store, customer_id=customers[0].internal_id, samples=invoiced_samples
+    )
+    LOG.info(f"Built synthetic StatusDB in {time.perf_counter() - start:.1f} s")
+    yield store
+    drop_all_tables()
+
+
+def get_fastest_time(function: Callable[[], Any], store: Store) -> tuple[Any, float]:
+    """Return the result of the function and its fastest time of a number of rounds, each with
+    an empty session."""
+    seconds: float = float("inf")
+    for _ in range(ROUNDS):
+        store.session.expire_all()
+        start: float = time.perf_counter()
+        result: Any = function()
+        seconds = min(seconds, time.perf_counter() - start)
+    return result, seconds
+
+
+class Baselines:
+    """Timings of the current run relative to a reference query, and the stored baselines they
+    are compared with."""
+
+    def __init__(self, file_path: Path, store: Store):
+        self.file_path: Path = file_path
+        self.stored: dict[str, float] = (
+            ReadFile.get_content_from_file(file_format=FileFormat.JSON, file_path=file_path)
+            if file_path.exists()
+            else {}
+        )
+        self.timings: dict[str, float] = {}
+        _, self.reference_seconds = get_fastest_time(
+            function=lambda: store._get_query(table=Sample).all(), store=store
+        )
+        LOG.info(f"Reference query: {self.reference_seconds * 1000:.1f} ms")
+
+    def benchmark(self, name: str, function: Callable[[], Any], store: Store) -> Any:
+        """Return the result of the function and fail if its time relative to the reference
+        query is much slower than the baseline."""
+        result, seconds = get_fastest_time(function=function, store=store)
+        relative_time: float = seconds / self.reference_seconds
+        self.timings[name] = round(relative_time, 4)
+        baseline: float | None = self.stored.get(name)
+        LOG.info(f"{name}: {seconds * 1000:.1f} ms, {relative_time:.3f} times the reference")
+        if baseline and not os.environ.get(UPDATE_BASELINES_ENV):
+            assert relative_time < baseline * BASELINE_TOLERANCE, (
+                f"{name} took {relative_time:.3f} times the reference query, "
+                f"baseline is {baseline:.3f}"
+            )
+        return result
+
+    def store_timings(self) -> None:
+        """Store the relative timings of the run, keeping the baselines of other benchmarks."""
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        WriteFile.write_file_from_content(
+            content=self.stored | self.timings,
+            file_format=FileFormat.JSON,
+            file_path=self.file_path,
+        )
+
+
+@pytest.fixture(scope="module")
+def baselines(large_store: Store) -> Generator[Baselines, None, None]:
+    """Return the baselines, storing the timings of the run as new baselines when requested."""
+    baselines = Baselines(file_path=BASELINE_FILE, store=large_store)
+    yield baselines
+    if os.environ.get(UPDATE_BASELINES_ENV):
+        baselines.store_timings()
+
+
+@pytest.mark.benchmark
+def test_get_cases_to_analyze(large_store: Store, baselines: Baselines):
+    # GIVEN a large store
+
+    # WHEN getting the cases to analyze
+    cases: list[Case] = baselines.benchmark(
+        name="get_cases_to_analyze",
+        function=lambda: large_store.get_cases_to_analyze(workflow=Workflow.MIP_DNA),
+        store=large_store,
+    )
+
+    # THEN cases are returned
+    assert cases
+
+
+@pytest.mark.benchmark
+def test_get_unhandled_samples(large_store: Store, baselines: Baselines):
+    # GIVEN a large store
+
+    # WHEN getting the first page of unhandled samples
+    samples, total = baselines.benchmark(
+        name="get_paginated_unhandled_samples",
+        function=lambda: large_store.get_paginated_unhandled_samples(
+            lims_status=LimsStatus.TOP_UP, page=1, page_size=50
+        ),
+        store=large_store,
+    )
+
+    # THEN a page of samples is returned
+    assert len(samples) == 50
+    assert total > 50
+
+
+@pytest.mark.benchmark
+def test_get_orders(large_store: Store, baselines: Baselines):
+    # GIVEN a large store
+
+    # WHEN getting the first page of open orders
+    orders, total = baselines.benchmark(
+        name="get_orders",
+        function=lambda: large_store.get_orders(OrderQueryParams(is_open=True)),
+        store=large_store,
+    )
+
+    # THEN a page of orders is returned
+    assert len(orders) == 50
+    assert total == NUMBER_OF_ORDERS * 3 // 4
+
+
+@pytest.mark.benchmark
+def test_order_summaries(large_store: Store, baselines: Baselines):
+    # GIVEN a large store and a Trailblazer API without analyses
+    order_ids: list[int] = list(range(1, 51))
+    analysis_client: TrailblazerAPI = mock.create_autospec(TrailblazerAPI)
+    analysis_client.get_summaries.return_value = [
+        AnalysisSummary(
+            order_id=order_id,
+            cancelled=StatusSummary(),
+            completed=StatusSummary(),
+            delivered=StatusSummary(),
+            failed=StatusSummary(),
+            running=StatusSummary(),
+        )
+        for order_id in order_ids
+    ]
+    service = OrderSummaryService(analysis_client=analysis_client, store=large_store)
+
+    # WHEN summarising a page of orders
+    summaries: list = baselines.benchmark(
+        name="order_summaries",
+        function=lambda: service.get_summaries(order_ids),
+        store=large_store,
+    )
+
+    # THEN each order is summarised
+    assert len(summaries) == len(order_ids)
+
+
+@pytest.mark.benchmark
+def test_get_cases_for_sequencing_qc(large_store: Store, baselines: Baselines):
+    # GIVEN a large store
+
+    # WHEN getting the cases to evaluate in sequencing QC
+    cases: list[Case] = baselines.benchmark(
+        name="get_cases_for_sequencing_qc",
+        function=large_store.get_cases_for_sequencing_qc,
+        store=large_store,
+    )
+
+    # THEN cases are returned
+    assert cases
+
+
+@pytest.mark.benchmark
+def test_invoice_report(large_store: Store, baselines: Baselines):
+    # GIVEN a large store with an invoice
+    invoice: Invoice = large_store.get_invoices_by_status(is_invoiced=False)[0]
+
+    # WHEN building the invoice report
+    report: dict = baselines.benchmark(
+        name="invoice_report",
+        function=lambda: InvoiceAPI(
+            db=large_store, lims_api=mock.create_autospec(LimsAPI), invoice_obj=invoice
+        ).get_invoice_report(CostCenters.ki),
+        store=large_store,
+    )
+
+    # THEN all invoiced samples are in the report
+    assert len(report["records"]) == NUMBER_OF_INVOICED_SAMPLES
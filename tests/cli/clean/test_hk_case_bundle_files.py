@@ -153,3 +153,47 @@ def test_clean_hk_case_files_analysis_with_protected_tag(
 
     # THEN protected tags should be present
     assert f"No protected tags defined for {workflow}" not in caplog.text
+
+
+def test_clean_hk_case_files_analysis_without_version(
+    caplog,
+    cg_context: CGConfig,
+    cli_runner: CliRunner,
+    helpers: StoreHelpers,
+    hk_bundle_data: dict,
+    timestamp: dt.datetime,
+):
+    # GIVEN an analysis to clean without a Housekeeper version
+    context: CGConfig = cg_context
+    store: Store = context.status_db
+    days_ago: int = 1
+    date_days_ago: dt.datetime = get_date_days_ago(days_ago)
+
+    analysis: Analysis = helpers.add_analysis(
+        store=store,
+        started_at=date_days_ago,
+        completed_at=date_days_ago,
+        workflow=Workflow.MIP_DNA,
+        housekeeper_version_id=None,
+    )
+    bundle_name: str = analysis.case.internal_id
+
+    # GIVEN a housekeeper api with some files
+    hk_bundle_data["name"] = bundle_name
+    helpers.ensure_hk_bundle(cg_context.housekeeper_api, bundle_data=hk_bundle_data)
+
+    # WHEN running the clean command
+    caplog.set_level(logging.DEBUG)
+    result = cli_runner.invoke(
+        hk_case_bundle_files,
+        ["--days-old", days_ago, "--dry-run"],
+        obj=context,
+        catch_exceptions=False,
+    )
+
+    # THEN it should be successful
+    assert result.exit_code == 0
+    # THEN the files of the bundle should be considered for cleaning
+    assert "Version with id None" in caplog.text
+    assert "has no protected tags" in caplog.text
+    assert "found on disk" in caplog.text
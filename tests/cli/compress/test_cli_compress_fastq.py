@@ -1,6 +1,7 @@
 """Tests for the compress fastq cli."""
 
 import datetime as dt
+from pathlib import Path
 from unittest.mock import Mock, call, create_autospec
 
 import pytest
@@ -16,6 +17,7 @@ from cg.cli.compress.helpers import (
 )
 from cg.meta.compress import CompressAPI
 from cg.models.cg_config import CGConfig
+from cg.models.compression_data import CompressionBatch, CompressionData
 from cg.store.models import Case, Sample
 from cg.store.store import Store
 from tests.typed_mock import TypedMock, create_typed_mock
@@ -54,7 +56,11 @@ def test_compress_fastq_cli(cli_runner: CliRunner, cg_context: CGConfig, mocker:
 
     # THEN the samples were sent for compression using the default settings
     compress_samples_mock.assert_called_once_with(
-        compress_api=compress_api, samples=samples, sample_limit=5, dry_run=False
+        compress_api=compress_api,
+        samples=samples,
+        sample_limit=5,
+        dry_run=False,
+        use_job_arrays=False,
     )
 
 
@@ -126,7 +132,11 @@ def test_compress_fastq_cli_case_id(
 
     # THEN the samples were sent for compression using the default limit
     compress_samples_mock.assert_called_once_with(
-        compress_api=compress_api, samples=samples, sample_limit=5, dry_run=False
+        compress_api=compress_api,
+        samples=samples,
+        sample_limit=5,
+        dry_run=False,
+        use_job_arrays=False,
     )
 
 
@@ -204,7 +214,11 @@ def test_compress_fastq_cli_sample_all_flags(
 
     # THEN the samples were sent for compression using the special limit
     compress_samples_mock.assert_called_once_with(
-        compress_api=compress_api, samples=samples, sample_limit=2, dry_run=True
+        compress_api=compress_api,
+        samples=samples,
+        sample_limit=2,
+        dry_run=True,
+        use_job_arrays=False,
     )
 
 
@@ -330,8 +344,8 @@ def test_compress_fastq_to_spring_for_samples():
 
     # THEN correct method calls were made
     assert compress_api.as_mock.compress_fastq.call_args_list == [
-        call(sample_id=sample1.internal_id),
-        call(sample_id=sample2.internal_id),
+        call(sample_id=sample1.internal_id, batch=None),
+        call(sample_id=sample2.internal_id, batch=None),
     ]
 
 
@@ -352,7 +366,9 @@ def test_compress_fastq_to_spring_for_samples_with_limit():
     )
 
     # THEN only one call was made
-    compress_api.as_mock.compress_fastq.assert_called_once_with(sample_id=sample1.internal_id)
+    compress_api.as_mock.compress_fastq.assert_called_once_with(
+        sample_id=sample1.internal_id, batch=None
+    )
 
 
 def test_compress_fastq_to_spring_for_samples_with_dry_run():
@@ -372,12 +388,43 @@ def test_compress_fastq_to_spring_for_samples_with_dry_run():
     )
 
     # THEN compression was called
-    compress_api.as_mock.compress_fastq.assert_called_once_with(sample_id=sample1.internal_id)
+    compress_api.as_mock.compress_fastq.assert_called_once_with(
+        sample_id=sample1.internal_id, batch=None
+    )
 
     # THEN dry-run was enforced
     compress_api.as_mock.set_dry_run.assert_called_once_with(dry_run=True)
 
 
+def test_compress_fastq_to_spring_for_samples_with_job_arrays():
+    # GIVEN compress api
+    compress_api: TypedMock[CompressAPI] = create_typed_mock(CompressAPI)
+
+    # GIVEN a list of samples
+    sample1: Sample = create_autospec(Sample, internal_id="sample1")
+    sample2: Sample = create_autospec(Sample, internal_id="sample2")
+    samples: list[Sample] = [sample1, sample2]
+
+    # GIVEN that compressing a sample adds a run to the batch
+    compress_api.as_mock.compress_fastq.side_effect = lambda sample_id, batch: batch.add(
+        compression=CompressionData(Path("/path", sample_id)), memory=10, minutes=30
+    )
+
+    # WHEN compressing samples using job arrays
+    compress_fastq_to_spring_for_samples(
+        compress_api=compress_api.as_type,
+        samples=samples,
+        sample_limit=2,
+        use_job_arrays=True,
+    )
+
+    # THEN all runs were submitted together in one batch
+    batch: CompressionBatch = compress_api.as_mock.submit_fastq_compression_batch.call_args.kwargs[
+        "batch"
+    ]
+    assert len(batch) == 2
+
+
 def test_compress_clean_cli(cli_runner: CliRunner, cg_context: CGConfig, mocker: MockFixture):
     # GIVEN a store, housekeeper api and compress api on the context
     store: TypedMock[Store] = create_typed_mock(Store)
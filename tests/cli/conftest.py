@@ -64,9 +64,9 @@ class MockCompressAPI(CompressAPI):
         """Update dry run."""
         self.dry_run = dry_run
 
-    def compress_fastq(self, sample_id: str, dry_run: bool = False):
+    def compress_fastq(self, sample_id: str, batch=None, dry_run: bool = False):
         """Return if compression was successful."""
-        _ = sample_id, dry_run
+        _ = sample_id, batch, dry_run
         return self.fastq_compression_success
 
     def decompress_spring(self, sample_id: str, dry_run: bool = False):
@@ -1,7 +1,12 @@
+import logging
+from pathlib import Path
+
 from click.testing import CliRunner, Result
 
 import cg
 from cg.cli.base import base
+from cg.constants.constants import FileFormat
+from cg.io.controller import ReadStream, WriteFile, WriteStream
 
 
 def test_cli_version(cli_runner: CliRunner):
@@ -26,3 +31,29 @@ def test_missing_command(cli_runner: CliRunner):
     result = cli_runner.invoke(base, ["i_dont_exist"])
     # THEN context should abort
     assert result.exit_code != 0
+
+
+def test_profile_sql(cli_runner: CliRunner, context_config: dict, tmp_path: Path, caplog):
+    # GIVEN a config file
+    config_path = Path(tmp_path, "cg_config.yaml")
+    WriteFile.write_file_from_content(
+        content=ReadStream.get_content_from_stream(
+            file_format=FileFormat.JSON,
+            stream=WriteStream.write_stream_from_content(
+                content=context_config, file_format=FileFormat.JSON
+            ),
+        ),
+        file_format=FileFormat.YAML,
+        file_path=config_path,
+    )
+    caplog.set_level(logging.INFO)
+
+    # WHEN invoking a command with SQL profiling
+    result: Result = cli_runner.invoke(
+        base,
+        ["--config", config_path.as_posix(), "--profile-sql", "search", "up"],
+    )
+
+    # THEN the command succeeds and the SQL profile of the command is logged
+    assert result.exit_code == 0
+    assert "SQL profile for cg search" in caplog.text
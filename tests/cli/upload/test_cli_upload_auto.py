@@ -10,7 +10,9 @@ from pytest_mock import MockerFixture
 from cg.cli.upload import base as upload_cli
 from cg.cli.upload.base import upload_all_completed_analyses
 from cg.constants import Workflow
+from cg.constants.constants import CaseUploadStatus
 from cg.models.cg_config import CGConfig
+from cg.models.upload import CaseUploadResult
 from tests.store_helpers import StoreHelpers
 
 WORKFLOWS_TO_TEST: list = [
@@ -81,3 +83,49 @@ def test_upload_auto_with_workflow_ignores_started_uploads(
 
     # THEN assert that the upload function was not called for the case
     assert call(case_id=analysis.case.internal_id) not in mock_upload.call_args_list
+
+
+def test_upload_auto_with_workers(
+    cli_runner: CliRunner,
+    helpers: StoreHelpers,
+    mocker: MockerFixture,
+    upload_context: CGConfig,
+):
+    """Test upload auto with several workers uploads each case in a separate process."""
+    # GIVEN a store with two cases with completed analyses
+    case_ids: list[str] = [
+        helpers.add_analysis(
+            store=upload_context.status_db,
+            case=helpers.add_case(store=upload_context.status_db, name=name),
+            completed_at=datetime.now(),
+            workflow=Workflow.MIP_DNA,
+        ).case.internal_id
+        for name in ["first_case", "second_case"]
+    ]
+
+    # GIVEN that the upload of one of the cases fails
+    def run_case_upload(command: list[str], case_id: str, timeout: int | None):
+        status = CaseUploadStatus.FAILED if case_id == case_ids[0] else CaseUploadStatus.UPLOADED
+        return CaseUploadResult(case_id=case_id, status=status, seconds=1)
+
+    mock_upload = mocker.patch.object(upload_cli, "run_case_upload", side_effect=run_case_upload)
+
+    # WHEN uploading all analyses with two workers and a timeout
+    result = cli_runner.invoke(
+        upload_all_completed_analyses,
+        ["--workflow", Workflow.MIP_DNA, "--workers", "2", "--timeout", "60"],
+        obj=upload_context,
+    )
+
+    # THEN each case is uploaded in a separate process with the timeout
+    uploaded_case_ids: list[str] = [
+        upload_call.kwargs["case_id"] for upload_call in mock_upload.call_args_list
+    ]
+    assert sorted(uploaded_case_ids) == sorted(case_ids)
+    for upload_call in mock_upload.call_args_list:
+        command: list[str] = upload_call.kwargs["command"]
+        assert command[-3:] == ["upload", "--case", upload_call.kwargs["case_id"]]
+        assert upload_call.kwargs["timeout"] == 60
+
+    # THEN the command exits with an error since one upload failed
+    assert result.exit_code == 1
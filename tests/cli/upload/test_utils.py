@@ -1,8 +1,20 @@
+import logging
+import sys
+
 import pytest
+import rich_click as click
 
-from cg.cli.upload.utils import get_scout_api_by_case, get_scout_api_by_genome_build
+from cg.cli.base import base
+from cg.cli.upload.utils import (
+    get_case_upload_command,
+    get_scout_api_by_case,
+    get_scout_api_by_genome_build,
+    run_case_upload,
+)
 from cg.constants import Workflow
+from cg.constants.constants import CaseUploadStatus
 from cg.models.cg_config import CGConfig
+from cg.models.upload import CaseUploadResult
 from cg.store.models import Case
 from tests.store_helpers import StoreHelpers
 
@@ -45,3 +57,67 @@ def test_get_scout_api_by_reference_genome_hg38(upload_context: CGConfig):
 
     # THEN the ScoutAPI should be towards the hg38 instance
     assert scout_api == upload_context.scout_api_38
+
+
+@pytest.mark.parametrize(
+    "script, expected_status",
+    [
+        ("pass", CaseUploadStatus.UPLOADED),
+        ("import sys; sys.exit('upload failed')", CaseUploadStatus.FAILED),
+        ("import time; time.sleep(10)", CaseUploadStatus.TIMED_OUT),
+    ],
+)
+def test_run_case_upload(script: str, expected_status: CaseUploadStatus, case_id: str):
+    """Test running the upload of a case in a separate process."""
+    # GIVEN an upload command
+
+    # WHEN running the upload with a timeout
+    result: CaseUploadResult = run_case_upload(
+        command=[sys.executable, "-c", script], case_id=case_id, timeout=1
+    )
+
+    # THEN the outcome of the upload is returned
+    assert result.case_id == case_id
+    assert result.status == expected_status
+
+
+def test_run_case_upload_logs_output(case_id: str, caplog):
+    """Test that the output of the upload process is logged with the case id."""
+    # GIVEN an upload command that writes to stdout and stderr
+    script: str = "import sys; print('uploaded to scout'); sys.stderr.write('uploaded to gens')"
+    caplog.set_level(logging.INFO)
+
+    # WHEN running the upload
+    run_case_upload(command=[sys.executable, "-c", script], case_id=case_id, timeout=None)
+
+    # THEN the output of the process is logged, prefixed with the case id
+    assert f"{case_id}: uploaded to scout" in caplog.text
+    assert f"{case_id}: uploaded to gens" in caplog.text
+
+
+def test_get_case_upload_command(case_id: str):
+    """Test that the options of the root command are passed on to the upload process."""
+    # GIVEN a root command context with verbose logging and SQL profiling
+    context = click.Context(base)
+    context.params = {
+        "config": "cg_config.yaml",
+        "log_level": "INFO",
+        "verbose": True,
+        "profile_sql_statements": True,
+    }
+
+    # WHEN getting the command to upload a case
+    command: list[str] = get_case_upload_command(context=context, case_id=case_id)
+
+    # THEN the root options are passed on before the upload command
+    assert command[3:] == [
+        "--config",
+        "cg_config.yaml",
+        "--log-level",
+        "INFO",
+        "--verbose",
+        "--profile-sql",
+        "upload",
+        "--case",
+        case_id,
+    ]
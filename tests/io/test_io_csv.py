@@ -1,14 +1,19 @@
 from pathlib import Path
+from typing import Iterator
 
 import pytest
+from pydantic import BaseModel
 
 from cg.io.csv import (
+    iterate_csv,
+    iterate_csv_models,
     read_csv,
     read_csv_stream,
     write_csv,
     write_csv_from_dict,
     write_csv_stream,
 )
+from cg.exc import ValidationError
 from tests.io.conftest import FileRepresentation
 
 
@@ -184,3 +189,65 @@ def test_write_csv_stream(delimiter: str, delimiter_map: dict[str, FileRepresent
 
     # THEN assert that the stream is correct
     assert written_stream == stream + "\n"
+
+
+class ExampleRow(BaseModel):
+    test_column1: str
+    test_column2: str
+
+
+def test_iterate_csv_is_lazy(csv_file_path: Path):
+    """
+    Tests that iterating a CSV file returns the same rows as reading it, one at a time.
+    """
+    # GIVEN a CSV file
+
+    # WHEN iterating the rows of the file
+    rows: Iterator[dict] = iterate_csv(file_path=csv_file_path, read_to_dict=True)
+
+    # THEN an iterator is returned instead of a list
+    assert not isinstance(rows, list)
+
+    # THEN the rows are the same as when reading the whole file
+    assert list(rows) == read_csv(file_path=csv_file_path, read_to_dict=True)
+
+
+def test_iterate_csv_validates_suffix_before_iterating(tsv_file_path: Path):
+    """
+    Tests that the file suffix is validated when the iterator is created.
+    """
+    # GIVEN a TSV file
+
+    # WHEN creating a CSV iterator over it
+    # THEN a ValidationError is raised without iterating
+    with pytest.raises(ValidationError):
+        iterate_csv(file_path=tsv_file_path)
+
+
+def test_iterate_csv_models(csv_file_path: Path):
+    """
+    Tests iterating the rows of a CSV file as models.
+    """
+    # GIVEN a CSV file with a header
+
+    # WHEN iterating the rows as models
+    rows: list[ExampleRow] = list(iterate_csv_models(file_path=csv_file_path, model=ExampleRow))
+
+    # THEN each row is validated as a model
+    assert rows
+    assert all(isinstance(row, ExampleRow) for row in rows)
+    assert rows[0].test_column1 == "row_1_col_1"
+
+
+def test_write_csv_from_generator(csv_temp_path: Path):
+    """
+    Tests writing rows from a generator.
+    """
+    # GIVEN a generator of rows
+    rows: Iterator[list[str]] = ([str(number), "value"] for number in range(5))
+
+    # WHEN writing the rows
+    write_csv(content=rows, file_path=csv_temp_path)
+
+    # THEN all rows are written in order
+    assert read_csv(file_path=csv_temp_path) == [[str(number), "value"] for number in range(5)]
@@ -1,6 +1,21 @@
+import math
+from datetime import datetime
 from pathlib import Path
 
-from cg.io.json import read_json, read_json_stream, write_json, write_json_stream
+import pytest
+from pydantic import BaseModel
+
+from cg.constants import Workflow
+from cg.io.json import (
+    JsonBackend,
+    OrjsonBackend,
+    get_json_backend,
+    read_json,
+    read_json_stream,
+    set_json_backend,
+    write_json,
+    write_json_stream,
+)
 
 
 def test_get_content_from_file(json_file_path: Path):
@@ -65,3 +80,77 @@ def test_write_json_stream(json_stream: str):
 
     # THEN assert that all data is kept and properly formatted
     assert json_stream == json_content
+
+
+class Report(BaseModel):
+    case_id: str
+    created_at: datetime
+
+
+@pytest.fixture(params=["json", "orjson"])
+def backend(request: pytest.FixtureRequest) -> JsonBackend:
+    """Return each JSON backend, skipping orjson when it is not installed."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        return OrjsonBackend()
+    return JsonBackend()
+
+
+def test_json_backends_encode_extended_types(backend: JsonBackend):
+    # GIVEN content with a pydantic model, a path, a datetime and an enum
+    content: dict = {
+        "report": Report(case_id="case_id", created_at=datetime(2024, 1, 1)),
+        "path": Path("root", "case_id"),
+        "created_at": datetime(2024, 1, 1, 12),
+        "workflow": Workflow.BALSAMIC,
+    }
+
+    # WHEN encoding the content
+    json_content: str = backend.dumps(content, compact=True)
+
+    # THEN all values are encoded
+    assert backend.loads(json_content) == {
+        "report": {"case_id": "case_id", "created_at": "2024-01-01T00:00:00"},
+        "path": "root/case_id",
+        "created_at": "2024-01-01T12:00:00",
+        "workflow": "balsamic",
+    }
+
+
+def test_json_backends_write_same_layout(backend: JsonBackend):
+    # GIVEN nested content
+    content: dict = {"Lorem": {"ipsum": ["sit", 1]}}
+
+    # WHEN encoding the content with two space indentation
+    json_content: str = backend.dumps(content, indent=2)
+
+    # THEN the layout is the one of the standard library
+    assert json_content == JsonBackend().dumps(content, indent=2)
+
+
+def test_orjson_backend_reads_nan():
+    pytest.importorskip("orjson")
+
+    # GIVEN a JSON stream with a NaN value, which is not valid JSON but is written by some tools
+    stream: str = '{"coverage": NaN}'
+
+    # WHEN reading the stream with the orjson backend
+    content: dict = OrjsonBackend().loads(stream)
+
+    # THEN the NaN value is read
+    assert math.isnan(content["coverage"])
+
+
+def test_set_json_backend(json_stream: str):
+    # GIVEN the standard library backend is set
+    default_backend: JsonBackend = get_json_backend()
+    set_json_backend(JsonBackend())
+
+    # WHEN reading and writing a JSON stream
+    try:
+        json_content: str = write_json_stream(read_json_stream(json_stream))
+    finally:
+        set_json_backend(default_backend)
+
+    # THEN the content is kept
+    assert json_content == json_stream
@@ -0,0 +1,56 @@
+"""Tests for the CleanAPI."""
+
+from pathlib import Path
+
+from cg.meta.clean.api import CleanAPI
+from tests.mocks.hk_mock import MockFile, MockTag
+
+
+def test_has_protected_tags():
+    """Test that a file with all tags of a protected tag combination is protected."""
+    # GIVEN a file with some tags
+    file = MockFile(tags=[MockTag(name="qc"), MockTag(name="vcf"), MockTag(name="snv")])
+
+    # GIVEN protected tag combinations where one is fully present on the file
+    protected_tag_sets: list[frozenset[str]] = CleanAPI.get_protected_tag_sets(
+        [["vcf", "sv"], ["vcf", "snv"]]
+    )
+
+    # WHEN checking if the file has protected tags
+    is_protected: bool = CleanAPI.has_protected_tags(file, protected_tag_sets=protected_tag_sets)
+
+    # THEN the file is protected
+    assert is_protected
+
+
+def test_has_protected_tags_partial_match():
+    """Test that a file with only part of a protected tag combination is not protected."""
+    # GIVEN a file with one tag of a protected tag combination
+    file = MockFile(tags=[MockTag(name="vcf")])
+
+    # WHEN checking if the file has protected tags
+    is_protected: bool = CleanAPI.has_protected_tags(
+        file, protected_tag_sets=CleanAPI.get_protected_tag_sets([["vcf", "sv"]])
+    )
+
+    # THEN the file is not protected
+    assert not is_protected
+
+
+def test_get_existing_files(tmp_path: Path):
+    """Test that only files existing on disk are returned, in order."""
+    # GIVEN files where one does not exist on disk
+    existing_paths: list[Path] = [Path(tmp_path, "first"), Path(tmp_path, "second")]
+    for path in existing_paths:
+        path.touch()
+    files: list[MockFile] = [
+        MockFile(id=1, path=existing_paths[0].as_posix()),
+        MockFile(id=2, path=Path(tmp_path, "missing").as_posix()),
+        MockFile(id=3, path=existing_paths[1].as_posix()),
+    ]
+
+    # WHEN getting the existing files
+    existing_files: list[MockFile] = list(CleanAPI.get_existing_files(files, max_workers=2))
+
+    # THEN the existing files are returned in their original order
+    assert [file.id for file in existing_files] == [1, 3]
@@ -233,3 +233,36 @@ def test_get_resources_for_run_no_matching_metrics(compress_api: CompressAPI, ba
     # caller never has to handle a missing value itself
     assert memory == compress_api.crunchy_api.fallback_memory
     assert minutes == compress_api.crunchy_api.fallback_minutes
+
+
+def test_get_resources_for_run_uses_prefetched_read_counts(
+    compress_api: CompressAPI, base_store: Store, helpers: StoreHelpers, mocker
+):
+    """Test that prefetched lane read counts are used without querying each run."""
+    # GIVEN a compress API with prefetched read counts for a sample with sequencing metrics
+    compress_api.status_db = base_store
+    flow_cell_id, sample_id, lane = "23M7GHLT4", "ACC20498A8", 4
+    _add_matching_sequencing_metrics(base_store, helpers, flow_cell_id, sample_id, lane)
+    compress_api.prefetch_lane_read_counts(sample_ids=[sample_id])
+    compression_obj = CompressionData(Path(f"{flow_cell_id}_{sample_id}_S52_L00{lane}"))
+    metrics_query = mocker.spy(base_store, "get_illumina_metrics_entry_by_device_sample_and_lane")
+
+    # WHEN getting resources for the run (100 reads recorded)
+    memory, minutes = compress_api._get_resources_for_run(
+        compression_obj,
+        memory_slope=1 / 10,
+        memory_intercept=0,
+        min_gb=1,
+        max_gb=100,
+        time_slope=1 / 20,
+        time_intercept=0,
+        min_minutes=1,
+        max_minutes=100,
+    )
+
+    # THEN memory and minutes are scaled according to the prefetched read count
+    assert memory == 10
+    assert minutes == 5
+
+    # THEN the metrics were not queried for the run
+    metrics_query.assert_not_called()
@@ -3,13 +3,16 @@ from pathlib import Path
 from cg.constants import FileExtensions
 from cg.meta.upload.fohm.fohm import FOHMUploadAPI
 from cg.models.fohm.reports import FohmComplementaryReport, FohmPangolinReport
+from cg.utils.dict import remove_duplicate_dicts
 
 
 def test_create_daily_delivery(fohm_upload_api: FOHMUploadAPI, csv_file_path: Path):
     # GIVEN a list of CSV files
 
     # WHEN creating the reports content
-    contents: list[dict] = fohm_upload_api.get_reports_contents([csv_file_path, csv_file_path])
+    contents: list[dict] = list(
+        fohm_upload_api.iterate_reports_contents([csv_file_path, csv_file_path])
+    )
 
     # THEN each file is a list of dicts where each dict represents a row in a CSV file
     assert isinstance(contents[0], dict)
@@ -18,6 +21,20 @@ def test_create_daily_delivery(fohm_upload_api: FOHMUploadAPI, csv_file_path: Pa
     assert len(contents) == 6
 
 
+def test_remove_duplicate_reports_while_reading(
+    fohm_upload_api: FOHMUploadAPI, csv_file_path: Path
+):
+    # GIVEN the same CSV file listed twice
+
+    # WHEN removing duplicate rows while iterating the reports contents
+    contents: list[dict] = remove_duplicate_dicts(
+        fohm_upload_api.iterate_reports_contents([csv_file_path, csv_file_path])
+    )
+
+    # THEN the rows of one file remain
+    assert len(contents) == 3
+
+
 def test_validate_fohm_complementary_reports(
     fohm_upload_api: FOHMUploadAPI, fohm_complementary_report_raw: dict[str, str]
 ):
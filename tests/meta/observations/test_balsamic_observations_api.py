@@ -380,11 +380,42 @@ def test_load_duplicated_observations(
     assert f"Case {case_id} has already been uploaded to Loqusdb" in caplog.text
 
 
-def test_load_cancer_observations(
+def test_get_cancer_load_parameters(
+    case_id: str,
+    balsamic_observations_api: BalsamicObservationsAPI,
+    balsamic_observations_input_files: BalsamicObservationsInputFiles,
+    mocker: MockFixture,
+):
+    """Test getting the parameters for loading a paired Balsamic case to a germline instance."""
+
+    # GIVEN a Balsamic observations API, a list of input files, and a tumor/normal case
+    case: Case = balsamic_observations_api.store.get_case_by_internal_id(case_id)
+    mocker.patch.object(
+        BalsamicAnalysisAPI,
+        "get_data_analysis_type",
+        return_value=CancerAnalysisType.TUMOR_NORMAL_WGS,
+    )
+
+    # WHEN getting the load parameters for a germline Loqusdb instance
+    load_parameters: dict | None = balsamic_observations_api.get_cancer_load_parameters(
+        case=case,
+        input_files=balsamic_observations_input_files,
+        loqusdb_api=balsamic_observations_api.loqusdb_tumor_api,
+    )
+
+    # THEN the germline variants of the case are loaded
+    input_files: BalsamicObservationsInputFiles = balsamic_observations_input_files
+    assert load_parameters["case_id"] == case_id
+    assert load_parameters["snv_vcf_path"] == input_files.snv_germline_vcf_path
+    assert load_parameters["sv_vcf_path"] == input_files.sv_germline_vcf_path
+
+
+def test_upload_wgs_case(
     case_id: str,
     balsamic_observations_api: BalsamicObservationsAPI,
     balsamic_observations_input_files: BalsamicObservationsInputFiles,
     number_of_loaded_variants: int,
+    loqusdb_id: str,
     mocker: MockFixture,
     caplog: LogCaptureFixture,
 ):
@@ -400,17 +431,22 @@ def test_load_cancer_observations(
         "get_data_analysis_type",
         return_value=CancerAnalysisType.TUMOR_NORMAL_WGS,
     )
-
-    # WHEN loading the case to a somatic Loqusdb instance
-    balsamic_observations_api.load_cancer_observations(
-        case=case,
-        input_files=balsamic_observations_input_files,
-        loqusdb_api=balsamic_observations_api.loqusdb_somatic_api,
+    mocker.patch.object(BalsamicObservationsAPI, "is_duplicate", return_value=False)
+    mocker.patch.object(
+        BalsamicObservationsAPI,
+        "get_observations_input_files",
+        return_value=balsamic_observations_input_files,
     )
 
+    # WHEN uploading the case to the somatic and germline Loqusdb instances
+    balsamic_observations_api._upload_wgs_case(case)
+
     # THEN the observations should be loaded successfully
     assert f"Uploaded {number_of_loaded_variants} variants to Loqusdb" in caplog.text
 
+    # THEN the Loqusdb ID of the case is stored for its samples
+    assert all(sample.loqusdb_id == loqusdb_id for sample in case.samples)
+
 
 @pytest.mark.parametrize(
     "prep_category, panel, loqusdb_instance",
@@ -2,6 +2,8 @@
 
 import logging
 from pathlib import Path
+from subprocess import CalledProcessError
+from unittest.mock import create_autospec
 
 import pytest
 from _pytest.fixtures import FixtureRequest
@@ -548,3 +550,82 @@ def test_delete_case_not_found(
 
     # THEN a CaseNotFoundError should be raised
     assert f"Case {case_id} could not be found in Loqusdb. Skipping case deletion." in caplog.text
+
+
+def test_load_to_instances():
+    # GIVEN load parameters for a case
+    load_parameters: dict = {"case_id": "case_id", "snv_vcf_path": Path("snv.vcf")}
+
+    # GIVEN two Loqusdb APIs
+    first_api: LoqusdbAPI = create_autospec(LoqusdbAPI)
+    first_api.load.return_value = {"variants": 10}
+    second_api: LoqusdbAPI = create_autospec(LoqusdbAPI)
+    second_api.load.return_value = {"variants": 20}
+
+    # WHEN loading a case to both instances
+    ObservationsAPI.load_to_instances(
+        case_id="case_id",
+        loads=[(first_api, load_parameters), (second_api, load_parameters)],
+    )
+
+    # THEN the case is loaded to both instances
+    first_api.load.assert_called_once_with(**load_parameters)
+    second_api.load.assert_called_once_with(**load_parameters)
+
+    # THEN no case is deleted
+    first_api.delete_case.assert_not_called()
+    second_api.delete_case.assert_not_called()
+
+
+def test_load_to_instances_rolls_back_on_failure():
+    # GIVEN load parameters for a case
+    load_parameters: dict = {"case_id": "case_id", "snv_vcf_path": Path("snv.vcf")}
+
+    # GIVEN a Loqusdb API that loads the case and one that fails
+    loaded_api: LoqusdbAPI = create_autospec(LoqusdbAPI)
+    loaded_api.load.return_value = {"variants": 10}
+    failing_api: LoqusdbAPI = create_autospec(LoqusdbAPI)
+    failing_api.load.side_effect = CalledProcessError(returncode=1, cmd="loqusdb load")
+
+    # WHEN loading a case to both instances
+    with pytest.raises(CalledProcessError):
+        # THEN the error of the failed load is raised
+        ObservationsAPI.load_to_instances(
+            case_id="case_id",
+            loads=[(loaded_api, load_parameters), (failing_api, load_parameters)],
+        )
+
+    # THEN the case is removed from the instance it was loaded to
+    loaded_api.delete_case.assert_called_once_with("case_id")
+    failing_api.delete_case.assert_not_called()
+
+
+def test_load_to_instances_rollback_fails(caplog: LogCaptureFixture):
+    # GIVEN load parameters for a case
+    load_parameters: dict = {"case_id": "case_id", "snv_vcf_path": Path("snv.vcf")}
+
+    # GIVEN two Loqusdb APIs that load the case but fail to remove it, and one that fails
+    loaded_apis: list[LoqusdbAPI] = [create_autospec(LoqusdbAPI) for _ in range(2)]
+    for loaded_api in loaded_apis:
+        loaded_api.load.return_value = {"variants": 10}
+        loaded_api.delete_case.side_effect = CaseNotFoundError("Case not found")
+    load_error = CalledProcessError(returncode=1, cmd="loqusdb load")
+    failing_api: LoqusdbAPI = create_autospec(LoqusdbAPI)
+    failing_api.load.side_effect = load_error
+
+    # WHEN loading a case to the instances
+    with pytest.raises(CalledProcessError) as raised:
+        ObservationsAPI.load_to_instances(
+            case_id="case_id",
+            loads=[(api, load_parameters) for api in [*loaded_apis, failing_api]],
+        )
+
+    # THEN the error of the failed load is raised
+    assert raised.value is load_error
+
+    # THEN removing the case is attempted from every instance it was loaded to
+    for loaded_api in loaded_apis:
+        loaded_api.delete_case.assert_called_once_with("case_id")
+
+    # THEN the failed removals are logged
+    assert caplog.text.count("Could not remove case case_id") == 2
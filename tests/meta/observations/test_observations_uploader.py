@@ -0,0 +1,35 @@
+from unittest.mock import create_autospec
+
+from pytest_mock import MockerFixture
+
+from cg.exc import LoqusdbUploadCaseError
+from cg.meta.observations import observations_uploader
+from cg.meta.observations.observations_api import ObservationsAPI
+from cg.meta.observations.observations_uploader import upload_observations
+
+
+def test_upload_observations(mocker: MockerFixture):
+    # GIVEN observations APIs for two cases, where the upload of one case fails
+    uploaded_api: ObservationsAPI = create_autospec(ObservationsAPI)
+    failing_api: ObservationsAPI = create_autospec(ObservationsAPI)
+    failing_api.upload.side_effect = LoqusdbUploadCaseError
+
+    # GIVEN that the database sessions of the worker threads are tracked
+    remove_sessions = mocker.patch.object(observations_uploader, "remove_thread_sessions")
+
+    # WHEN uploading the observations of both cases at the same time
+    errors: dict[str, Exception] = upload_observations(
+        observations_apis={"uploaded_case": uploaded_api, "failing_case": failing_api},
+        max_workers=2,
+    )
+
+    # THEN both cases are uploaded
+    uploaded_api.upload.assert_called_once_with("uploaded_case")
+    failing_api.upload.assert_called_once_with("failing_case")
+
+    # THEN only the error of the failed case is returned
+    assert list(errors) == ["failing_case"]
+    assert isinstance(errors["failing_case"], LoqusdbUploadCaseError)
+
+    # THEN the database sessions of each worker thread are removed
+    assert remove_sessions.call_count == 2
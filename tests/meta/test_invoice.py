@@ -87,3 +87,25 @@ def test_invoice_pool_generic_customer(
     # THEN prepare_invoice_report should set priority to research
     api.get_invoice_report(CostCenters.ki)
     assert api.invoice_info.priority == PriorityTerms.RESEARCH
+
+
+def test_invoice_pool_samples_are_expanded_once(get_invoice_api_pool_generic_customer):
+    # GIVEN an invoice API with a pool
+    api: InvoiceAPI = get_invoice_api_pool_generic_customer
+
+    # GIVEN a LIMS where the pool contains two samples
+    api.genologics_lims = mock.MagicMock()
+    lims_samples: list = [mock.MagicMock(), mock.MagicMock()]
+    api.genologics_lims.samples_in_pools.return_value = lims_samples
+
+    # WHEN generating the invoice report twice
+    first_report: dict = api.get_invoice_report(CostCenters.ki)
+    second_report: dict = api.get_invoice_report(CostCenters.ki)
+
+    # THEN both reports contain the samples of the pool
+    assert len(first_report["pooled_samples"]) == len(lims_samples)
+    assert len(second_report["pooled_samples"]) == len(lims_samples)
+
+    # THEN the pool is only expanded once and the samples are fetched from LIMS in one batch
+    api.genologics_lims.samples_in_pools.assert_called_once()
+    api.genologics_lims.get_batch.assert_called_once_with(lims_samples)
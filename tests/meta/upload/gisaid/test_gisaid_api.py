@@ -8,6 +8,7 @@ from pytest_mock import MockerFixture
 from sqlalchemy.orm import Query
 
 from cg.apps.housekeeper.hk import HousekeeperAPI
+from cg.exc import CgError
 from cg.meta.upload.gisaid.gisaid import GisaidAPI
 from cg.meta.upload.gisaid.models import GisaidSample
 from cg.models.cg_config import CGConfig, EmailBaseSettings, GisaidConfig, MutantConfig
@@ -59,33 +60,39 @@ def gisaid_log(fs, gisaid_log_contents: str) -> File:
 
 
 @pytest.fixture
-def expected_completion_dict() -> dict[str, dict[int, str]]:
-    return {
-        "GISAID_accession": {
-            0: " EPI_ISL_75698657",
-            1: " EPI_ISL_75698657",
-            2: " EPI_ISL_75698658",
-            3: " EPI_ISL_75698659",
-            4: "",
-            5: " EPI_ISL_75698661",
+def expected_completion_rows() -> list[dict[str, str]]:
+    return [
+        {
+            "provnummer": "85CS900121",
+            "urvalskriterium": "Allmän övervakning",
+            "GISAID_accession": " EPI_ISL_75698657",
         },
-        "provnummer": {
-            0: "85CS900121",
-            1: "85CS900121",
-            2: "85CS900136",
-            3: "85CS900117",
-            4: "85CS900135",
-            5: "85CS900145",
+        {
+            "provnummer": "85CS900121",
+            "urvalskriterium": "Stickprov",
+            "GISAID_accession": " EPI_ISL_75698657",
         },
-        "urvalskriterium": {
-            0: "Allmän övervakning",
-            1: "Stickprov",
-            2: "Allmän övervakning",
-            3: "Allmän övervakning",
-            4: "Allmän övervakning",
-            5: "Allmän övervakning",
+        {
+            "provnummer": "85CS900136",
+            "urvalskriterium": "Allmän övervakning",
+            "GISAID_accession": " EPI_ISL_75698658",
         },
-    }
+        {
+            "provnummer": "85CS900117",
+            "urvalskriterium": "Allmän övervakning",
+            "GISAID_accession": " EPI_ISL_75698659",
+        },
+        {
+            "provnummer": "85CS900135",
+            "urvalskriterium": "Allmän övervakning",
+            "GISAID_accession": "",
+        },
+        {
+            "provnummer": "85CS900145",
+            "urvalskriterium": "Allmän övervakning",
+            "GISAID_accession": " EPI_ISL_75698661",
+        },
+    ]
 
 
 @pytest.fixture
@@ -100,25 +107,25 @@ def expected_updated_completion_file():
 """
 
 
-def test_get_completion_dict(
+def test_get_completion_rows(
     cg_config: CGConfig,
     completion_file_contents: str,
-    expected_completion_dict: dict[str, dict[int, str]],
+    expected_completion_rows: list[dict[str, str]],
     fs: FakeFilesystem,
 ):
-    # GIVEN a completion CSV containing repeated sample ids and one empty GISAID accession value
+    # GIVEN a completion CSV containing repeated rows and one empty GISAID accession value
     # GIVEN a configured GISAID API instance that parses completion files
     completion_file = mock_completion_file(completion_file_contents, fs=fs)
     gisaid_api = GisaidAPI(config=cg_config)
 
-    # WHEN the completion file is converted into the internal dictionary representation
-    completion_dict = gisaid_api.get_completion_dict(completion_file=completion_file)
+    # WHEN reading the rows of the completion file
+    completion_rows = list(gisaid_api.get_completion_rows(completion_file=completion_file))
 
-    # THEN all rows should be preserved in the expected structure, including duplicates and empty values
-    assert completion_dict == expected_completion_dict
+    # THEN the unique SARS-CoV-2 rows should be returned in order, including empty values
+    assert completion_rows == expected_completion_rows
 
 
-def test_get_completion_dict_no_rows(
+def test_get_completion_rows_no_rows(
     cg_config: CGConfig,
     completion_file_no_sars: str,
     fs: FakeFilesystem,
@@ -128,15 +135,11 @@ def test_get_completion_dict_no_rows(
     completion_file = mock_completion_file(completion_file_no_sars, fs=fs)
     gisaid_api = GisaidAPI(config=cg_config)
 
-    # WHEN the completion file is converted into the internal dictionary representation
-    dict = gisaid_api.get_completion_dict(completion_file=completion_file)
+    # WHEN reading the rows of the completion file
+    completion_rows = list(gisaid_api.get_completion_rows(completion_file=completion_file))
 
-    # THEN the dictionary should retain all column keys with empty values, matching pandas' behavior
-    assert dict == {
-        "provnummer": {},
-        "urvalskriterium": {},
-        "GISAID_accession": {},
-    }
+    # THEN no rows should be returned
+    assert completion_rows == []
 
 
 def test_get_gisaid_sample_list(
@@ -153,7 +156,9 @@ def test_get_gisaid_sample_list(
     housekeeper_api.get_file_from_latest_version = Mock(return_value=completion_file)
 
     # GIVEN each sample id can be resolved in status-db to a Sample object
-    status_db.get_sample_by_name = lambda name: Sample(name=name)
+    status_db.get_samples_by_names = Mock(
+        side_effect=lambda names: {name: Sample(name=name) for name in names}
+    )
     gisaid_api = GisaidAPI(config=cg_config)
 
     # WHEN requesting the GISAID sample list for the case
@@ -168,6 +173,72 @@ def test_get_gisaid_sample_list(
         "85CS900145",
     ]
 
+    # THEN all samples are fetched from status-db in one query
+    status_db.get_samples_by_names.assert_called_once()
+
+
+def test_get_gisaid_sample_list_missing_sample(
+    cg_config: CGConfig,
+    completion_file_contents: str,
+    fs: FakeFilesystem,
+    housekeeper_api: HousekeeperAPI,
+    status_db: Store,
+):
+    # GIVEN a completion file returned by housekeeper
+    completion_file = mock_completion_file(completion_file_contents, fs=fs)
+    housekeeper_api.get_file_from_latest_version = Mock(return_value=completion_file)
+
+    # GIVEN that none of the sample ids can be found in status-db
+    status_db.get_samples_by_names = Mock(return_value={})
+    gisaid_api = GisaidAPI(config=cg_config)
+
+    # WHEN requesting the GISAID sample list for the case
+    with pytest.raises(CgError):
+        # THEN an error is raised
+        gisaid_api.get_gisaid_sample_list("case_id")
+
+
+def test_create_gisaid_fasta(
+    cg_config: CGConfig, housekeeper_api: HousekeeperAPI, fs: FakeFilesystem
+):
+    # GIVEN a consensus fasta for each of two samples
+    fs.create_dir("root/case_id/results")
+    samples: list[GisaidSample] = []
+    consensus_files: list[File] = []
+    for sample_id in ["sample_1", "sample_2"]:
+        fs.create_file(f"/fake/{sample_id}.fasta", contents=f">{sample_id}\nACGT\nTTGA\n")
+        consensus_files.append(create_autospec(File, full_path=f"/fake/{sample_id}.fasta"))
+        samples.append(
+            GisaidSample(
+                case_id="case_id",
+                cg_lims_id=sample_id,
+                submitter="submitter",
+                region="region",
+                region_code="region_code",
+                fn="fn",
+                covv_collection_date="2026-08-04",
+                covv_subm_sample_id=sample_id,
+            )
+        )
+
+    # GIVEN no previous GISAID fasta exists in housekeeper for the case
+    housekeeper_api.get_file_from_latest_version = Mock(side_effect=[None, *consensus_files])
+    gisaid_api = GisaidAPI(config=cg_config)
+
+    # WHEN creating the GISAID fasta for the case
+    gisaid_api.create_gisaid_fasta(gisaid_samples=samples, case_id="case_id")
+
+    # THEN the sequences of both samples are written with the GISAID virus names as headers
+    assert Path("root/case_id/results/case_id.fasta").read_text() == (
+        f">{samples[0].covv_virus_name}\nACGT\nTTGA\n"
+        f">{samples[1].covv_virus_name}\nACGT\nTTGA\n"
+    )
+
+    # THEN no temporary file is left in the results directory
+    assert list(Path("root/case_id/results").iterdir()) == [
+        Path("root/case_id/results/case_id.fasta")
+    ]
+
 
 def test_update_completion_file(
     cg_config: CGConfig,
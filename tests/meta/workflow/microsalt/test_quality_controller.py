@@ -1,11 +1,15 @@
 from pathlib import Path
 
+from pytest_mock import MockerFixture
+
 from cg.meta.workflow.microsalt.constants import QUALITY_REPORT_FILE_NAME
+from cg.meta.workflow.microsalt.metrics_parser import QualityMetrics
 from cg.meta.workflow.microsalt.quality_controller import MicroSALTQualityController
-from cg.meta.workflow.microsalt.quality_controller.models import QualityResult
+from cg.meta.workflow.microsalt.quality_controller.models import QualityResult, SampleQualityResult
 from cg.models.cg_config import CGConfig
 from cg.store.models import Application, Sample
 from cg.store.store import Store
+from tests.meta.workflow.microsalt.conftest import create_sample_metrics
 from tests.store_helpers import StoreHelpers
 
 PRICES = {"standard": 1_000, "priority": 2_000, "express": 3_000, "research": 4_000}
@@ -30,7 +34,7 @@ def test_is_valid_total_reads_passes(quality_controller: MicroSALTQualityControl
     sample.application_version = version
 
     # WHEN controlling the quality of the sample reads
-    has_valid_reads: bool = quality_controller.has_valid_total_reads(sample.internal_id)
+    has_valid_reads: bool = quality_controller.has_sample_valid_total_reads(sample)
 
     # THEN the sample passes the quality control
     assert has_valid_reads
@@ -55,7 +59,7 @@ def test_is_valid_total_reads_fails(quality_controller: MicroSALTQualityControll
     sample.application_version = version
 
     # WHEN controlling the quality of the sample reads
-    has_valid_reads: bool = quality_controller.has_valid_total_reads(sample.internal_id)
+    has_valid_reads: bool = quality_controller.has_sample_valid_total_reads(sample)
 
     # THEN the sample fails the quality control
     assert not has_valid_reads
@@ -97,3 +101,37 @@ def test_quality_control_passes(qc_microsalt_context: CGConfig, metrics_file_pas
 
     # THEN a report should be generated
     assert metrics_file_passing_qc.parent.joinpath(QUALITY_REPORT_FILE_NAME).exists()
+
+
+def test_quality_control_samples_fetches_samples_once(
+    quality_controller: MicroSALTQualityController, mocker: MockerFixture
+):
+    # GIVEN samples with enough reads for their application
+    store: Store = quality_controller.status_db
+    application: Application = StoreHelpers.add_application(store=store, target_reads=1_000)
+    version = StoreHelpers.add_application_version(
+        store=store, application=application, prices=PRICES
+    )
+    sample_ids: list[str] = []
+    for index in range(3):
+        sample: Sample = StoreHelpers.add_sample(
+            store=store, internal_id=f"sample_{index}", reads=10_000
+        )
+        sample.application_version = version
+        sample_ids.append(sample.internal_id)
+
+    # GIVEN passing metrics for each sample
+    quality_metrics = QualityMetrics(
+        samples={sample_id: create_sample_metrics() for sample_id in sample_ids}
+    )
+    single_lookup_spy = mocker.spy(store, "get_sample_by_internal_id_strict")
+
+    # WHEN controlling the quality of the samples
+    results: list[SampleQualityResult] = quality_controller.quality_control_samples(quality_metrics)
+
+    # THEN all samples pass the quality control
+    assert [result.sample_id for result in results] == sample_ids
+    assert all(result.passes_qc for result in results)
+
+    # THEN the samples are not fetched one by one
+    single_lookup_spy.assert_not_called()
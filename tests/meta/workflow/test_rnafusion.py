@@ -71,6 +71,28 @@ def test_parse_analysis(
     assert analysis_model.sample_metrics[sample_id].model_dump() == rnafusion_metrics
 
 
+def test_get_multiqc_json_metrics_fetches_qc_conditions_once_per_sample(
+    rnafusion_context: CGConfig,
+    rnafusion_case_id: str,
+    sample_id: str,
+    rnafusion_mock_analysis_finish,
+):
+    """Test that the QC conditions are fetched once per sample when collecting MultiQC metrics."""
+
+    # GIVEN a Rnafusion analysis API with a spy on the QC conditions
+    analysis_api: RnafusionAnalysisAPI = rnafusion_context.meta_apis["analysis_api"]
+    analysis_api.get_qc_conditions_for_workflow = Mock(return_value=RNAFUSION_METRIC_CONDITIONS)
+
+    # WHEN collecting the MultiQC metrics
+    qc_metrics: list[MetricsBase] = analysis_api.get_multiqc_json_metrics(case_id=rnafusion_case_id)
+
+    # THEN several metrics are collected for the sample
+    assert len(qc_metrics) > 1
+
+    # THEN the QC conditions are fetched once for the sample
+    analysis_api.get_qc_conditions_for_workflow.assert_called_once_with(sample_id)
+
+
 def test_get_latest_metadata(
     rnafusion_context: CGConfig, rnafusion_case_id: str, rnafusion_mock_analysis_finish
 ):
@@ -0,0 +1,51 @@
+from typing import Any
+
+from cg.meta.workflow.utils.multiqc_index import MultiqcMetricsIndex
+
+GENERAL_STATS: list[dict[str, Any]] = [
+    {"ACC1": {"reads": 1}, "ACC12": {"reads": 2}, "ACC1_lane1": {"duplicates": 0.1}},
+    {"ACC1": {"coverage": 30}, "ACC12": {"coverage": 40}},
+]
+
+
+def test_get_metrics_dicts_exact_match():
+    # GIVEN a MultiQC index of general statistics
+    multiqc_index = MultiqcMetricsIndex(GENERAL_STATS)
+
+    # WHEN getting the metrics of a sample with exact match
+    metrics_dicts: list[dict[str, Any]] = multiqc_index.get_metrics_dicts(
+        pattern="ACC1", exact_match=True
+    )
+
+    # THEN only the subsections named exactly as the pattern are returned in report order
+    assert metrics_dicts == [{"reads": 1}, {"coverage": 30}]
+
+
+def test_get_metrics_dicts_substring_match():
+    # GIVEN a MultiQC index of general statistics
+    multiqc_index = MultiqcMetricsIndex(GENERAL_STATS)
+
+    # WHEN getting the metrics of a sample without exact match
+    metrics_dicts: list[dict[str, Any]] = multiqc_index.get_metrics_dicts(
+        pattern="ACC1", exact_match=False
+    )
+
+    # THEN all subsections containing the pattern are returned in report order
+    assert metrics_dicts == [
+        {"reads": 1},
+        {"reads": 2},
+        {"duplicates": 0.1},
+        {"coverage": 30},
+        {"coverage": 40},
+    ]
+
+
+def test_get_metrics_dicts_no_match():
+    # GIVEN a MultiQC index of general statistics
+    multiqc_index = MultiqcMetricsIndex(GENERAL_STATS)
+
+    # WHEN getting the metrics of a sample not in the report
+    metrics_dicts: list[dict[str, Any]] = multiqc_index.get_metrics_dicts(pattern="ACC2")
+
+    # THEN no metrics are returned
+    assert not metrics_dicts
@@ -5,13 +5,14 @@ import logging
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Set
+from typing import Iterator, Set
 
 from housekeeper.store.models import Bundle, File, Version
 
-from cg.apps.housekeeper.hk import HousekeeperAPI
+from cg.apps.housekeeper.hk import VERSION_ID_CHUNK_SIZE, HousekeeperAPI
 from cg.constants import SequencingFileTag
 from cg.exc import HousekeeperBundleVersionMissingError
+from cg.utils.utils import get_chunks
 
 ROOT_PATH = tempfile.TemporaryDirectory().name
 
@@ -455,6 +456,15 @@ class MockHousekeeperAPI:
         """
         return self.files(*args, **kwargs)
 
+    def get_files_by_version_ids(
+        self, version_ids: list[int], chunk_size: int = VERSION_ID_CHUNK_SIZE
+    ) -> Iterator[list[MockFile]]:
+        """Fetch the files of the given versions, one chunk of versions at a time. Like get_files,
+        the files are not filtered on version"""
+        unique_version_ids: list[int] = list(dict.fromkeys(version_ids))
+        for _ in get_chunks(unique_version_ids, chunk_size):
+            yield list(self.files())
+
     def get_file_insensitive_path(self, path: Path) -> File | None:
         """Returns a file in Housekeeper with a path that matches the given path, insensitive to whether the paths
         are included or not."""
@@ -513,14 +523,17 @@ class MockHousekeeperAPI:
         return new_bundle
 
     def add_and_include_file_to_latest_version(
-        self, bundle_name: str, file: Path, tags: list
+        self, bundle_name: str, file: Path, tags: list, checksum: str | None = None
     ) -> None:
-        """Adds and includes a file in the latest version of a bundle."""
+        """Adds and includes a file in the latest version of a bundle, storing the checksum if
+        it has already been calculated."""
         version: Version = self.get_or_create_version(bundle_name)
         if not version:
             LOG.info(f"Bundle: {bundle_name} not found in housekeeper")
             raise HousekeeperBundleVersionMissingError
         hk_file: File = self.add_file(version_obj=version, tags=tags, path=str(file.absolute()))
+        if checksum:
+            hk_file.checksum = checksum
         self.include_file(version_obj=version, file_obj=hk_file)
         self.commit()
 
@@ -0,0 +1,68 @@
+import shutil
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from cg.apps.demultiplex.sample_sheet.sample_sheet_models import SampleSheet
+from cg.apps.demultiplex.sample_sheet.sample_sheet_validator import SampleSheetValidator
+from cg.models.demultiplex.run_parameters import RunParametersNovaSeqX
+from cg.models.run_devices.run_metadata_cache import RunMetadataCache
+
+
+def test_get_run_parameters_parsed_once(novaseq_x_run_parameters_path: Path, mocker: MockerFixture):
+    # GIVEN a run metadata cache and a run parameters file
+    cache = RunMetadataCache()
+    read_xml = mocker.spy(RunParametersNovaSeqX, "__init__")
+
+    # WHEN getting the run parameters twice
+    first = cache.get_run_parameters(
+        run_parameters_path=novaseq_x_run_parameters_path, constructor=RunParametersNovaSeqX
+    )
+    second = cache.get_run_parameters(
+        run_parameters_path=novaseq_x_run_parameters_path, constructor=RunParametersNovaSeqX
+    )
+
+    # THEN the file is parsed only once
+    assert read_xml.call_count == 1
+    assert first is second
+
+
+def test_get_run_parameters_reparsed_on_change(novaseq_x_run_parameters_path: Path, tmp_path: Path):
+    # GIVEN a run parameters file that has been parsed
+    run_parameters_path = Path(tmp_path, novaseq_x_run_parameters_path.name)
+    shutil.copy(novaseq_x_run_parameters_path, run_parameters_path)
+    cache = RunMetadataCache()
+    first = cache.get_run_parameters(
+        run_parameters_path=run_parameters_path, constructor=RunParametersNovaSeqX
+    )
+
+    # WHEN the file is changed and the run parameters are fetched again
+    with open(run_parameters_path, "a") as file:
+        file.write("\n")
+    second = cache.get_run_parameters(
+        run_parameters_path=run_parameters_path, constructor=RunParametersNovaSeqX
+    )
+
+    # THEN the file is parsed again
+    assert first is not second
+
+
+def test_get_sample_sheet_from_sidecar(
+    novaseq_x_correct_sample_sheet: Path, tmp_path: Path, mocker: MockerFixture
+):
+    # GIVEN a sample sheet that has been parsed by a cache with a sidecar directory
+    sidecar_directory = Path(tmp_path, "sidecars")
+    parse = SampleSheetValidator().get_sample_sheet_object_from_file
+    parsed_sample_sheet: SampleSheet = RunMetadataCache(
+        sidecar_directory=sidecar_directory
+    ).get_sample_sheet(sample_sheet_path=novaseq_x_correct_sample_sheet, parse=parse)
+
+    # WHEN getting the sample sheet with a new cache using the same sidecar directory
+    parse_spy = mocker.Mock(side_effect=parse)
+    sample_sheet: SampleSheet = RunMetadataCache(
+        sidecar_directory=sidecar_directory
+    ).get_sample_sheet(sample_sheet_path=novaseq_x_correct_sample_sheet, parse=parse_spy)
+
+    # THEN the sample sheet is read from the sidecar without parsing the file
+    parse_spy.assert_not_called()
+    assert sample_sheet == parsed_sample_sheet
@@ -3,7 +3,7 @@
 from datetime import datetime
 from pathlib import Path
 
-from cg.models.compression_data import CompressionData
+from cg.models.compression_data import CompressionBatch, CompressionData
 
 
 def test_get_run_name():
@@ -30,3 +30,19 @@ def test_get_change_date(compression_object):
 
     # THEN check that it is the same date as today
     assert change_date.date() == datetime.today().date()
+
+
+def test_compression_batch_groups_similar_resources():
+    """Test that runs with similar resource estimates are grouped together"""
+    # GIVEN a batch grouping memory in steps of 8 GB and time in steps of 30 minutes
+    batch = CompressionBatch(memory_step=8, minutes_step=30)
+
+    # WHEN adding runs with similar and different resource estimates
+    batch.add(compression=CompressionData(Path("/path/run_1")), memory=5, minutes=20)
+    batch.add(compression=CompressionData(Path("/path/run_2")), memory=7, minutes=29)
+    batch.add(compression=CompressionData(Path("/path/run_3")), memory=9, minutes=20)
+
+    # THEN runs are grouped by their resource estimates rounded up to the steps
+    assert [compression.run_name for compression in batch.groups[(8, 30)]] == ["run_1", "run_2"]
+    assert [compression.run_name for compression in batch.groups[(16, 30)]] == ["run_3"]
+    assert len(batch) == 3
@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from flask import Flask, jsonify
+
+from cg.server.ext import JSONBackendProvider
+
+
+def test_json_backend_provider_response():
+    # GIVEN a Flask app using the JSON backend provider
+    app = Flask(__name__)
+    app.json = JSONBackendProvider(app)
+
+    # WHEN creating a JSON response with unsorted keys and a date
+    with app.app_context():
+        response = jsonify({"b": 1, "a": datetime(2024, 1, 1)})
+
+    # THEN the keys are sorted, the date is an HTTP date and the output is compact
+    assert response.get_data(as_text=True) == '{"a":"Mon, 01 Jan 2024 00:00:00 GMT","b":1}\n'
+
+
+def test_json_backend_provider_loads():
+    # GIVEN a Flask app using the JSON backend provider
+    app = Flask(__name__)
+    app.json = JSONBackendProvider(app)
+
+    # WHEN decoding a JSON request body
+    content: dict = app.json.loads(b'{"sample": "ACC1", "reads": 10}')
+
+    # THEN the content is decoded
+    assert content == {"sample": "ACC1", "reads": 10}
@@ -0,0 +1,26 @@
+from flask import Flask
+from flask.testing import FlaskClient
+
+from cg.server.sql_profiling import register_sql_profiling
+from cg.store.profiler import SQL_PROFILE_HEADER
+from cg.store.store import Store
+from tests.store_helpers import StoreHelpers
+
+
+def test_sql_profile_header(store: Store, helpers: StoreHelpers):
+    # GIVEN a Flask app with SQL profiling and an endpoint querying the store
+    helpers.ensure_customer(store)
+    app = Flask(__name__)
+    register_sql_profiling(app)
+
+    @app.route("/customers")
+    def customers():
+        return {"customers": [customer.internal_id for customer in store.get_customers()]}
+
+    client: FlaskClient = app.test_client()
+
+    # WHEN requesting the endpoint
+    response = client.get("/customers")
+
+    # THEN the response has a header summarising the statements of the request
+    assert response.headers[SQL_PROFILE_HEADER].startswith("statements=1;")
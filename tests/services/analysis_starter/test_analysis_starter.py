@@ -181,6 +181,60 @@ def test_analysis_starter_start_available_error_handling(
     assert succeeded == expected_exit
 
 
+def test_analysis_starter_start_available_with_workers():
+    """Test that start_available prepares cases concurrently and submits them one at a time."""
+    # GIVEN a Store with three cases, of which one is not ready and one fails to configure
+    mock_store: TypedMock[Store] = create_typed_mock(Store)
+    case_ids: list[str] = ["ready_case", "not_ready_case", "failing_case"]
+    mock_store.as_mock.get_cases_to_analyze.return_value = [
+        create_autospec(Case, internal_id=case_id) for case_id in case_ids
+    ]
+    mock_store.as_mock.get_case_by_internal_id_strict.return_value = create_autospec(
+        Case, data_analysis=Workflow.RAREDISEASE
+    )
+
+    # GIVEN an input fetcher and a configurator failing for some cases
+    input_fetcher: FastqFetcher = create_autospec(FastqFetcher)
+
+    def ensure_files_are_ready(case_id: str) -> None:
+        if case_id == "not_ready_case":
+            raise AnalysisNotReadyError("Files not ready")
+
+    input_fetcher.ensure_files_are_ready.side_effect = ensure_files_are_ready
+    configurator: NextflowConfigurator = create_autospec(NextflowConfigurator)
+
+    def configure(case_id: str) -> NextflowCaseConfig:
+        if case_id == "failing_case":
+            raise ValueError("Gene panel could not be created")
+        return create_autospec(NextflowCaseConfig, case_id=case_id)
+
+    configurator.configure.side_effect = configure
+
+    # GIVEN an analysis starter
+    submitter: Submitter = create_autospec(Submitter)
+    analysis_starter = AnalysisStarter(
+        configurator=configurator,
+        input_fetcher=input_fetcher,
+        store=mock_store.as_type,
+        submitter=submitter,
+        tracker=create_autospec(NextflowTracker),
+        workflow=Workflow.RAREDISEASE,
+    )
+
+    # WHEN starting all available cases with several workers
+    succeeded: bool = analysis_starter.start_available(max_workers=3)
+
+    # THEN all cases are prepared
+    assert configurator.configure.call_count == 2
+
+    # THEN only the ready case is submitted
+    submitter.submit.assert_called_once()
+    assert submitter.submit.call_args.args[0].case_id == "ready_case"
+
+    # THEN the start is reported as failed because of the configuration error
+    assert not succeeded
+
+
 def test_rnafusion_start(
     cg_context: CGConfig,
     http_workflow_launch_response: Response,
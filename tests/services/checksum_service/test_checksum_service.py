@@ -0,0 +1,98 @@
+import hashlib
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from cg.constants import FileExtensions
+from cg.services.checksum_service import checksum_service
+from cg.services.checksum_service.checksum_service import ChecksumService
+from cg.services.checksum_service.models import FileDigest
+from cg.services.checksum_service.utils import calculate_file_digest
+
+
+def test_calculate_file_digest(fastq_file: Path):
+    """Test that the md5 and sha1 checksums are calculated in one pass."""
+    # GIVEN a fastq file
+
+    # WHEN calculating the digest
+    digest: FileDigest = calculate_file_digest(fastq_file)
+
+    # THEN the md5 and sha1 checksums match those calculated by hashlib
+    content: bytes = fastq_file.read_bytes()
+    assert digest.md5 == hashlib.md5(content).hexdigest()
+    assert digest.sha1 == hashlib.sha1(content).hexdigest()
+
+    # THEN the size is recorded
+    assert digest.size == len(content)
+
+
+def test_get_digests_uses_cache(fastq_file: Path, tmp_path: Path, mocker: MockerFixture):
+    """Test that digests of unchanged files are read from the cache."""
+    # GIVEN a checksum service that has digested a file
+    cache_path = Path(tmp_path, f"checksums{FileExtensions.JSON}")
+    ChecksumService(cache_path=cache_path, max_workers=1).get_digests([fastq_file])
+    assert cache_path.exists()
+
+    # WHEN getting the digest of the file again with a new service
+    process_pool = mocker.spy(checksum_service, "ProcessPoolExecutor")
+    digests: dict[Path, FileDigest] = ChecksumService(cache_path=cache_path).get_digests(
+        [fastq_file]
+    )
+
+    # THEN the file is not reread
+    process_pool.assert_not_called()
+
+    # THEN the cached digest is returned
+    assert digests[fastq_file].md5 == hashlib.md5(fastq_file.read_bytes()).hexdigest()
+
+
+def test_get_digests_recalculated_on_change(tmp_path: Path):
+    """Test that a changed file is digested again."""
+    # GIVEN a file that has been digested
+    file_path = Path(tmp_path, "reads.fastq.gz")
+    file_path.write_bytes(b"original")
+    service = ChecksumService(max_workers=1)
+    service.get_digests([file_path])
+
+    # WHEN the file content changes and it is digested again
+    file_path.write_bytes(b"changed content")
+    digests: dict[Path, FileDigest] = service.get_digests([file_path])
+
+    # THEN the new checksum is returned
+    assert digests[file_path].md5 == hashlib.md5(b"changed content").hexdigest()
+
+
+def test_get_files_with_incorrect_md5sum(
+    fastq_file: Path, fastq_file_father: Path, non_existing_file_path: Path
+):
+    """Test that files not matching their md5 file are returned."""
+    # GIVEN a file with a correct md5 file, one with an incorrect md5 file and a missing file
+
+    # WHEN checking the md5sums
+    incorrect_files: list[Path] = ChecksumService().get_files_with_incorrect_md5sum(
+        [fastq_file, fastq_file_father, non_existing_file_path]
+    )
+
+    # THEN the file with an incorrect md5 file and the missing file are returned
+    assert incorrect_files == [fastq_file_father, non_existing_file_path]
+
+
+def test_get_digests_with_truncated_cache(fastq_file: Path, tmp_path: Path):
+    """Test that a truncated cache is ignored and replaced."""
+    # GIVEN a cache file that was truncated during a write
+    cache_path = Path(tmp_path, f"checksums{FileExtensions.JSON}")
+    cache_path.write_text('{"some/file.fastq.gz": {"md5": "a')
+
+    # WHEN getting the digest of a file
+    digests: dict[Path, FileDigest] = ChecksumService(
+        cache_path=cache_path, max_workers=1
+    ).get_digests([fastq_file])
+
+    # THEN the digest is calculated
+    assert digests[fastq_file].md5 == hashlib.md5(fastq_file.read_bytes()).hexdigest()
+
+    # THEN the cache is replaced with a readable cache containing the file
+    assert fastq_file.as_posix() in ChecksumService(cache_path=cache_path).cache
+
+    # THEN no temporary cache file is left behind
+    assert list(tmp_path.iterdir()) == [cache_path]
@@ -14,9 +14,11 @@ from cg.constants import EXIT_FAIL, SequencingRunDataAvailability
 from cg.exc import (
     DsmcAlreadyRunningError,
     IlluminaRunAlreadyBackedUpError,
+    IlluminaRunDecryptionError,
     IlluminaRunEncryptionError,
     PdcError,
 )
+from cg.meta.encryption.encryption import EncryptionAPI
 from cg.meta.tar.tar import TarAPI
 from cg.models.cg_config import (
     CGConfig,
@@ -25,6 +27,7 @@ from cg.models.cg_config import (
     PDCArchivingDirectory,
     RunInstruments,
 )
+from cg.models.run_devices.illumina_run_directory_data import IlluminaRunDirectoryData
 from cg.services.illumina.backup import backup_service
 from cg.services.illumina.backup.backup_service import IlluminaBackupService
 from cg.services.illumina.backup.encrypt_service import IlluminaRunEncryptionService
@@ -482,6 +485,162 @@ def test_fetch_sequencing_run_integration_current(
     )
 
 
+def test_fetch_sequencing_run_stream_extraction(
+    dsmc_q_archive_output: list[str],
+    mocker: MockerFixture,
+):
+    """Test fetching a sequencing run with streaming extraction."""
+
+    # GIVEN a store with a requested sequencing run
+    status_db: Store = create_autospec(Store)
+    sequencing_run: IlluminaSequencingRun = create_autospec(
+        IlluminaSequencingRun, data_availability=SequencingRunDataAvailability.REQUESTED
+    )
+
+    # GIVEN a backup service that streams the decrypted run into extraction
+    encryption_api: TypedMock[EncryptionAPI] = create_typed_mock(EncryptionAPI)
+    tar_api: TypedMock[TarAPI] = create_typed_mock(TarAPI)
+    pdc_service: TypedMock[PdcService] = create_typed_mock(PdcService)
+    backup_api = IlluminaBackupService(
+        encryption_api=encryption_api.as_type,
+        pdc_archiving_directory=create_autospec(
+            PDCArchivingDirectory, current="/home/proj/production/encrypt"
+        ),
+        status_db=status_db,
+        tar_api=tar_api.as_type,
+        pdc_service=pdc_service.as_type,
+        sequencing_runs_dir="some_dir",
+        stream_extraction=True,
+        pigz_binary_path="pigz",
+    )
+    mocker.patch.object(IlluminaBackupService, "unlink_files")
+    mocker.patch.object(IlluminaBackupService, "create_rta_complete")
+    mocker.patch.object(IlluminaBackupService, "create_copy_complete")
+    mocker.patch.object(
+        IlluminaBackupService, "query_pdc_for_sequencing_run", return_value=dsmc_q_archive_output
+    )
+    mocker.patch.object(
+        backup_service,
+        "get_latest_archived_sequencing_run_path",
+        return_value=Path("/home/proj/production/encrypt/flow_cell_name.tar.gz.gpg"),
+    )
+    mocker.patch.object(
+        backup_service,
+        "get_latest_archived_encryption_key_path",
+        return_value=Path("/home/proj/production/encrypt/flow_cell_name.key.gpg"),
+    )
+    stream_mock = mocker.patch.object(backup_service, "decrypt_and_extract")
+
+    # WHEN fetching the sequencing run from PDC
+    result = backup_api.fetch_sequencing_run(sequencing_run=sequencing_run)
+
+    # THEN the elapsed time of the retrieval process is returned
+    assert result and result > 0
+
+    # THEN the key, the md5sum file and the run are retrieved one after the other
+    retrieval_calls = pdc_service.as_mock.retrieve_file_from_pdc.call_args_list
+    assert [call.kwargs["file_path"] for call in retrieval_calls] == [
+        "/home/proj/production/encrypt/flow_cell_name.key.gpg",
+        "/home/proj/production/encrypt/flow_cell_name.tar.gz.md5sum",
+        "/home/proj/production/encrypt/flow_cell_name.tar.gz.gpg",
+    ]
+
+    # THEN the sequencing run is set as retrieved
+    status_db.update_illumina_sequencing_run_data_availability.assert_called_with(
+        sequencing_run=sequencing_run, data_availability=SequencingRunDataAvailability.RETRIEVED
+    )
+
+    # THEN the decrypted run is streamed into extraction instead of written to disk
+    stream_mock.assert_called_once()
+    encryption_api.as_mock.get_symmetric_decryption_command.assert_not_called()
+    tar_api.as_mock.get_extract_file_command.assert_not_called()
+    tar_api.as_mock.get_extract_stream_command.assert_called_once_with(
+        output_dir=Path("some_dir"), is_current=True, decompression_program="pigz"
+    )
+
+
+def test_retrieve_archived_md5sum_not_archived(caplog, tmp_path: Path):
+    """Test retrieving the md5sum file of a run backed up without one."""
+    caplog.set_level(logging.WARNING)
+
+    # GIVEN a backup service where the md5sum file is not archived at PDC
+    pdc_service: TypedMock[PdcService] = create_typed_mock(PdcService)
+    pdc_service.as_mock.retrieve_file_from_pdc.side_effect = PdcError("File not found")
+    backup_api = IlluminaBackupService(
+        encryption_api=mock.Mock(),
+        pdc_archiving_directory=mock.Mock(),
+        status_db=mock.Mock(),
+        tar_api=mock.Mock(),
+        pdc_service=pdc_service.as_type,
+        sequencing_runs_dir=tmp_path.as_posix(),
+    )
+
+    # WHEN retrieving the md5sum file
+    backup_api.retrieve_archived_md5sum(archived_run=Path("run.tar.gz.gpg"), run_dir=tmp_path)
+
+    # THEN the retrieval continues without validating the run
+    pdc_service.as_mock.retrieve_file_from_pdc.assert_called_once_with(
+        file_path="run.tar.gz.md5sum", target_path=Path(tmp_path, "run.tar.gz.md5sum").as_posix()
+    )
+    assert "skipping validation" in caplog.text
+
+
+def test_fetch_sequencing_run_md5sum_mismatch(
+    dsmc_q_archive_output: list[str], mocker: MockerFixture, tmp_path: Path
+):
+    """Test that a streamed run not matching its md5sum is removed after extraction."""
+
+    # GIVEN a store with a requested sequencing run
+    status_db: Store = create_autospec(Store)
+    sequencing_run: IlluminaSequencingRun = create_autospec(
+        IlluminaSequencingRun, data_availability=SequencingRunDataAvailability.REQUESTED
+    )
+
+    # GIVEN a backup service that streams the decrypted run into extraction
+    backup_api = IlluminaBackupService(
+        encryption_api=create_typed_mock(EncryptionAPI).as_type,
+        pdc_archiving_directory=create_autospec(
+            PDCArchivingDirectory, current="/home/proj/production/encrypt"
+        ),
+        status_db=status_db,
+        tar_api=create_typed_mock(TarAPI).as_type,
+        pdc_service=create_typed_mock(PdcService).as_type,
+        sequencing_runs_dir=tmp_path.as_posix(),
+        stream_extraction=True,
+    )
+    mocker.patch.object(
+        IlluminaBackupService, "query_pdc_for_sequencing_run", return_value=dsmc_q_archive_output
+    )
+    mocker.patch.object(
+        backup_service,
+        "get_latest_archived_sequencing_run_path",
+        return_value=Path("/home/proj/production/encrypt/flow_cell_name/run.tar.gz.gpg"),
+    )
+    mocker.patch.object(backup_service, "get_latest_archived_encryption_key_path")
+
+    # GIVEN that the extracted run does not match the archived md5sum
+    extracted_run = Path(tmp_path, "flow_cell_name")
+    extracted_run.mkdir()
+
+    def extract_invalid_run(**kwargs):
+        Path(extracted_run, "RunInfo.xml").touch()
+        raise IlluminaRunDecryptionError("md5sum mismatch")
+
+    mocker.patch.object(backup_service, "decrypt_and_extract", side_effect=extract_invalid_run)
+
+    # WHEN fetching the sequencing run from PDC
+    with pytest.raises(IlluminaRunDecryptionError):
+        backup_api.fetch_sequencing_run(sequencing_run=sequencing_run)
+
+    # THEN the extracted run is removed
+    assert not extracted_run.exists()
+
+    # THEN the sequencing run is set as requested
+    status_db.update_illumina_sequencing_run_data_availability.assert_called_with(
+        sequencing_run=sequencing_run, data_availability=SequencingRunDataAvailability.REQUESTED
+    )
+
+
 def test_validate_is_sequencing_run_backup_possible(
     base_store: Store,
     caplog,
@@ -750,3 +909,42 @@ def test_backup_illumina_run_when_unable_to_archive(
                 store=base_store,
                 sequencing_run=sequencing_run,
             )
+
+
+def test_start_run_encryptions(mocker: MockerFixture):
+    """Test starting encryption of several sequencing runs concurrently."""
+
+    # GIVEN a backup service
+    backup_api = IlluminaBackupService(
+        encryption_api=mock.Mock(),
+        pdc_archiving_directory=mock.Mock(),
+        status_db=mock.Mock(),
+        tar_api=mock.Mock(),
+        pdc_service=mock.Mock(),
+        sequencing_runs_dir="some_dir",
+        dry_run=True,
+    )
+
+    # GIVEN two runs where encryption can only be started for one
+    runs_dir_data: list[IlluminaRunDirectoryData] = [
+        create_autospec(IlluminaRunDirectoryData, id=run_id) for run_id in ["started", "failed"]
+    ]
+
+    def start_encryption(self: IlluminaRunEncryptionService) -> None:
+        if self.run_dir_data.id == "failed":
+            raise IlluminaRunEncryptionError("Encryption already started")
+
+    mocker.patch.object(IlluminaRunEncryptionService, "start_encryption", start_encryption)
+
+    # WHEN starting encryption of the runs
+    started_run_ids: list[str] = backup_api.start_run_encryptions(
+        runs_dir_data=runs_dir_data,
+        binary_path="gpg",
+        encryption_dir=Path("encryption_dir"),
+        pigz_binary_path="pigz",
+        sbatch_parameter={},
+        max_workers=2,
+    )
+
+    # THEN only the run without errors is reported as started
+    assert started_run_ids == ["started"]
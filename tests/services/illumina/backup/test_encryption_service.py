@@ -10,6 +10,7 @@ from cg.constants.demultiplexing import DemultiplexingDirsAndFiles
 from cg.exc import FlowCellError, IlluminaRunEncryptionError
 from cg.models.run_devices.illumina_run_directory_data import IlluminaRunDirectoryData
 from cg.services.illumina.backup.encrypt_service import IlluminaRunEncryptionService
+from cg.services.illumina.backup.models import RunEncryptionCommands
 
 
 def test_illumina_run_encryption_service(
@@ -216,13 +217,44 @@ def test_start_encryption(
     assert f"Run encryption running as job {sbatch_job_number}" in caplog.text
 
 
-def test_copy_run_dir_to_tmp_excludes_analysis(
+def test_get_archive_run_dir_command(
     illumina_run_encryption_service: IlluminaRunEncryptionService,
 ):
     # GIVEN an IlluminaRunEncryptionService
 
-    # WHEN generating the copy command
-    command: str = illumina_run_encryption_service.copy_run_dir_to_tmp()
+    # WHEN generating the archive command
+    command: str = illumina_run_encryption_service.get_archive_run_dir_command()
 
     # THEN the command should exclude the Analysis directory
     assert f"--exclude={DemultiplexingDirsAndFiles.ONBOARD_ANALYSIS}" in command
+
+    # THEN the run directory is archived in place
+    run_dir: Path = illumina_run_encryption_service.run_dir_data.path
+    assert command.endswith(f"-C {run_dir.parent.as_posix()} {run_dir.name}")
+
+    # THEN the archive members are placed under the same directory as when runs were copied
+    member_dir: str = illumina_run_encryption_service.run_archive_member_dir.as_posix()
+    assert f"--transform=s,^,{member_dir.lstrip('/')}/,S" in command
+
+
+def test_get_encryption_commands(
+    illumina_run_encryption_service: IlluminaRunEncryptionService,
+):
+    # GIVEN an IlluminaRunEncryptionService
+
+    # WHEN getting the commands of the encryption stages
+    commands: RunEncryptionCommands = illumina_run_encryption_service.get_encryption_commands()
+
+    # THEN the run is not copied
+    all_commands: str = " ".join(commands.model_dump().values())
+    assert "rsync" not in all_commands
+
+    # THEN the md5sum of the archive is computed while encrypting
+    assert illumina_run_encryption_service.encrypted_md5sum_file_path.as_posix() in commands.tee
+
+    # THEN the encrypted archive is decrypted and its md5sum compared with the recorded one
+    assert "--decrypt" in commands.run_symmetric_decryption
+    assert commands.diff == (
+        f"diff -q {illumina_run_encryption_service.encrypted_md5sum_file_path} "
+        f"{illumina_run_encryption_service.decrypted_md5sum_file_path}"
+    )
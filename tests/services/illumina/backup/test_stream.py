@@ -0,0 +1,102 @@
+"""Tests for the streaming decryption and extraction of Illumina run archives."""
+
+import hashlib
+import subprocess
+import sys
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from cg.exc import IlluminaRunDecryptionError
+from cg.services.illumina.backup.models import StreamExtractionResult
+from cg.services.illumina.backup.stream import decrypt_and_extract
+
+
+@pytest.fixture
+def run_archive(tmp_path: Path) -> Path:
+    """Return a gzipped tar archive of a run directory."""
+    run_dir = Path(tmp_path, "run", "flow_cell_name")
+    run_dir.mkdir(parents=True)
+    Path(run_dir, "RunInfo.xml").write_text("<RunInfo/>")
+    archive = Path(tmp_path, "flow_cell_name.tar.gz")
+    with tarfile.open(archive, "w:gz") as tar:
+        tar.add(run_dir, arcname="flow_cell_name")
+    return archive
+
+
+def test_decrypt_and_extract(run_archive: Path, tmp_path: Path):
+    """Test streaming a decrypted archive into extraction."""
+    # GIVEN a decryption command writing an archive to stdout and an extraction command
+    output_dir = Path(tmp_path, "output")
+    output_dir.mkdir()
+    expected_md5sum: str = hashlib.md5(run_archive.read_bytes()).hexdigest()
+
+    # WHEN streaming the decrypted archive into the extraction
+    result: StreamExtractionResult = decrypt_and_extract(
+        decryption_command=["cat", run_archive.as_posix()],
+        extraction_command=["tar", "-x", "-z", "-f", "-", "-C", output_dir.as_posix()],
+        expected_md5sum=expected_md5sum,
+        chunk_size=16,
+    )
+
+    # THEN the run directory is extracted
+    assert Path(output_dir, "flow_cell_name", "RunInfo.xml").read_text() == "<RunInfo/>"
+
+    # THEN the md5sum and size of the decrypted archive are returned
+    assert result.md5sum == expected_md5sum
+    assert result.bytes == run_archive.stat().st_size
+
+    # THEN the throughput of each stage is reported
+    assert [stage.stage for stage in result.stages] == ["decrypt", "checksum", "extract"]
+
+
+def test_decrypt_and_extract_md5sum_mismatch(run_archive: Path, tmp_path: Path):
+    """Test streaming a decrypted archive that does not match its md5sum."""
+    # GIVEN an expected md5sum that does not match the archive
+
+    # WHEN streaming the decrypted archive into the extraction
+    with pytest.raises(IlluminaRunDecryptionError):
+        decrypt_and_extract(
+            decryption_command=["cat", run_archive.as_posix()],
+            extraction_command=["tar", "-x", "-z", "-f", "-", "-C", tmp_path.as_posix()],
+            expected_md5sum="not_the_md5sum",
+        )
+
+    # THEN an error is raised
+
+
+def test_decrypt_and_extract_decryption_fails(tmp_path: Path):
+    """Test streaming when the decryption command fails."""
+    # GIVEN a decryption command that fails
+
+    # WHEN streaming the decrypted archive into the extraction
+    with pytest.raises(subprocess.CalledProcessError) as error:
+        decrypt_and_extract(
+            decryption_command=[sys.executable, "-c", "import sys; sys.exit('bad key')"],
+            extraction_command=["tar", "-x", "-z", "-f", "-", "-C", tmp_path.as_posix()],
+        )
+
+    # THEN the error of the decryption is raised
+    assert error.value.cmd[0] == sys.executable
+    assert "bad key" in error.value.stderr
+
+
+def test_decrypt_and_extract_extraction_fails(tmp_path: Path):
+    """Test streaming when the extraction stops before the end of the stream."""
+    # GIVEN an extraction command that exits without reading its input
+    decryption_command: list[str] = [
+        sys.executable,
+        "-c",
+        "import sys; sys.stdout.buffer.write(b'x' * 10_000_000)",
+    ]
+
+    # WHEN streaming the decrypted archive into the extraction
+    with pytest.raises(subprocess.CalledProcessError) as error:
+        decrypt_and_extract(
+            decryption_command=decryption_command,
+            extraction_command=[sys.executable, "-c", "import sys; sys.exit(2)"],
+        )
+
+    # THEN the error of the extraction is raised
+    assert error.value.returncode == 2
@@ -26,6 +26,7 @@ from cg.services.illumina.post_processing.utils import (
     get_undetermined_fastqs,
     is_sample_negative_control_with_reads_in_lane,
 )
+from cg.utils.run_directory_index import RunDirectoryIndex
 
 
 @pytest.mark.parametrize(
@@ -181,6 +182,36 @@ def test_get_sample_fastqs_from_flow_cell(
         assert fastq.name.endswith(".fastq.gz")
 
 
+@pytest.mark.parametrize(
+    "demux_run_path_fixture, sample_internal_id",
+    [
+        ("tmp_demultiplexed_novaseq_6000_post_1_5_kits_path", "ACC12642A7"),
+        ("novaseq_x_demux_runs_dir", "ACC13169A1"),
+    ],
+    ids=["demuxed_on_dragen", "demuxed_on_sequencer"],
+)
+def test_get_sample_fastqs_from_flow_cell_with_index(
+    demux_run_path_fixture: str, sample_internal_id: str, request: FixtureRequest
+):
+    # GIVEN a demultiplexed run path, an index of it and a sample internal id
+    demux_run_path: Path = request.getfixturevalue(demux_run_path_fixture)
+    run_directory_index = RunDirectoryIndex(demux_run_path)
+
+    # WHEN getting the sample fastq files from the index
+    sample_fastqs: list[Path] = get_sample_fastqs_from_flow_cell(
+        demultiplexed_run_path=demux_run_path,
+        sample_internal_id=sample_internal_id,
+        run_directory_index=run_directory_index,
+    )
+
+    # THEN the same files as when globbing the directory are returned
+    assert sorted(sample_fastqs) == sorted(
+        get_sample_fastqs_from_flow_cell(
+            demultiplexed_run_path=demux_run_path, sample_internal_id=sample_internal_id
+        )
+    )
+
+
 def test_add_flow_cell_name_to_fastq_file_path(
     tmp_path: Path,
     novaseq_6000_post_1_5_kits_fastq_file_names: list[str],
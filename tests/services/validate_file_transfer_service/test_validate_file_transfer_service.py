@@ -49,21 +49,21 @@ def test_get_file_names_from_content(
         assert file_name in expected_file_names_in_manifest
 
 
-def test_is_file_in_directory(
+def test_are_all_files_present(
     validate_file_transfer_service: ValidateFileTransferService,
     transfer_source_dir: Path,
     expected_file_names_in_manifest: list[str],
 ):
-    """Test the is file in directory method."""
+    """Test that all files in the manifest are found in the directory tree."""
     # GIVEN a source directory and a list of file names
-    for file_name in expected_file_names_in_manifest:
-        # WHEN checking if the file is in the directory
-        is_file_in_directory: bool = validate_file_transfer_service._is_file_in_directory_tree(
-            file_name=file_name, source_dir=transfer_source_dir
-        )
 
-        # THEN assert that the file is in the directory
-        assert is_file_in_directory
+    # WHEN checking if the files are in the directory tree
+    are_all_files_present: bool = validate_file_transfer_service._are_all_files_present(
+        files_to_validate=expected_file_names_in_manifest, source_dir=transfer_source_dir
+    )
+
+    # THEN assert that all files are in the directory tree
+    assert are_all_files_present
 
 
 def test_validate_by_manifest_file(
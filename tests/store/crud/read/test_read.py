@@ -1,4 +1,5 @@
 import logging
+from datetime import datetime, timedelta
 
 import pytest
 from sqlalchemy.exc import MultipleResultsFound
@@ -329,6 +330,44 @@ def test_analyses_to_upload_when_filtering_with_missing_workflow(helpers, sample
     assert len(records) == 0
 
 
+def test_get_latest_analyses_to_upload(helpers: StoreHelpers, sample_store: Store):
+    """Test getting the latest analysis of each case that is ready to upload."""
+    # GIVEN a case with an old analysis and a newer analysis that has not been uploaded
+    now = datetime.now()
+    case = helpers.add_case(store=sample_store, name="case_to_upload")
+    helpers.add_analysis(
+        store=sample_store,
+        case=case,
+        completed_at=now - timedelta(days=1),
+        workflow=Workflow.MIP_DNA,
+    )
+    latest_analysis: Analysis = helpers.add_analysis(
+        store=sample_store, case=case, completed_at=now, workflow=Workflow.MIP_DNA
+    )
+
+    # GIVEN a case whose latest analysis has started uploading
+    started_case = helpers.add_case(store=sample_store, name="upload_started")
+    helpers.add_analysis(
+        store=sample_store,
+        case=started_case,
+        completed_at=now - timedelta(days=1),
+        workflow=Workflow.MIP_DNA,
+    )
+    helpers.add_analysis(
+        store=sample_store,
+        case=started_case,
+        completed_at=now,
+        uploading=True,
+        workflow=Workflow.MIP_DNA,
+    )
+
+    # WHEN getting the latest analyses to upload
+    analyses: list[Analysis] = sample_store.get_latest_analyses_to_upload(workflow=Workflow.MIP_DNA)
+
+    # THEN only the latest analysis of the case that has not started uploading is returned
+    assert analyses == [latest_analysis]
+
+
 def test_get_applications(microbial_store: Store, expected_number_of_applications):
     """Test function to return the applications."""
 
@@ -1184,6 +1223,37 @@ def test_get_illumina_metrics_entry_by_device_sample_and_lane(
     assert metrics.flow_cell_lane == lane
 
 
+def test_get_illumina_lane_read_counts_by_sample_internal_ids(
+    store_with_illumina_sequencing_data: Store,
+    novaseq_x_flow_cell_id: str,
+    selected_novaseq_x_sample_ids: list[str],
+):
+    """Test that lane read counts are returned for all lanes of the given samples."""
+    # GIVEN a store with Illumina Sample Sequencing Metrics for each sample in the run directories
+
+    # GIVEN a sample id and a lane
+    sample_id: str = selected_novaseq_x_sample_ids[0]
+    lane: int = 1
+
+    # WHEN fetching the lane read counts for the sample
+    read_counts: dict[tuple[str, str, int], int | None] = (
+        store_with_illumina_sequencing_data.get_illumina_lane_read_counts_by_sample_internal_ids(
+            sample_internal_ids=[sample_id]
+        )
+    )
+
+    # THEN the read count of the lane is the same as in the metrics entry
+    metrics: IlluminaSampleSequencingMetrics = (
+        store_with_illumina_sequencing_data.get_illumina_metrics_entry_by_device_sample_and_lane(
+            device_internal_id=novaseq_x_flow_cell_id, sample_internal_id=sample_id, lane=lane
+        )
+    )
+    assert read_counts[(novaseq_x_flow_cell_id, sample_id, lane)] == metrics.total_reads_in_lane
+
+    # THEN only read counts for the given sample are returned
+    assert {key[1] for key in read_counts} == {sample_id}
+
+
 def test_get_illumina_sequencing_run_by_device_internal_id(
     store_with_illumina_sequencing_data: Store,
     novaseq_x_flow_cell_id: str,
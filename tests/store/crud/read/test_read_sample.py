@@ -18,7 +18,7 @@ from cg.server.dto.samples.requests import (
     SortDirection,
     UnhandledSamplesSortBy,
 )
-from cg.store.models import Case, CaseSample, Customer, Invoice, OrderTypeApplication, Sample
+from cg.store.models import Case, CaseSample, Customer, Invoice, OrderTypeApplication, Pool, Sample
 from cg.store.store import Store
 from tests.store_helpers import StoreHelpers
 
@@ -69,6 +69,27 @@ def test_get_all_pools_and_samples_for_invoice_by_invoice_id(store: Store, helpe
     assert sample in records
 
 
+def test_get_pools_and_samples_with_applications_by_invoice_id(store: Store, helpers: StoreHelpers):
+    """Test that the pools and samples of an invoice can be fetched with their applications."""
+
+    # GIVEN an invoice with a pool and a sample
+    pool = helpers.ensure_pool(store=store, name="pool_1")
+    sample = helpers.add_sample(store=store, name="sample_1")
+    invoice: Invoice = helpers.ensure_invoice(store=store, pools=[pool], samples=[sample])
+
+    # WHEN fetching the pools and the samples of the invoice
+    pools: list[Pool] = store.get_pools_with_applications_by_invoice_id(invoice.id)
+    samples: list[Sample] = store.get_samples_with_applications_by_invoice_id(invoice.id)
+
+    # THEN the pool and the sample of the invoice are returned
+    assert pools == [pool]
+    assert samples == [sample]
+
+    # THEN their applications are loaded
+    assert pools[0].application_version.application
+    assert samples[0].application_version.application
+
+
 def test_get_samples_by_customer_and_subject_id_query(
     store_with_samples_subject_id_and_tumour_status: Store,
     cust123: str,
@@ -165,6 +186,55 @@ def test_get_sample_by_name(store_with_samples_that_have_names: Store, name="tes
     assert samples and samples.name == name
 
 
+def test_get_samples_by_names(store_with_samples_that_have_names: Store):
+    """Test that samples can be fetched by several names at once."""
+    # GIVEN a database with samples that have names
+
+    # WHEN fetching samples by names, including a name that does not exist
+    samples_by_name: dict[str, Sample] = store_with_samples_that_have_names.get_samples_by_names(
+        names=["test_sample_1", "test_sample_3", "non_existing_name"]
+    )
+
+    # THEN the samples with existing names are returned keyed by name
+    assert list(samples_by_name) == ["test_sample_1", "test_sample_3"]
+    assert all(sample.name == name for name, sample in samples_by_name.items())
+
+
+def test_get_samples_with_applications_by_internal_ids(
+    store_with_samples_that_have_names: Store,
+):
+    """Test that samples can be fetched with their applications by several internal ids."""
+    # GIVEN a database with samples
+
+    # WHEN fetching samples by internal ids, including an internal id that does not exist
+    samples: dict[str, Sample] = (
+        store_with_samples_that_have_names.get_samples_with_applications_by_internal_ids(
+            internal_ids=["test_sample_1", "test_sample_2", "non_existing_id"], chunk_size=1
+        )
+    )
+
+    # THEN the existing samples are returned keyed by internal id
+    assert set(samples) == {"test_sample_1", "test_sample_2"}
+
+    # THEN the applications of the samples are loaded
+    assert all(sample.application_version.application for sample in samples.values())
+
+
+def test_get_samples_with_applications_by_case_id(store: Store, helpers: StoreHelpers):
+    """Test that the samples of a case can be fetched with their applications."""
+    # GIVEN a case with two samples
+    case: Case = helpers.add_case(store)
+    samples: list[Sample] = [helpers.add_sample(store, internal_id=f"sample_{i}") for i in range(2)]
+    for sample in samples:
+        helpers.relate_samples(base_store=store, case=case, samples=[sample])
+
+    # WHEN fetching the samples of the case
+    case_samples: list[Sample] = store.get_samples_with_applications_by_case_id(case.internal_id)
+
+    # THEN the samples are returned in the order they were linked to the case
+    assert case_samples == samples
+
+
 def test_get_samples_by_customer_and_name(
     store_with_samples_that_have_names: Store,
     name: str = "test_sample_1",
@@ -1615,3 +1685,35 @@ def test_get_compressible_samples_ensure_right_order(store: Store, helpers: Stor
 
     # THEN the oldest sample is in the beginning of the list
     assert compressible_samples == [old_sample, new_sample]
+
+
+def test_get_compressible_samples_by_internal_ids_in_chunks(store: Store, helpers: StoreHelpers):
+    """Test that the order of compressible samples is kept when ids are queried in chunks."""
+    # GIVEN three compressible samples created at different times in a compressible case
+    case: Case = helpers.add_case(
+        store=store,
+        internal_id="chunked_case",
+        is_compressible=True,
+        action=CaseActions.HOLD,
+        name="chunked_case",
+    )
+    samples: list[Sample] = []
+    for days_ago in [1, 3, 2]:
+        sample: Sample = helpers.add_sample(store=store, internal_id=f"sample_{days_ago}")
+        sample.created_at = datetime.now() - timedelta(days=days_ago)
+        helpers.add_relationship(store=store, case=case, sample=sample)
+        samples.append(sample)
+
+    # WHEN getting the compressible samples querying one id at a time
+    compressible_samples: list[Sample] = store.get_compressible_samples_by_internal_ids(
+        internal_ids=[sample.internal_id for sample in samples],
+        case_created_before_date=datetime.now() + timedelta(1),
+        chunk_size=1,
+    )
+
+    # THEN all samples are returned with the oldest first
+    assert [sample.internal_id for sample in compressible_samples] == [
+        "sample_3",
+        "sample_2",
+        "sample_1",
+    ]
@@ -7,11 +7,13 @@ from cg.store.filters.status_analysis_filters import (
     filter_analyses_completed_before,
     filter_analyses_not_cleaned,
     filter_analyses_started_before,
+    filter_analyses_upload_not_started,
     filter_analyses_with_delivery_report,
     filter_analyses_with_workflow,
     filter_analyses_without_delivery_report,
     filter_analysis_by_entry_id,
     filter_completed_analyses,
+    filter_latest_completed_analyses_per_case,
     filter_not_uploaded_analyses,
     filter_report_analyses_by_workflow,
     filter_uploaded_analyses,
@@ -128,6 +130,61 @@ def test_filter_not_uploaded_analyses(base_store: Store, helpers: StoreHelpers):
     assert not_uploaded_analysis in analyses
 
 
+def test_filter_analyses_upload_not_started(
+    base_store: Store, helpers: StoreHelpers, timestamp_now: datetime
+):
+    """Test filtering of analyses that have not started uploading."""
+
+    # GIVEN an analysis that has started uploading and one that has not
+    started_analysis: Analysis = helpers.add_analysis(
+        store=base_store, uploading=True, upload_started=timestamp_now
+    )
+    case = helpers.add_case(store=base_store, name="case2")
+    not_started_analysis: Analysis = helpers.add_analysis(store=base_store, case=case)
+
+    # WHEN filtering the analyses on upload not started
+    analyses: Query = filter_analyses_upload_not_started(
+        analyses=base_store._get_query(table=Analysis)
+    )
+
+    # THEN only the analysis that has not started uploading should be returned
+    assert not_started_analysis in analyses.all()
+    assert started_analysis not in analyses.all()
+
+
+def test_filter_latest_completed_analyses_per_case(
+    base_store: Store, helpers: StoreHelpers, timestamp_now: datetime
+):
+    """Test filtering of the latest completed analysis of each case."""
+
+    # GIVEN a case with an old and a new completed analysis and a not completed analysis
+    case: Case = helpers.add_case(store=base_store, name="case1")
+    old_analysis: Analysis = helpers.add_analysis(
+        store=base_store, case=case, completed_at=timestamp_now - timedelta(days=1)
+    )
+    new_analysis: Analysis = helpers.add_analysis(
+        store=base_store, case=case, completed_at=timestamp_now
+    )
+    running_analysis: Analysis = helpers.add_analysis(store=base_store, case=case)
+
+    # GIVEN another case with a completed analysis
+    other_case: Case = helpers.add_case(store=base_store, name="case2")
+    other_analysis: Analysis = helpers.add_analysis(
+        store=base_store, case=other_case, completed_at=timestamp_now - timedelta(days=2)
+    )
+
+    # WHEN filtering the latest completed analyses
+    analyses: Query = filter_latest_completed_analyses_per_case(
+        analyses=base_store._get_query(table=Analysis)
+    )
+
+    # THEN the latest completed analysis of each case should be returned
+    assert new_analysis in analyses.all()
+    assert other_analysis in analyses.all()
+    assert old_analysis not in analyses.all()
+    assert running_analysis not in analyses.all()
+
+
 def test_filter_analyses_with_delivery_report(
     base_store: Store, helpers: StoreHelpers, timestamp_now: datetime
 ):
@@ -0,0 +1,64 @@
+from cg.store.models import Case
+from cg.store.profiler import SqlProfile, get_statement_fingerprint, profile_sql
+from cg.store.store import Store
+from tests.store_helpers import StoreHelpers
+
+
+def test_get_statement_fingerprint():
+    # GIVEN two statements differing only in their values and number of parameters
+    statement = "SELECT sample.id FROM sample WHERE sample.id IN (?, ?, ?) AND name = 'a'"
+    other_statement = "SELECT sample.id  FROM sample\nWHERE sample.id IN (?) AND name = 'b' "
+
+    # WHEN fingerprinting the statements
+    fingerprint: str = get_statement_fingerprint(statement)
+
+    # THEN they share a fingerprint
+    assert fingerprint == get_statement_fingerprint(other_statement)
+    assert fingerprint == "SELECT sample.id FROM sample WHERE sample.id IN (?) AND name = ?"
+
+
+def test_profile_sql_flags_lazy_loads(store: Store, helpers: StoreHelpers):
+    # GIVEN a case with more samples than the N+1 threshold, none of them loaded in the session
+    helpers.add_case_with_samples(base_store=store, case_id="lazy_case", nr_samples=13)
+    store.session.expunge_all()
+
+    # WHEN lazily loading the sample of each link of the case while profiling
+    with profile_sql(name="lazy loop", n_plus_one_threshold=10) as profile:
+        case: Case = store.get_case_by_internal_id("lazy_case")
+        sample_ids: list[str] = [link.sample.internal_id for link in case.links]
+
+    # THEN all statements are counted
+    assert len(sample_ids) == 12
+    assert profile.statement_count >= 14
+
+    # THEN the select of each sample is flagged as a likely N+1 query
+    suspects = profile.get_n_plus_one_suspects()
+    assert len(suspects) == 1
+    assert suspects[0].count == 12
+    assert "FROM sample" in suspects[0].fingerprint
+
+
+def test_profile_sql_ignores_statements_outside_the_profile(store: Store, helpers: StoreHelpers):
+    # GIVEN a finished profile
+    with profile_sql(name="finished") as profile:
+        pass
+
+    # WHEN executing statements after the profile has finished
+    helpers.add_case_with_samples(base_store=store, case_id="case", nr_samples=2)
+    store.get_case_by_internal_id("case")
+
+    # THEN nothing is recorded in the profile
+    assert profile.statement_count == 0
+
+
+def test_sql_profile_summary():
+    # GIVEN a profile with a statement repeated up to the threshold
+    profile = SqlProfile(name="summary", n_plus_one_threshold=2)
+    profile.record(statement="SELECT * FROM sample WHERE id = 1", seconds=0.001)
+    profile.record(statement="SELECT * FROM sample WHERE id = 2", seconds=0.001)
+
+    # WHEN getting the summary
+    summary: str = profile.get_summary()
+
+    # THEN it contains the number of statements, the time and the N+1 suspects
+    assert summary == "statements=2;time_ms=2.0;shapes=1;n_plus_one=1"
@@ -2,11 +2,14 @@
 Tests for command module
 """
 
+import time
 from subprocess import CalledProcessError
 
 import pytest
 
+from cg.constants.process import EXIT_FAIL, EXIT_SUCCESS
 from cg.utils import Process
+from cg.utils.commands import ProcessCall, ProcessResult, run_processes
 
 
 def test_process():
@@ -96,3 +99,118 @@ def test_iter_stderr_lines_no_output(ls_process):
     for i, line in enumerate(process.stderr_lines(), 1):
         assert line == ""
     assert i == 1
+
+
+def test_run_command_streaming():
+    # GIVEN a process printing many lines
+    process = Process(binary="seq")
+
+    # WHEN running the command in streaming mode
+    lines: list[str] = list(process.run_command_streaming(parameters=["1", "100000"]))
+
+    # THEN all lines are yielded
+    assert len(lines) == 100000
+    assert lines[-1] == "100000"
+
+    # THEN the output is not kept on the process
+    assert process.stdout == ""
+
+
+def test_run_command_streaming_stops_process():
+    # GIVEN a process printing lines without end
+    process = Process(binary="yes")
+
+    # WHEN reading the first lines of the output and stopping
+    lines = process.run_command_streaming()
+    first_lines: list[str] = [next(lines) for _ in range(10)]
+    lines.close()
+
+    # THEN the lines are yielded while the process runs
+    assert first_lines == ["y"] * 10
+
+
+def test_run_command_streaming_dry_run():
+    # GIVEN a process that would fail
+    process = Process(binary="false")
+
+    # WHEN running the command in streaming mode as a dry run
+    lines: list[str] = list(process.run_command_streaming(dry_run=True))
+
+    # THEN nothing is yielded
+    assert not lines
+
+
+def test_run_command_streaming_invalid_command(ls_process):
+    # GIVEN a process with 'ls' as binary
+
+    # WHEN running the command in streaming mode with invalid parameters
+    with pytest.raises(CalledProcessError):
+        # THEN an exception is raised
+        list(ls_process.run_command_streaming(parameters=["-kffd4"]))
+
+    # THEN stderr was captured
+    assert ls_process.stderr
+
+
+def test_run_processes():
+    # GIVEN process calls sleeping
+    sleep_process = Process(binary="sleep")
+    process_calls: list[ProcessCall] = [ProcessCall(sleep_process, ["0.5"]) for _ in range(4)]
+
+    # WHEN running the calls concurrently
+    start: float = time.perf_counter()
+    results: list[ProcessResult] = run_processes(process_calls=process_calls, max_workers=4)
+    elapsed_time: float = time.perf_counter() - start
+
+    # THEN all calls succeed
+    assert all(result.return_code == EXIT_SUCCESS for result in results)
+
+    # THEN the calls run at the same time
+    assert elapsed_time < 1.5
+
+
+def test_run_processes_collects_outputs():
+    # GIVEN process calls printing their parameters
+    echo_process = Process(binary="echo")
+    process_calls: list[ProcessCall] = [
+        ProcessCall(echo_process, [str(number)]) for number in range(5)
+    ]
+
+    # WHEN running the calls concurrently
+    results: list[ProcessResult] = run_processes(process_calls=process_calls, max_workers=2)
+
+    # THEN the outputs are returned in the order of the calls
+    assert [result.stdout for result in results] == ["0", "1", "2", "3", "4"]
+
+
+def test_run_processes_with_failure():
+    # GIVEN a succeeding and a failing process call
+    process_calls: list[ProcessCall] = [
+        ProcessCall(Process(binary="true")),
+        ProcessCall(Process(binary="false")),
+    ]
+
+    # WHEN running the calls concurrently
+    with pytest.raises(CalledProcessError) as error:
+        # THEN an exception is raised
+        run_processes(process_calls=process_calls)
+
+    # THEN the failed command is reported
+    assert error.value.cmd == ["false"]
+
+    # WHEN running the calls without checking the return codes
+    results: list[ProcessResult] = run_processes(process_calls=process_calls, check=False)
+
+    # THEN the return codes are collected
+    assert [result.return_code for result in results] == [EXIT_SUCCESS, EXIT_FAIL]
+
+
+def test_run_processes_dry_run():
+    # GIVEN a failing process call
+    process_calls: list[ProcessCall] = [ProcessCall(Process(binary="false"))]
+
+    # WHEN running the calls as a dry run
+    results: list[ProcessResult] = run_processes(process_calls=process_calls, dry_run=True)
+
+    # THEN the call is not executed
+    assert results[0].return_code == EXIT_SUCCESS
@@ -1,9 +1,13 @@
+import errno
+import os
 from pathlib import Path
 
 import pytest
+from pytest_mock import MockerFixture
 
 from cg.constants import FileExtensions
 from cg.utils.files import (
+    concatenate_files,
     get_directories_in_path,
     get_file_in_directory,
     get_file_with_pattern_from_list,
@@ -196,3 +200,44 @@ def test_remove_directory_and_contents(path_with_directories_and_a_file: Path, s
     # THEN the directory and its contents should no longer exist
     assert not path_with_directories_and_a_file.exists()
     assert not Path(path_with_directories_and_a_file, some_file).exists()
+
+
+def test_concatenate_files(tmp_path: Path):
+    """Test that files are concatenated in the given order."""
+    # GIVEN a number of files with content
+    input_files: list[Path] = []
+    for index, content in enumerate([b"first\n", b"second\n", b"third\n"]):
+        input_file = Path(tmp_path, f"input_{index}")
+        input_file.write_bytes(content)
+        input_files.append(input_file)
+    output_file = Path(tmp_path, "output")
+
+    # WHEN concatenating the files
+    written_bytes: int = concatenate_files(input_files=input_files, output_file=output_file)
+
+    # THEN the output contains the content of all files in order
+    assert output_file.read_bytes() == b"first\nsecond\nthird\n"
+
+    # THEN the number of written bytes is returned
+    assert written_bytes == output_file.stat().st_size
+
+
+def test_concatenate_files_without_kernel_copy(tmp_path: Path, mocker: MockerFixture):
+    """Test that files are concatenated when kernel-side copying is not supported."""
+    # GIVEN a file system where kernel-side copying is not supported
+    unsupported = OSError(errno.EXDEV, "Invalid cross-device link")
+    mocker.patch.object(os, "copy_file_range", side_effect=unsupported, create=True)
+    mocker.patch.object(os, "sendfile", side_effect=unsupported, create=True)
+
+    # GIVEN files with content
+    input_files: list[Path] = [Path(tmp_path, "input_1"), Path(tmp_path, "input_2")]
+    input_files[0].write_bytes(b"first\n")
+    input_files[1].write_bytes(b"second\n")
+    output_file = Path(tmp_path, "output")
+
+    # WHEN concatenating the files
+    written_bytes: int = concatenate_files(input_files=input_files, output_file=output_file)
+
+    # THEN the files are concatenated through user space
+    assert output_file.read_bytes() == b"first\nsecond\n"
+    assert written_bytes == len(b"first\nsecond\n")
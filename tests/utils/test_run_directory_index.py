@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+
+from cg.utils.run_directory_index import RunDirectoryIndex
+
+
+@pytest.fixture
+def run_directory(tmp_path: Path) -> Path:
+    """Return a run directory with fastq files in the root and in a subdirectory."""
+    for relative_path in [
+        "ACC1_S1_L001_R1_001.fastq.gz",
+        "ACC1_S1_L001_R2_001.fastq.gz",
+        "ACC12_S2_L001_R1_001.fastq.gz",
+        "Undetermined_S0_L001_R1_001.fastq.gz",
+        "Reports/Demultiplex_Stats.csv",
+        "BCLConvert/fastq/ACC1_S1_L002_R1_001.fastq.gz",
+    ]:
+        file_path = Path(tmp_path, relative_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.touch()
+    return tmp_path
+
+
+def test_get_file(run_directory: Path):
+    # GIVEN an index of a run directory
+    index = RunDirectoryIndex(run_directory)
+
+    # WHEN getting a file in a subdirectory by name
+    file_path: Path = index.get_file("Demultiplex_Stats.csv")
+
+    # THEN the file is returned
+    assert file_path == Path(run_directory, "Reports", "Demultiplex_Stats.csv")
+
+
+def test_get_file_missing(run_directory: Path):
+    # GIVEN an index of a run directory
+    index = RunDirectoryIndex(run_directory)
+
+    # WHEN getting a file that does not exist
+
+    # THEN a FileNotFoundError is raised
+    with pytest.raises(FileNotFoundError):
+        index.get_file("missing.csv")
+
+
+def test_glob_does_not_cross_directories(run_directory: Path):
+    # GIVEN an index of a run directory
+    index = RunDirectoryIndex(run_directory)
+
+    # WHEN globbing for fastq files in the root directory
+    file_paths: list[Path] = index.glob("ACC1_S*.fastq.gz")
+
+    # THEN the same files as with Path.glob are returned
+    assert sorted(file_paths) == sorted(run_directory.glob("ACC1_S*.fastq.gz"))
+    assert len(file_paths) == 2
+
+
+def test_get_files_with_name_prefix(run_directory: Path):
+    # GIVEN an index of a run directory
+    index = RunDirectoryIndex(run_directory)
+
+    # WHEN getting the files of a sample by name prefix
+    file_paths: list[Path] = index.get_files_with_name_prefix(prefix="ACC1", separator="_S")
+
+    # THEN only the files of that sample are returned, including those in subdirectories
+    assert {file_path.name for file_path in file_paths} == {
+        "ACC1_S1_L001_R1_001.fastq.gz",
+        "ACC1_S1_L001_R2_001.fastq.gz",
+        "ACC1_S1_L002_R1_001.fastq.gz",
+    }
+
+
+def test_index_missing_directory(tmp_path: Path):
+    # GIVEN a directory that does not exist
+    directory = Path(tmp_path, "missing")
+
+    # WHEN indexing it
+
+    # THEN a FileNotFoundError is raised
+    with pytest.raises(FileNotFoundError):
+        RunDirectoryIndex(directory)
@@ -3,7 +3,7 @@
 import pytest
 
 from cg.cli.utils import is_case_name_allowed
-from cg.utils.utils import get_hamming_distance
+from cg.utils.utils import get_chunks, get_hamming_distance
 
 
 def test_get_hamming_distance():
@@ -49,3 +49,14 @@ def test_get_hamming_distance_different_lengths():
 )
 def test_is_case_name_valid(case_name: str, expected_behaviour: bool):
     assert is_case_name_allowed(case_name) == expected_behaviour
+
+
+def test_get_chunks():
+    """Test that items are split into consecutive chunks of at most the given size."""
+    # GIVEN five items
+
+    # WHEN splitting them into chunks of two
+    chunks: list[list[int]] = list(get_chunks(items=[1, 2, 3, 4, 5], chunk_size=2))
+
+    # THEN the chunks keep the order of the items and the last chunk holds the rest
+    assert chunks == [[1, 2], [3, 4], [5]]